@@ -7,6 +7,7 @@ from .auth.authorization import (
     AuthorizationFailedError,
     IDKSession,
 )
+from .caching import CachePolicy, ResponseCache, cache_max_age
 from .models import (
     air_conditioning,
     charging,
@@ -19,7 +20,9 @@ from .models import (
 )
 from .mqtt import MySkodaMqttClient
 from .myskoda import TRACE_CONFIG, MySkoda
+from .rate_limit import RateLimit, RateLimiter
 from .rest_api import RestApi
+from .retry import CircuitOpenError, RetryHandler, RetryPolicy
 from .vehicle import Vehicle
 
 __all__ = [
@@ -27,13 +30,21 @@ __all__ = [
     "Authorization",
     "AuthorizationError",
     "AuthorizationFailedError",
+    "CachePolicy",
+    "CircuitOpenError",
     "IDKSession",
     "MySkoda",
     "MySkodaMqttClient",
+    "RateLimit",
+    "RateLimiter",
+    "ResponseCache",
     "RestApi",
+    "RetryHandler",
+    "RetryPolicy",
     "Vehicle",
     "__version__",
     "air_conditioning",
+    "cache_max_age",
     "charging",
     "common",
     "health",
@@ -1,13 +1,17 @@
 """Handles authorization to the MySkoda API."""
 
+import asyncio
 import base64
 import hashlib
 import logging
+import random
+import time
 from abc import ABC, abstractmethod
 from asyncio import Lock
 from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
 from dataclasses import dataclass, field
-from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
 from urllib.parse import parse_qsl, urlparse
 
 import jwt
@@ -17,12 +21,22 @@ from mashumaro.mixins.orjson import DataClassORJSONMixin
 
 from myskoda.auth.csrf_parser import CSRFParser, CSRFState
 from myskoda.auth.utils import generate_nonce
-from myskoda.const import BASE_URL_IDENT, MAX_RETRIES
+from myskoda.const import (
+    BASE_URL_IDENT,
+    MAX_RETRIES,
+    TOKEN_EXPIRY_MARGIN_IN_SECONDS,
+    TOKEN_REFRESH_JITTER_IN_SECONDS,
+    TOKEN_REFRESH_LEAD_IN_SECONDS,
+    TOKEN_REFRESH_MIN_INTERVAL_IN_SECONDS,
+)
+
+if TYPE_CHECKING:
+    from myskoda.auth.token_store import TokenStore
 
 _LOGGER = logging.getLogger(__name__)
 
-
-refresh_token_lock = Lock()
+_TOKEN_EXPIRY_CACHE_SIZE = 4
+_REFRESH_TOKEN_EXPIRY_MARGIN_IN_SECONDS = 60
 
 
 @dataclass
@@ -47,6 +61,10 @@ class Authorization(ABC):
     session: ClientSession
     testsuite: bool
     idk_session: IDKSession | None = None
+    _refresh_lock: Lock
+    _refresher_task: asyncio.Task[None] | None = None
+    token_store: "TokenStore | None" = None
+    token_store_key: str = "default"  # noqa: S105 - not a secret
 
     def __init__(
         self,
@@ -57,6 +75,9 @@ class Authorization(ABC):
         self.session = session
         self.generate_nonce = generate_nonce
         self.testsuite = testsuite
+        # Only refreshes of the same account need to wait for each other.
+        self._refresh_lock = Lock()
+        self._token_expiries: dict[str, float] = {}
 
     def _extract_csrf(self, html: str) -> CSRFState:
         parser = CSRFParser()
@@ -118,6 +139,8 @@ class Authorization(ABC):
         if self.idk_session is None:
             raise AuthorizationFailedError
 
+        await self._store_session()
+
     async def authorize_refresh_token(self, refresh_token: str) -> None:
         """Authorize by exchanging an existing OpenID refresh token.
 
@@ -132,7 +155,7 @@ class Authorization(ABC):
             _LOGGER.error(log_str)
             raise TokenExpiredError
 
-        async with refresh_token_lock:
+        async with self._refresh_lock:
             response = await self.session.post(
                 f"{self.base_url}/api/v1/authentication/refresh-token?tokenType=CONNECT",
                 json={"token": refresh_token},
@@ -146,6 +169,8 @@ class Authorization(ABC):
                 _LOGGER.exception("Failed to parse tokens from refresh endpoint.")
                 raise AuthorizationFailedError from ex
 
+        await self._store_session()
+
     async def _initial_oidc_authorize(self, verifier: str) -> CSRFState:
         """First step of the login process.
 
@@ -307,31 +332,103 @@ class Authorization(ABC):
         if not self.idk_session:
             raise NotAuthorizedError
 
-        meta = jwt.decode(self.idk_session.access_token, options={"verify_signature": False})
-        expiry = datetime.fromtimestamp(float(meta.get("exp", "0")), tz=UTC)
-        return datetime.now(tz=UTC) + timedelta(minutes=10) > expiry
+        expiry = self._token_expiry(self.idk_session.access_token)
+        return time.time() + TOKEN_EXPIRY_MARGIN_IN_SECONDS > expiry
 
     def is_refresh_token_expired(self, refresh_token: str | None = None) -> bool:
         """Check whether the refresh token is expired."""
-        if refresh_token:
-            meta = jwt.decode(refresh_token, options={"verify_signature": False})
+        if not refresh_token:
+            if not self.idk_session:
+                raise NotAuthorizedError
+            refresh_token = self.idk_session.refresh_token
 
-        elif not self.idk_session:
-            raise NotAuthorizedError
-        else:
-            meta = jwt.decode(self.idk_session.refresh_token, options={"verify_signature": False})
+        return time.time() + _REFRESH_TOKEN_EXPIRY_MARGIN_IN_SECONDS > self._token_expiry(
+            refresh_token
+        )
 
-        expiry = datetime.fromtimestamp(float(meta.get("exp", "0")), tz=UTC)
-        return datetime.now(tz=UTC) + timedelta(minutes=1) > expiry
+    def _token_expiry(self, token: str) -> float:
+        """Return the expiry of a JWT as a POSIX timestamp.
 
-    async def _perform_refresh_token(self) -> bool:
+        Checked on every request, so the token is only decoded the first time it is seen.
+        """
+        expiry = self._token_expiries.get(token)
+        if expiry is None:
+            meta = jwt.decode(token, options={"verify_signature": False})
+            expiry = float(meta.get("exp", "0"))
+            # Only the current access and refresh token are of interest.
+            if len(self._token_expiries) >= _TOKEN_EXPIRY_CACHE_SIZE:
+                self._token_expiries.clear()
+            self._token_expiries[token] = expiry
+        return expiry
+
+    async def restore_session(self) -> bool:
+        """Restore the session saved in `token_store`, if it can still be refreshed.
+
+        Returns whether a session was restored. The access token is refreshed right away if it
+        expired while the session was stored.
+        """
+        if self.token_store is None:
+            return False
+        idk_session = await self.token_store.load(self.token_store_key)
+        if idk_session is None:
+            return False
+        if self.is_refresh_token_expired(idk_session.refresh_token):
+            _LOGGER.info("Stored session has expired, logging in again.")
+            await self.token_store.clear(self.token_store_key)
+            return False
+
+        self.idk_session = idk_session
+        if self.is_token_expired():
+            async with self._refresh_lock, self._refreshing():
+                if await self._adopt_stored_session() and not self.is_token_expired():
+                    return True
+                if not await self._perform_refresh_token():
+                    self.idk_session = None
+                    return False
+                await self._store_session()
+        return True
+
+    def _refreshing(self) -> AbstractAsyncContextManager[object]:
+        if self.token_store is None:
+            return nullcontext()
+        return self.token_store.refreshing(self.token_store_key)
+
+    async def _adopt_stored_session(self) -> bool:
+        """Take over the stored session if it was refreshed elsewhere, e.g. by another process.
+
+        Returns whether the stored session replaced `idk_session`.
+        """
+        if self.token_store is None or self.idk_session is None:
+            return False
+        try:
+            stored = await self.token_store.load(self.token_store_key)
+        except Exception:
+            _LOGGER.exception("Failed to load session from the token store.")
+            return False
+        if stored is None or self._token_expiry(stored.access_token) <= self._token_expiry(
+            self.idk_session.access_token
+        ):
+            return False
+        _LOGGER.debug("Using the session refreshed elsewhere.")
+        self.idk_session = stored
+        return True
+
+    async def _store_session(self) -> None:
+        if self.token_store is None or self.idk_session is None:
+            return
+        try:
+            await self.token_store.save(self.token_store_key, self.idk_session)
+        except Exception:
+            _LOGGER.exception("Failed to save session to the token store.")
+
+    async def _perform_refresh_token(self, force: bool = False) -> bool:
         if not self.client_id or not self.redirect_uri or not self.base_url:
             raise BrandError
 
         if not self.idk_session:
             raise NotAuthorizedError
 
-        if not self.is_token_expired():
+        if not force and not self.is_token_expired():
             return True
 
         async with self.session.post(
@@ -348,32 +445,81 @@ class Authorization(ABC):
             else:
                 return True
 
-    async def refresh_token(self) -> None:
+    async def refresh_token(self, force: bool = False) -> None:
         """Refresh the authorization token.
 
-        This will consume the `refresh_token` and exchange it for a new set of tokens.
+        This will consume the `refresh_token` and exchange it for a new set of tokens. Unless
+        force is set, nothing happens while the access token is still valid, e.g. because a
+        concurrent caller refreshed it already. A session in `token_store` which was refreshed
+        elsewhere in the meantime is used instead of refreshing again.
         """
-        async with refresh_token_lock:
-            for attempt in range(MAX_RETRIES):
-                if await self._perform_refresh_token():
-                    return
-                _LOGGER.warning(
-                    "Retrying failed request to refresh token (%d/%d). Retrying...",
-                    attempt,
-                    MAX_RETRIES,
-                )
-
-            _LOGGER.error("Refreshing token failed after %d attempts.", MAX_RETRIES)
-            _LOGGER.info("Trying to recover by logging in again...")
+        async with self._refresh_lock:
+            if not force and not self.is_token_expired():
+                return
+            async with self._refreshing():
+                await self._refresh_token_exclusively(force)
+
+    async def _refresh_token_exclusively(self, force: bool) -> None:
+        if await self._adopt_stored_session() and not self.is_token_expired():
+            return
+        for attempt in range(MAX_RETRIES):
+            if await self._perform_refresh_token(force=force):
+                await self._store_session()
+                return
+            _LOGGER.warning(
+                "Retrying failed request to refresh token (%d/%d). Retrying...",
+                attempt,
+                MAX_RETRIES,
+            )
+
+        _LOGGER.error("Refreshing token failed after %d attempts.", MAX_RETRIES)
+        _LOGGER.info("Trying to recover by logging in again...")
+
+        try:
+            idk_session = await self._get_idk_session()
+        except Exception:
+            _LOGGER.exception("Failed to login.")
+        else:
+            self.idk_session = idk_session
+            _LOGGER.info("Successfully recovered by logging in.")
+            await self._store_session()
+            return
+
+    def start_token_refresher(self) -> None:
+        """Renew the tokens in the background before the access token expires.
+
+        Keeps `get_access_token` from refreshing inline on the request path. The renewal time
+        is randomized a little, so many accounts in one process don't refresh all at once.
+        """
+        if self._refresher_task is None or self._refresher_task.done():
+            self._refresher_task = asyncio.create_task(self._refresh_in_background())
+
+    async def stop_token_refresher(self) -> None:
+        """Stop renewing the tokens in the background."""
+        if self._refresher_task is None:
+            return
+        self._refresher_task.cancel()
+        self._refresher_task = None
 
+    def _seconds_until_background_refresh(self) -> float:
+        if not self.idk_session:
+            raise NotAuthorizedError
+        expiry = self._token_expiry(self.idk_session.access_token)
+        lead = TOKEN_REFRESH_LEAD_IN_SECONDS + random.uniform(  # noqa: S311 - not for security
+            0, TOKEN_REFRESH_JITTER_IN_SECONDS
+        )
+        delay = expiry - time.time() - lead
+        return max(delay, TOKEN_REFRESH_MIN_INTERVAL_IN_SECONDS)
+
+    async def _refresh_in_background(self) -> None:
+        while self.idk_session is not None:
+            delay = self._seconds_until_background_refresh()
+            _LOGGER.debug("Next background token refresh in %.0f seconds", delay)
+            await asyncio.sleep(delay)
             try:
-                idk_session = await self._get_idk_session()
+                await self.refresh_token(force=True)
             except Exception:
-                _LOGGER.exception("Failed to login.")
-            else:
-                self.idk_session = idk_session
-                _LOGGER.info("Successfully recovered by logging in.")
-                return
+                _LOGGER.exception("Background token refresh failed.")
 
     async def get_access_token(self) -> str:
         """Get the access token.
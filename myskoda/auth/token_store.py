@@ -0,0 +1,205 @@
+"""Persist IDK sessions, so restarting doesn't require logging in again."""
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, contextmanager, nullcontext
+from pathlib import Path
+
+from .authorization import IDKSession
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_TOKEN_STORE_KEY = "default"  # noqa: S105 - not a secret
+
+# How often to check whether a lock held by another process has been released.
+_LOCK_POLL_INTERVAL_IN_SECONDS = 0.05
+
+
+def _session_to_dict(session: IDKSession) -> dict[str, str]:
+    # Use the same keys as the API, which `IDKSession.from_dict` expects.
+    return {
+        "accessToken": session.access_token,
+        "refreshToken": session.refresh_token,
+        "idToken": session.id_token,
+    }
+
+
+class TokenStore(ABC):
+    """Storage for the IDK sessions of one or more accounts.
+
+    Sessions are stored by key, usually the email address of the account.
+    """
+
+    @abstractmethod
+    async def load(self, key: str) -> IDKSession | None:
+        """Return the stored session for key, if any."""
+
+    @abstractmethod
+    async def save(self, key: str, session: IDKSession) -> None:
+        """Store the session for key, replacing any previous one."""
+
+    @abstractmethod
+    async def clear(self, key: str) -> None:
+        """Remove the stored session for key."""
+
+    def refreshing(self, key: str) -> AbstractAsyncContextManager[object]:  # noqa: ARG002
+        """Hold while refreshing the session for key, so other holders don't refresh it too.
+
+        Stores which can be shared between processes lock across them. Within one process,
+        refreshes are already serialized, so this does nothing by default.
+        """
+        return nullcontext()
+
+
+class MemoryTokenStore(TokenStore):
+    """Keeps sessions for the lifetime of the process only."""
+
+    def __init__(self) -> None:
+        self._sessions: dict[str, IDKSession] = {}
+
+    async def load(self, key: str) -> IDKSession | None:
+        """Return the stored session for key, if any."""
+        return self._sessions.get(key)
+
+    async def save(self, key: str, session: IDKSession) -> None:
+        """Store the session for key, replacing any previous one."""
+        self._sessions[key] = session
+
+    async def clear(self, key: str) -> None:
+        """Remove the stored session for key."""
+        self._sessions.pop(key, None)
+
+
+class JsonFile:
+    """A JSON object in a file which can be shared between processes.
+
+    Writes go to a temporary file which then replaces the file atomically, so readers never
+    see a partially written file. Read-modify-write cycles hold an exclusive lock on a
+    `.lock` file next to it (where supported), so concurrent processes don't lose each other's
+    updates. All methods block, run them in a thread from async code.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path).expanduser()
+        self._lock_path = self.path.with_name(f"{self.path.name}.lock")
+
+    def get(self, key: str) -> dict | None:
+        """Return the value stored for key, if any."""
+        with self._locked(exclusive=False):
+            return self._read().get(key)
+
+    def set(self, key: str, value: dict | None) -> None:
+        """Store value for key, or remove key if value is None."""
+        with self._locked(exclusive=True):
+            values = self._read()
+            if value is None:
+                values.pop(key, None)
+            else:
+                values[key] = value
+            self._write(values)
+
+    @contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[None]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if fcntl is None:
+            yield
+            return
+        with self._lock_path.open("a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @asynccontextmanager
+    async def hold(self, name: str) -> AsyncIterator[None]:
+        """Hold an exclusive lock called name across processes, e.g. while renewing a value.
+
+        It is separate from the lock of reads and writes, so the file can be read and written
+        while holding it. Waits for other holders without blocking the event loop.
+        """
+        lock_path = self.path.with_name(f"{self.path.name}.{name}.lock")
+        await asyncio.to_thread(self.path.parent.mkdir, parents=True, exist_ok=True)
+        if fcntl is None:
+            yield
+            return
+        with lock_path.open("a") as lock_file:
+            while True:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    await asyncio.sleep(_LOCK_POLL_INTERVAL_IN_SECONDS)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self) -> dict[str, dict]:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            _LOGGER.warning("Ignoring unreadable file %s", self.path)
+            return {}
+
+    def _write(self, values: dict[str, dict]) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                json.dump(values, tmp_file)
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+            Path(tmp_path).replace(self.path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+
+class FileTokenStore(TokenStore):
+    """Stores sessions in a `JsonFile`, which can be shared between processes."""
+
+    def __init__(self, path: str | Path) -> None:
+        self._file = JsonFile(path)
+
+    @property
+    def path(self) -> Path:
+        """Return the path of the file holding the sessions."""
+        return self._file.path
+
+    async def load(self, key: str) -> IDKSession | None:
+        """Return the stored session for key, if any."""
+        raw = await asyncio.to_thread(self._file.get, key)
+        if raw is None:
+            return None
+        try:
+            return IDKSession.from_dict(raw)
+        except Exception:
+            _LOGGER.exception("Ignoring invalid stored session for %s", key)
+            return None
+
+    async def save(self, key: str, session: IDKSession) -> None:
+        """Store the session for key, replacing any previous one."""
+        await asyncio.to_thread(self._file.set, key, _session_to_dict(session))
+
+    async def clear(self, key: str) -> None:
+        """Remove the stored session for key."""
+        await asyncio.to_thread(self._file.set, key, None)
+
+    def refreshing(self, key: str) -> AbstractAsyncContextManager[object]:  # noqa: ARG002
+        """Hold while refreshing the session for key, so other processes don't refresh it too.
+
+        One lock covers all keys, as refreshes are rare.
+        """
+        return self._file.hold("refresh")
@@ -0,0 +1,311 @@
+"""Helpers to avoid sending the same request to the MySkoda API more than needed."""
+
+import asyncio
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Collection, Hashable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import cached_property
+from urllib.parse import parse_qs, parse_qsl, urlencode, urlsplit
+
+from .const import CACHE_MAX_ENTRIES
+from .endpoints import ENDPOINTS
+from .rate_limit import vin_from_url
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters for a `SingleFlight`.
+
+    `misses` counts calls which started a new upstream call, `hits` counts calls which joined
+    one already in flight.
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+
+class SingleFlight[T]:
+    """Share one in-flight call between all concurrent callers using the same key.
+
+    The shared call runs in its own task, so a cancelled caller does not cancel it for the
+    other callers.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Task[T]] = {}
+        self.stats = SingleFlightStats()
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of calls currently in flight."""
+        return len(self._calls)
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Await func(), or the call already in flight for key."""
+        task = self._calls.get(key)
+        if task is None:
+            self.stats.misses += 1
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.stats.hits += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task[T]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved in case every caller was cancelled meanwhile.
+        if not task.cancelled():
+            task.exception()
+
+
+class Generations:
+    """Counts invalidations per vehicle.
+
+    Work started before an invalidation, such as a request in flight, compares the generation
+    it started under with the current one to tell whether its result is outdated.
+    """
+
+    def __init__(self) -> None:
+        self._all = 0
+        self._by_vin: dict[str, int] = {}
+
+    def current(self, vin: str | None) -> tuple[int, int]:
+        """Return the generation of vin, or of data which doesn't belong to a vehicle."""
+        return self._all, self._by_vin.get(vin, 0) if vin is not None else 0
+
+    def bump(self, vin: str | None = None) -> None:
+        """Start a new generation for vin, or for everything if vin is None."""
+        if vin is None:
+            self._all += 1
+        else:
+            self._by_vin[vin] = self._by_vin.get(vin, 0) + 1
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """How long responses of a single endpoint may be served from the cache.
+
+    `path` is the API path of the endpoint without query string, with `{vin}` as placeholder for
+    the VIN. Volatile endpoints reflect the live state of the vehicle and are dropped whenever
+    the vehicle reports a change, the others only expire by age. `ignored_params` are query
+    parameters which don't change the response, such as the time of the request, and are left
+    out of the cache key.
+    """
+
+    name: str
+    path: str
+    ttl: float
+    volatile: bool = True
+    ignored_params: frozenset[str] = frozenset()
+
+    def match(self, url: str) -> re.Match[str] | None:
+        """Match url against the path of this policy."""
+        return self._pattern.fullmatch(url.split("?", 1)[0])
+
+    def key(self, url: str) -> str:
+        """Return the cache key of url, which is url without the ignored query parameters."""
+        if not self.ignored_params or "?" not in url:
+            return url
+        path, query = url.split("?", 1)
+        kept = [
+            (name, value)
+            for name, value in parse_qsl(query, keep_blank_values=True)
+            if name not in self.ignored_params
+        ]
+        return f"{path}?{urlencode(kept)}" if kept else path
+
+    @cached_property
+    def _pattern(self) -> re.Pattern[str]:
+        return re.compile(re.escape(self.path).replace(r"\{vin\}", r"(?P<vin>[^/]+)"))
+
+
+DEFAULT_CACHE_POLICIES = tuple(
+    CachePolicy(
+        endpoint.name,
+        endpoint.base_path,
+        endpoint.cache_ttl,
+        endpoint.volatile,
+        endpoint.cache_ignored_params,
+    )
+    for endpoint in ENDPOINTS.values()
+    if endpoint.cache_ttl is not None
+)
+
+
+@dataclass
+class ResponseCacheStats:
+    """Counters for a `ResponseCache`.
+
+    `evictions` counts entries dropped to stay within the size limit, `invalidations` counts
+    entries dropped by `ResponseCache.invalidate`.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A response body served from a `ResponseCache`, and when it was fetched from the API."""
+
+    body: bytes
+    fetched_at: datetime
+
+
+@dataclass
+class _CacheEntry:
+    policy: CachePolicy
+    vin: str | None
+    response: CachedResponse
+    stored_at: float
+
+
+class ResponseCache:
+    """Size bounded cache of raw GET responses with a time to live per endpoint.
+
+    Only endpoints with a matching `CachePolicy` are cached. When the cache is full, the least
+    recently used entry is evicted.
+    """
+
+    def __init__(
+        self,
+        policies: Iterable[CachePolicy] = DEFAULT_CACHE_POLICIES,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            msg = "max_entries must be at least 1"
+            raise ValueError(msg)
+        self._policies = tuple(policies)
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._generations = Generations()
+        self.stats = ResponseCacheStats()
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._entries)
+
+    def policy_for(self, url: str) -> tuple[CachePolicy, str | None] | None:
+        """Return the policy for url and the VIN it refers to, if any."""
+        for policy in self._policies:
+            if match := policy.match(url):
+                vin = match.groupdict().get("vin")
+                if vin is None:
+                    vin = next(iter(parse_qs(urlsplit(url).query).get("vin", [])), None)
+                return policy, vin
+        return None
+
+    def get(self, url: str, max_age: float | None = None) -> CachedResponse | None:
+        """Return the cached response for url if it is younger than its TTL and max_age."""
+        key = self._key(url)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        limit = entry.policy.ttl if max_age is None else min(entry.policy.ttl, max_age)
+        # A max_age of 0 misses even if the clock hasn't moved since the entry was stored.
+        if self._clock() - entry.stored_at >= limit:
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry.response
+
+    def generation(self, url: str) -> Hashable:
+        """Return the current generation of url, to pass to `put` once its response arrives."""
+        found = self.policy_for(url)
+        return self._generations.current(found[1] if found is not None else None)
+
+    def put(
+        self,
+        url: str,
+        body: bytes,
+        fetched_at: datetime | None = None,
+        generation: Hashable | None = None,
+    ) -> None:
+        """Store body for url if the endpoint is cacheable, fetched now unless told otherwise.
+
+        With the `generation` taken before sending the request, a response which was in flight
+        while its entry was invalidated is not stored.
+        """
+        if (found := self.policy_for(url)) is None:
+            return
+        policy, vin = found
+        if generation is not None and generation != self._generations.current(vin):
+            return
+        key = policy.key(url)
+        response = CachedResponse(body, fetched_at or datetime.now(UTC))
+        self._entries[key] = _CacheEntry(policy, vin, response, self._clock())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _key(self, url: str) -> str:
+        found = self.policy_for(url)
+        return found[0].key(url) if found is not None else url
+
+    def invalidate(self, vin: str | None = None, names: Collection[str] | None = None) -> int:
+        """Drop cached responses and return how many were dropped.
+
+        Without arguments everything is dropped. With a vin only entries of that vehicle are
+        dropped: those of the given endpoint names, or all volatile ones if no names are given.
+        Responses in flight for the dropped entries won't be stored, see `generation`.
+        """
+        self._generations.bump(vin)
+        if vin is None and names is None:
+            stale = list(self._entries)
+        else:
+            stale = [
+                url
+                for url, entry in self._entries.items()
+                if (vin is None or entry.vin == vin)
+                and (entry.policy.name in names if names is not None else entry.policy.volatile)
+            ]
+        for url in stale:
+            del self._entries[url]
+        self.stats.invalidations += len(stale)
+        return len(stale)
+
+    def invalidate_url(self, url: str) -> int:
+        """Drop the volatile entries of every vehicle whose VIN is part of url.
+
+        Used after a write request, which likely changed the state of that vehicle.
+        """
+        if (vin := vin_from_url(url)) is not None:
+            # Also covers responses in flight for a vehicle without cached entries yet.
+            self._generations.bump(vin)
+        vins = {entry.vin for entry in self._entries.values() if entry.vin and entry.vin in url}
+        return sum(self.invalidate(vin) for vin in vins)
+
+
+_max_age: ContextVar[float | None] = ContextVar("max_age", default=None)
+
+
+@contextmanager
+def cache_max_age(seconds: float) -> Iterator[None]:
+    """Only accept cached responses younger than seconds for requests made within this block.
+
+    Use `cache_max_age(0)` to bypass the cache, the fresh responses are still stored.
+    """
+    token = _max_age.set(seconds)
+    try:
+        yield
+    finally:
+        _max_age.reset(token)
+
+
+def current_max_age() -> float | None:
+    """Return the max age requested by the innermost `cache_max_age` block, if any."""
+    return _max_age.get()
@@ -22,6 +22,10 @@ FIREBASE_GMS_VERSION = "260000000"
 FIREBASE_PROJECT_ID = "678067506455"
 FIREBASE_REGISTER_DEFAULT_RETRIES = 3
 FIREBASE_SENDER_ID = "678067506455"
+# Stored FCM registrations older than this are renewed, reusing the GCM check-in.
+FIREBASE_FCM_TOKEN_MAX_AGE_IN_SECONDS = 30 * 24 * 3600
+# Firebase installations this close to expiry are not reused for a registration.
+FIREBASE_INSTALLATION_EXPIRY_MARGIN_IN_SECONDS = 60 * 60
 MYSKODA_APP_VERSION = "8.12.0"
 MYSKODA_APP_VERSION_CODE = "260430001"
 
@@ -81,13 +85,60 @@ MQTT_CONNECT_TIMEOUT = 600
 # accepting a newly registered token, so we throttle to avoid spamming new
 # registrations during that window.
 MQTT_MIN_FCM_REFRESH_INTERVAL = 120
+# Maximum number of topic filters sent in a single SUBSCRIBE packet.
+MQTT_SUBSCRIBE_BATCH_SIZE = 100
+# Default number of events an EventQueue holds before its overflow policy applies.
+EVENT_QUEUE_SIZE = 100
 
 MAX_RETRIES = 5
 
+# Access tokens this close to expiry are refreshed inline before being used.
+TOKEN_EXPIRY_MARGIN_IN_SECONDS = 10 * 60
+# The background refresher renews tokens this long before expiry, plus a random jitter.
+TOKEN_REFRESH_LEAD_IN_SECONDS = 15 * 60
+TOKEN_REFRESH_JITTER_IN_SECONDS = 5 * 60
+TOKEN_REFRESH_MIN_INTERVAL_IN_SECONDS = 60
+
 CACHE_USER_ENDPOINT_IN_HOURS = 6
 CACHE_VEHICLE_HEALTH_IN_HOURS = 6
 CACHE_CLOCK_SKEW_TOLERANCE_IN_HOURS = 4
+# Response cache (opt-in): TTLs for rarely changing and for live vehicle endpoints.
+CACHE_STATIC_ENDPOINT_IN_SECONDS = 6 * 3600
+CACHE_LIVE_ENDPOINT_IN_SECONDS = 30
+CACHE_MAX_ENTRIES = 256
 
 REQUEST_TIMEOUT_IN_SECONDS = 300
+# Maximum number of capability requests in flight at once while loading a single vehicle.
+# Set to 1 to load capabilities sequentially.
+MAX_CONCURRENT_REQUESTS_PER_VEHICLE = 4
+# Maximum number of requests in flight at once across all vehicles loaded by a fleet load.
+MAX_CONCURRENT_REQUESTS = 8
+# How often MySkoda.start_garage_sync() checks for added or removed vehicles.
+GARAGE_SYNC_INTERVAL_IN_SECONDS = 15 * 60
 DEFAULT_DEBOUNCE_WAIT_SECONDS = 10.0
+# Upper bound for postponing a debounced call while new calls keep coming in.
+DEFAULT_DEBOUNCE_MAX_WAIT_SECONDS = 30.0
+# Number of keys (e.g. instance and VIN) a debounced function tracks before idle ones are dropped.
+DEBOUNCE_MAX_KEYS = 64
 OPERATION_REFRESH_DELAY_SECONDS = 5.0
+# Client side rate limiting (opt-in), in requests per second and burst size. The global bucket
+# is shared by every account using the same RateLimiter; write requests queue on their own
+# bucket as well, so that commands cannot crowd out reads.
+RATE_LIMIT_GLOBAL_PER_SECOND = 10.0
+RATE_LIMIT_GLOBAL_BURST = 40
+RATE_LIMIT_ACCOUNT_PER_SECOND = 5.0
+RATE_LIMIT_ACCOUNT_BURST = 20
+RATE_LIMIT_VIN_PER_SECOND = 1.0
+RATE_LIMIT_VIN_BURST = 10
+RATE_LIMIT_WRITE_PER_SECOND = 0.2
+RATE_LIMIT_WRITE_BURST = 3
+# Retrying GET requests (opt-in): attempts in total, bounds of the jittered wait between them,
+# and the time after which no further attempt is started.
+RETRY_ATTEMPTS = 4
+RETRY_BASE_DELAY_IN_SECONDS = 0.5
+RETRY_MAX_DELAY_IN_SECONDS = 10.0
+RETRY_DEADLINE_IN_SECONDS = 60.0
+# Consecutive failures of an endpoint of a vehicle after which its requests fail fast, and how
+# long until a single request probes whether it works again.
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+CIRCUIT_BREAKER_RESET_TIMEOUT_IN_SECONDS = 5 * 60
@@ -0,0 +1,444 @@
+"""Registry of the GET endpoints of the MySkoda API.
+
+Every endpoint is described once: where it lives, which model its response is parsed into, how
+it is anonymized, for how long it may be cached, how expensive a request is and which part of a
+`Vehicle` it fills when the vehicle is loaded. `RestApi.fetch` requests any endpoint from this
+description, and the default cache policies, `MySkoda.get_endpoint` and the capabilities loaded
+by `MySkoda.get_vehicle` are derived from it.
+"""
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from urllib.parse import urlencode
+
+from mashumaro.mixins.dict import DataClassDictMixin
+
+from .anonymize import (
+    anonymize_air_conditioning,
+    anonymize_auxiliary_heating,
+    anonymize_charging,
+    anonymize_chargingprofiles,
+    anonymize_departure_timers,
+    anonymize_driving_range,
+    anonymize_driving_score,
+    anonymize_garage,
+    anonymize_health,
+    anonymize_info,
+    anonymize_loyalty_program_badge,
+    anonymize_loyalty_program_badges,
+    anonymize_loyalty_program_challenges,
+    anonymize_loyalty_program_details,
+    anonymize_loyalty_program_games,
+    anonymize_loyalty_program_member,
+    anonymize_loyalty_program_rewards,
+    anonymize_loyalty_program_salesforce_contacts,
+    anonymize_loyalty_program_transactions,
+    anonymize_maintenance,
+    anonymize_parking_position,
+    anonymize_positions,
+    anonymize_single_trip_statistics,
+    anonymize_software_update_status,
+    anonymize_status,
+    anonymize_trip_statistics,
+    anonymize_user,
+    anonymize_vehicle_connection_status,
+    anonymize_vehicle_equipment,
+    anonymize_vehicle_info,
+    anonymize_vehicle_renders,
+    anonymize_widget,
+)
+from .const import (
+    CACHE_LIVE_ENDPOINT_IN_SECONDS,
+    CACHE_STATIC_ENDPOINT_IN_SECONDS,
+    CACHE_USER_ENDPOINT_IN_HOURS,
+    CACHE_VEHICLE_HEALTH_IN_HOURS,
+)
+from .models.air_conditioning import AirConditioning
+from .models.auxiliary_heating import AuxiliaryHeating
+from .models.charging import Charging
+from .models.charging_history import ChargingHistory
+from .models.chargingprofiles import ChargingProfiles
+from .models.departure import DepartureInfo
+from .models.driving_range import DrivingRange
+from .models.driving_score import DrivingScore
+from .models.garage import Garage
+from .models.health import Health
+from .models.info import CapabilityId, Info
+from .models.loyalty_program import (
+    BadgeResponse,
+    BadgesResponse,
+    ChallengesResponse,
+    GamesResponse,
+    LoyaltyProgramDetailsResponse,
+    LoyaltyProgramMember,
+    RewardResponse,
+    SalesforceContactResponse,
+    TransactionsResponse,
+)
+from .models.maintenance import Maintenance, MaintenanceReport
+from .models.position import ParkingPositionV3, Positions
+from .models.software_status import SoftwareUpdateStatus
+from .models.status import Status
+from .models.trip_statistics import SingleTrips, TripStatistics
+from .models.user import User
+from .models.vehicle_connection_status import VehicleConnectionStatus
+from .models.vehicle_info import VehicleEquipment, VehicleInfo, VehicleRenders
+from .models.widget import WidgetResponse
+
+
+@dataclass(frozen=True)
+class EndpointSpec[T: DataClassDictMixin]:
+    """A GET endpoint of the MySkoda API.
+
+    `path` is the API path, optionally with a fixed query string, and placeholders such as
+    `{vin}` for the arguments of a request. `params` returns the default query parameters of a
+    request, for parameters which depend on the time of the request. `anonymizer` is None for
+    endpoints which can't be anonymized.
+
+    `cache_ttl` is how long responses may be served from a `ResponseCache`, None to never cache
+    them, and `volatile` and `cache_ignored_params` are passed on to the `CachePolicy`. `cost`
+    is the weight of a request relative to the others, endpoints returning long histories
+    weigh more. Endpoints loaded for a `capability` store their result in the `attribute` of
+    the `Vehicle`.
+    """
+
+    name: str
+    path: str
+    model: type[T]
+    anonymizer: Callable[[dict], dict] | None
+    params: Callable[[], dict[str, Any]] | None = None
+    cache_ttl: float | None = None
+    volatile: bool = True
+    cache_ignored_params: frozenset[str] = frozenset()
+    cost: int = 1
+    capability: CapabilityId | None = None
+    attribute: str | None = None
+
+    @property
+    def base_path(self) -> str:
+        """Return the path without its query string."""
+        return self.path.split("?", 1)[0]
+
+    def url(self, params: Mapping[str, Any] | None = None, **path_args: str) -> str:
+        """Return the URL of a request, params override the default query parameters."""
+        url = self.path.format(**path_args)
+        query = {**(self.params() if self.params is not None else {}), **(params or {})}
+        if query:
+            url += ("&" if "?" in url else "?") + urlencode(query)
+        return url
+
+
+def _trip_statistics_params() -> dict[str, Any]:
+    return {"offsetType": "week", "offset": 0, "timezone": "Europe/Berlin"}
+
+
+def _departure_timers_params() -> dict[str, Any]:
+    # The local time of the device, with the offset formatted as +HH:MM.
+    now = datetime.now().astimezone()
+    offset = now.strftime("%z")
+    return {"deviceDateTime": f"{now:%Y-%m-%dT%H:%M:%S.%f}{offset[:3]}:{offset[3:]}"}
+
+
+_GENERATIONS = "&".join(f"connectivityGenerations=MOD{i}" for i in range(1, 5))
+_STATIC = CACHE_STATIC_ENDPOINT_IN_SECONDS
+_LIVE = CACHE_LIVE_ENDPOINT_IN_SECONDS
+
+USER = EndpointSpec(
+    "user",
+    "/v1/users",
+    User,
+    anonymize_user,
+    cache_ttl=CACHE_USER_ENDPOINT_IN_HOURS * 3600,
+    volatile=False,
+)
+GARAGE = EndpointSpec(
+    "garage",
+    f"/v2/garage?{_GENERATIONS}",
+    Garage,
+    anonymize_garage,
+    cache_ttl=_STATIC,
+    volatile=False,
+)
+INFO = EndpointSpec(
+    "info",
+    f"/v2/garage/vehicles/{{vin}}?{_GENERATIONS}",
+    Info,
+    anonymize_info,
+    cache_ttl=_STATIC,
+    volatile=False,
+)
+STATUS = EndpointSpec(
+    "status",
+    "/v2/vehicle-status/{vin}",
+    Status,
+    anonymize_status,
+    cache_ttl=_LIVE,
+    capability=CapabilityId.STATE,
+    attribute="status",
+)
+DRIVING_RANGE = EndpointSpec(
+    "driving_range",
+    "/v2/vehicle-status/{vin}/driving-range",
+    DrivingRange,
+    anonymize_driving_range,
+    cache_ttl=_LIVE,
+    capability=CapabilityId.STATE,
+    attribute="driving_range",
+)
+DRIVING_SCORE = EndpointSpec(
+    "driving_score", "/v2/vehicle-status/{vin}/driving-score", DrivingScore, anonymize_driving_score
+)
+CHARGING = EndpointSpec(
+    "charging",
+    "/v1/charging/{vin}",
+    Charging,
+    anonymize_charging,
+    cache_ttl=_LIVE,
+    capability=CapabilityId.CHARGING,
+    attribute="charging",
+)
+CHARGING_PROFILES = EndpointSpec(
+    "charging_profiles", "/v1/charging/{vin}/profiles", ChargingProfiles, anonymize_chargingprofiles
+)
+CHARGING_HISTORY = EndpointSpec(
+    "charging_history", "/v1/charging/{vin}/history?userTimezone=UTC", ChargingHistory, None, cost=2
+)
+AIR_CONDITIONING = EndpointSpec(
+    "air_conditioning",
+    "/v2/air-conditioning/{vin}",
+    AirConditioning,
+    anonymize_air_conditioning,
+    cache_ttl=_LIVE,
+    capability=CapabilityId.AIR_CONDITIONING,
+    attribute="air_conditioning",
+)
+AUXILIARY_HEATING = EndpointSpec(
+    "auxiliary_heating",
+    "/v2/air-conditioning/{vin}/auxiliary-heating",
+    AuxiliaryHeating,
+    anonymize_auxiliary_heating,
+    cache_ttl=_LIVE,
+    capability=CapabilityId.AUXILIARY_HEATING,
+    attribute="auxiliary_heating",
+)
+POSITIONS = EndpointSpec(
+    "positions",
+    "/v1/maps/positions?vin={vin}",
+    Positions,
+    anonymize_positions,
+    cache_ttl=_LIVE,
+    capability=CapabilityId.PARKING_POSITION,
+    attribute="positions",
+)
+PARKING_POSITION = EndpointSpec(
+    "parking_position",
+    "/v3/maps/positions/vehicles/{vin}/parking",
+    ParkingPositionV3,
+    anonymize_parking_position,
+)
+TRIP_STATISTICS = EndpointSpec(
+    "trip_statistics",
+    "/v1/trip-statistics/{vin}",
+    TripStatistics,
+    anonymize_trip_statistics,
+    params=_trip_statistics_params,
+    capability=CapabilityId.TRIP_STATISTICS,
+    attribute="trip_statistics",
+)
+SINGLE_TRIP_STATISTICS = EndpointSpec(
+    "single_trip_statistics",
+    "/v1/trip-statistics/{vin}/single-trips?timezone=Europe%2FBerlin",
+    SingleTrips,
+    anonymize_single_trip_statistics,
+    cost=2,
+    capability=CapabilityId.TRIP_STATISTICS,
+    attribute="single_trip_statistics",
+)
+MAINTENANCE = EndpointSpec(
+    "maintenance",
+    "/v3/vehicle-maintenance/vehicles/{vin}",
+    Maintenance,
+    anonymize_maintenance,
+    cache_ttl=3600,
+    cost=2,
+)
+MAINTENANCE_REPORT = EndpointSpec(
+    "maintenance_report",
+    "/v3/vehicle-maintenance/vehicles/{vin}/report",
+    MaintenanceReport,
+    anonymize_maintenance,
+)
+HEALTH = EndpointSpec(
+    "health",
+    "/v1/vehicle-health-report/warning-lights/{vin}",
+    Health,
+    anonymize_health,
+    cache_ttl=CACHE_VEHICLE_HEALTH_IN_HOURS * 3600,
+    volatile=False,
+    capability=CapabilityId.VEHICLE_HEALTH_INSPECTION,
+    attribute="health",
+)
+VEHICLE_INFO = EndpointSpec(
+    "vehicle_info",
+    "/v1/vehicle-information/{vin}",
+    VehicleInfo,
+    anonymize_vehicle_info,
+    cache_ttl=_STATIC,
+    volatile=False,
+)
+SOFTWARE_UPDATE_STATUS = EndpointSpec(
+    "software_update_status",
+    "/v1/vehicle-information/{vin}/software-version/update-status",
+    SoftwareUpdateStatus,
+    anonymize_software_update_status,
+)
+RENDERS = EndpointSpec(
+    "renders",
+    "/v1/vehicle-information/{vin}/renders",
+    VehicleRenders,
+    anonymize_vehicle_renders,
+    cache_ttl=_STATIC,
+    volatile=False,
+)
+EQUIPMENT = EndpointSpec(
+    "equipment",
+    "/v1/vehicle-information/{vin}/equipment",
+    VehicleEquipment,
+    anonymize_vehicle_equipment,
+    cache_ttl=_STATIC,
+    volatile=False,
+)
+WIDGET = EndpointSpec(
+    "widget", "/v2/widgets/vehicle-status/{vin}", WidgetResponse, anonymize_widget
+)
+DEPARTURE_INFO = EndpointSpec(
+    "departure_info",
+    "/v1/vehicle-automatization/{vin}/departure/timers",
+    DepartureInfo,
+    anonymize_departure_timers,
+    params=_departure_timers_params,
+    cache_ttl=_LIVE,
+    # The time of the request, down to the microsecond, doesn't select a different response.
+    cache_ignored_params=frozenset({"deviceDateTime"}),
+    capability=CapabilityId.DEPARTURE_TIMERS,
+    attribute="departure_info",
+)
+VEHICLE_CONNECTION_STATUS = EndpointSpec(
+    "vehicle_connection_status",
+    "/v2/connection-status/{vin}/readiness",
+    VehicleConnectionStatus,
+    anonymize_vehicle_connection_status,
+    capability=CapabilityId.READINESS,
+    attribute="connection_status",
+)
+LOYALTY_PROGRAM_DETAILS = EndpointSpec(
+    "loyalty_program_details",
+    "/v2/loyalty-program/details",
+    LoyaltyProgramDetailsResponse,
+    anonymize_loyalty_program_details,
+)
+LOYALTY_PROGRAM_MEMBER = EndpointSpec(
+    "loyalty_program_member",
+    "/v2/loyalty-program/members/{user_id}",
+    LoyaltyProgramMember,
+    anonymize_loyalty_program_member,
+)
+LOYALTY_PROGRAM_BADGES = EndpointSpec(
+    "loyalty_program_badges",
+    "/v2/loyalty-program/members/{user_id}/badges",
+    BadgesResponse,
+    anonymize_loyalty_program_badges,
+)
+LOYALTY_PROGRAM_BADGE = EndpointSpec(
+    "loyalty_program_badge",
+    "/v2/loyalty-program/members/{user_id}/badges/{badge_id}",
+    BadgeResponse,
+    anonymize_loyalty_program_badge,
+)
+LOYALTY_PROGRAM_CHALLENGES = EndpointSpec(
+    "loyalty_program_challenges",
+    "/v2/loyalty-program/members/{user_id}/challenges",
+    ChallengesResponse,
+    anonymize_loyalty_program_challenges,
+)
+LOYALTY_PROGRAM_GAMES = EndpointSpec(
+    "loyalty_program_games",
+    "/v2/loyalty-program/members/{user_id}/games",
+    GamesResponse,
+    anonymize_loyalty_program_games,
+)
+LOYALTY_PROGRAM_REWARDS = EndpointSpec(
+    "loyalty_program_rewards",
+    "/v2/loyalty-program/members/{user_id}/rewards",
+    RewardResponse,
+    anonymize_loyalty_program_rewards,
+)
+LOYALTY_PROGRAM_TRANSACTIONS = EndpointSpec(
+    "loyalty_program_transactions",
+    "/v2/loyalty-program/members/{user_id}/transactions",
+    TransactionsResponse,
+    anonymize_loyalty_program_transactions,
+    cost=2,
+)
+LOYALTY_PROGRAM_SALESFORCE_CONTACTS = EndpointSpec(
+    "loyalty_program_salesforce_contacts",
+    "/v2/loyalty-program/salesforce-contacts/{user_id}",
+    SalesforceContactResponse,
+    anonymize_loyalty_program_salesforce_contacts,
+)
+
+# All endpoints by name. The names of the endpoints fixtures are generated for match the values
+# of `Endpoint`, and those of cached endpoints the names of their `CachePolicy`.
+ENDPOINTS: dict[str, EndpointSpec] = {
+    endpoint.name: endpoint
+    for endpoint in (
+        USER,
+        GARAGE,
+        INFO,
+        STATUS,
+        DRIVING_RANGE,
+        DRIVING_SCORE,
+        CHARGING,
+        CHARGING_PROFILES,
+        CHARGING_HISTORY,
+        AIR_CONDITIONING,
+        AUXILIARY_HEATING,
+        POSITIONS,
+        PARKING_POSITION,
+        TRIP_STATISTICS,
+        SINGLE_TRIP_STATISTICS,
+        MAINTENANCE,
+        MAINTENANCE_REPORT,
+        HEALTH,
+        VEHICLE_INFO,
+        SOFTWARE_UPDATE_STATUS,
+        RENDERS,
+        EQUIPMENT,
+        WIDGET,
+        DEPARTURE_INFO,
+        VEHICLE_CONNECTION_STATUS,
+        LOYALTY_PROGRAM_DETAILS,
+        LOYALTY_PROGRAM_MEMBER,
+        LOYALTY_PROGRAM_BADGES,
+        LOYALTY_PROGRAM_BADGE,
+        LOYALTY_PROGRAM_CHALLENGES,
+        LOYALTY_PROGRAM_GAMES,
+        LOYALTY_PROGRAM_REWARDS,
+        LOYALTY_PROGRAM_TRANSACTIONS,
+        LOYALTY_PROGRAM_SALESFORCE_CONTACTS,
+    )
+}
+
+
+def _capability_endpoints() -> dict[CapabilityId, tuple[EndpointSpec, ...]]:
+    plan: dict[CapabilityId, tuple[EndpointSpec, ...]] = {}
+    for endpoint in ENDPOINTS.values():
+        if endpoint.capability is not None:
+            plan[endpoint.capability] = (*plan.get(endpoint.capability, ()), endpoint)
+    return plan
+
+
+# The endpoints requested to load each capability of a vehicle.
+CAPABILITY_ENDPOINTS = _capability_endpoints()
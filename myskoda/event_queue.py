@@ -0,0 +1,151 @@
+"""Bounded queues between the MQTT client and slow event subscribers."""
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any
+
+from .const import EVENT_QUEUE_SIZE
+from .models.event import BaseEvent, EventType
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class OverflowPolicy(StrEnum):
+    """What an `EventQueue` does with a new event when it is full.
+
+    BLOCK stops reading from the broker until there is room. DROP_OLDEST drops the event which
+    waited longest. COALESCE replaces a queued event of the same vehicle and event type, and
+    drops the oldest event if there is none.
+    """
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+
+
+@dataclass
+class EventQueueStats:
+    """Counters for an `EventQueue`.
+
+    `lag` is how long the last processed event waited in the queue, in seconds. `dropped`
+    counts events discarded because the queue was full, `coalesced` counts events which
+    replaced a queued one.
+    """
+
+    depth: int = 0
+    max_depth: int = 0
+    processed: int = 0
+    failed: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    lag: float = 0.0
+    max_lag: float = 0.0
+
+
+@dataclass
+class _QueuedEvent:
+    event: BaseEvent
+    enqueued_at: float
+
+    @property
+    def key(self) -> tuple[str, EventType]:
+        return (self.event.vin, self.event.event_type)
+
+
+class EventQueue:
+    """Deliver events to a callback from a bounded queue, using a pool of workers.
+
+    Subscribe the queue instead of the callback itself. The workers start with the first event
+    and are stopped when the MQTT client disconnects.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[BaseEvent], Coroutine[Any, Any, None]],
+        maxsize: int = EVENT_QUEUE_SIZE,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        workers: int = 1,
+    ) -> None:
+        if maxsize < 1 or workers < 1:
+            msg = "maxsize and workers must be at least 1"
+            raise ValueError(msg)
+        self._callback = callback
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self._worker_count = workers
+        self._items: deque[_QueuedEvent] = deque()
+        # The most recently queued event per vehicle and event type, for coalescing.
+        self._latest: dict[tuple[str, EventType], _QueuedEvent] = {}
+        self._changed = asyncio.Condition()
+        self._workers: set[asyncio.Task] = set()
+        self.stats = EventQueueStats()
+
+    async def put(self, event: BaseEvent) -> None:
+        """Queue event, applying the overflow policy if the queue is full."""
+        if not self._workers:
+            self._start()
+        async with self._changed:
+            if len(self._items) >= self.maxsize:
+                if self.overflow == OverflowPolicy.BLOCK:
+                    await self._changed.wait_for(lambda: len(self._items) < self.maxsize)
+                elif self.overflow == OverflowPolicy.COALESCE and self._coalesce(event):
+                    return
+                else:
+                    self._remove(self._items.popleft())
+                    self.stats.dropped += 1
+
+            queued = _QueuedEvent(event, asyncio.get_running_loop().time())
+            self._items.append(queued)
+            self._latest[queued.key] = queued
+            self.stats.depth = len(self._items)
+            self.stats.max_depth = max(self.stats.max_depth, self.stats.depth)
+            self._changed.notify_all()
+
+    async def stop(self) -> None:
+        """Stop the workers, keeping queued events for when they are started again."""
+        workers, self._workers = self._workers, set()
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    def _start(self) -> None:
+        for _ in range(self._worker_count):
+            worker = asyncio.create_task(self._work())
+            self._workers.add(worker)
+
+    def _coalesce(self, event: BaseEvent) -> bool:
+        """Replace the queued event of the same vehicle and type with event, if any."""
+        queued = self._latest.get((event.vin, event.event_type))
+        if queued is None:
+            return False
+        queued.event = event
+        self.stats.coalesced += 1
+        return True
+
+    def _remove(self, queued: _QueuedEvent) -> None:
+        if self._latest.get(queued.key) is queued:
+            del self._latest[queued.key]
+
+    async def _work(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(lambda: bool(self._items))
+                queued = self._items.popleft()
+                self._remove(queued)
+                self.stats.depth = len(self._items)
+                self._changed.notify_all()
+
+            self.stats.lag = loop.time() - queued.enqueued_at
+            self.stats.max_lag = max(self.stats.max_lag, self.stats.lag)
+            try:
+                await self._callback(queued.event)
+            except Exception:
+                self.stats.failed += 1
+                _LOGGER.exception("Event callback failed for %s", queued.event)
+            else:
+                self.stats.processed += 1
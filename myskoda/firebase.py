@@ -9,15 +9,21 @@ import gzip
 import hashlib
 import json
 import logging
+import time
 import uuid
+from abc import ABC, abstractmethod
 from base64 import urlsafe_b64encode
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
 import aiohttp
 from firebase_messaging import FcmRegisterConfig
 from firebase_messaging.const import AUTH_VERSION, FCM_INSTALLATION, GCM_REGISTER_URL
 from firebase_messaging.fcmregister import FcmRegister
+from mashumaro.mixins.orjson import DataClassORJSONMixin
 
+from .auth.token_store import JsonFile
 from .const import (
     FIREBASE_ANDROID_CERT,
     FIREBASE_ANDROID_FCM_CLIENT_VERSION,
@@ -26,7 +32,9 @@ from .const import (
     FIREBASE_ANDROID_PACKAGE,
     FIREBASE_API_KEY,
     FIREBASE_APP_ID,
+    FIREBASE_FCM_TOKEN_MAX_AGE_IN_SECONDS,
     FIREBASE_GMS_VERSION,
+    FIREBASE_INSTALLATION_EXPIRY_MARGIN_IN_SECONDS,
     FIREBASE_PROJECT_ID,
     FIREBASE_REGISTER_DEFAULT_RETRIES,
     FIREBASE_SENDER_ID,
@@ -37,6 +45,93 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass
+class FcmCredentials(DataClassORJSONMixin):
+    """Everything needed to reuse an FCM registration after a restart.
+
+    `android_id` and `security_token` come from the GCM check-in, `fid` and
+    `installation_token` from the Firebase installation. Times are seconds since the epoch.
+    """
+
+    android_id: str
+    security_token: str
+    fid: str
+    installation_token: str
+    installation_expires_at: float
+    fcm_token: str
+    registered_at: float
+
+    def is_expired(self, max_age: float = FIREBASE_FCM_TOKEN_MAX_AGE_IN_SECONDS) -> bool:
+        """Check whether the FCM token is older than max_age seconds."""
+        return time.time() - self.registered_at > max_age
+
+    def is_installation_expired(self) -> bool:
+        """Check whether the installation token can no longer be used for a registration."""
+        margin = FIREBASE_INSTALLATION_EXPIRY_MARGIN_IN_SECONDS
+        return time.time() + margin > self.installation_expires_at
+
+
+class FcmCredentialStore(ABC):
+    """Storage for the FCM credentials of one or more accounts, stored by key."""
+
+    @abstractmethod
+    async def load(self, key: str) -> FcmCredentials | None:
+        """Return the stored credentials for key, if any."""
+
+    @abstractmethod
+    async def save(self, key: str, credentials: FcmCredentials) -> None:
+        """Store the credentials for key, replacing any previous ones."""
+
+    @abstractmethod
+    async def clear(self, key: str) -> None:
+        """Remove the stored credentials for key."""
+
+
+class MemoryFcmCredentialStore(FcmCredentialStore):
+    """Keeps FCM credentials for the lifetime of the process only."""
+
+    def __init__(self) -> None:
+        self._credentials: dict[str, FcmCredentials] = {}
+
+    async def load(self, key: str) -> FcmCredentials | None:
+        """Return the stored credentials for key, if any."""
+        return self._credentials.get(key)
+
+    async def save(self, key: str, credentials: FcmCredentials) -> None:
+        """Store the credentials for key, replacing any previous ones."""
+        self._credentials[key] = credentials
+
+    async def clear(self, key: str) -> None:
+        """Remove the stored credentials for key."""
+        self._credentials.pop(key, None)
+
+
+class FileFcmCredentialStore(FcmCredentialStore):
+    """Stores FCM credentials in a `JsonFile`, which can be shared between processes."""
+
+    def __init__(self, path: str | Path) -> None:
+        self._file = JsonFile(path)
+
+    async def load(self, key: str) -> FcmCredentials | None:
+        """Return the stored credentials for key, if any."""
+        raw = await asyncio.to_thread(self._file.get, key)
+        if raw is None:
+            return None
+        try:
+            return FcmCredentials.from_dict(raw)
+        except Exception:
+            _LOGGER.exception("Ignoring invalid stored FCM credentials for %s", key)
+            return None
+
+    async def save(self, key: str, credentials: FcmCredentials) -> None:
+        """Store the credentials for key, replacing any previous ones."""
+        await asyncio.to_thread(self._file.set, key, credentials.to_dict())
+
+    async def clear(self, key: str) -> None:
+        """Remove the stored credentials for key."""
+        await asyncio.to_thread(self._file.set, key, None)
+
+
 class FirebaseClient:
     """Handle FCM (Firebase Cloud Messaging) credentials acquisition."""
 
@@ -60,10 +155,43 @@ class FirebaseClient:
 
     async def get_fcm_token(self) -> str:
         """Return a valid FCM token."""
-        _LOGGER.debug("Checkin and register with Android FCM")
-        gcm_credentials = await self._get_gcm_credentials()
-        installation = await self._install_firebase()
-        return await self._register_android_fcm_token(gcm_credentials, installation)
+        return (await self.register()).fcm_token
+
+    async def register(self, previous: FcmCredentials | None = None) -> FcmCredentials:
+        """Register with Android FCM and return the credentials of the new registration.
+
+        The GCM check-in of previous is reused, and so is its Firebase installation unless it
+        is about to expire. Without previous, every step is done from scratch.
+        """
+        if previous is None:
+            _LOGGER.debug("Checkin and register with Android FCM")
+            gcm_credentials = await self._get_gcm_credentials()
+        else:
+            _LOGGER.debug("Register with Android FCM, reusing the previous checkin")
+            gcm_credentials = {
+                "androidId": previous.android_id,
+                "securityToken": previous.security_token,
+            }
+
+        if previous is None or previous.is_installation_expired():
+            installation = await self._install_firebase()
+        else:
+            installation = {
+                "fid": previous.fid,
+                "auth_token": previous.installation_token,
+                "expires_at": previous.installation_expires_at,
+            }
+
+        fcm_token = await self._register_android_fcm_token(gcm_credentials, installation)
+        return FcmCredentials(
+            android_id=str(gcm_credentials["androidId"]),
+            security_token=str(gcm_credentials["securityToken"]),
+            fid=installation["fid"],
+            installation_token=installation["auth_token"],
+            installation_expires_at=installation["expires_at"],
+            fcm_token=fcm_token,
+            registered_at=time.time(),
+        )
 
     async def _get_gcm_credentials(self) -> dict[str, Any]:
         register = FcmRegister(
@@ -100,6 +228,8 @@ class FirebaseClient:
         return {
             "fid": installation["fid"],
             "auth_token": installation["authToken"]["token"],
+            "expires_at": time.time()
+            + self._parse_duration(installation["authToken"].get("expiresIn", "0s")),
         }
 
     async def _register_android_fcm_token(
@@ -168,6 +298,14 @@ class FirebaseClient:
         digest = hashlib.sha1(b"[DEFAULT]").digest()  # noqa: S324
         return urlsafe_b64encode(digest).decode("ascii").rstrip("=")
 
+    @staticmethod
+    def _parse_duration(duration: str) -> float:
+        """Parse a protobuf duration like "604800s" into seconds."""
+        try:
+            return float(duration.removesuffix("s"))
+        except ValueError:
+            return 0.0
+
     @staticmethod
     def _parse_gcm_register_response(response_text: str) -> str:
         key, separator, value = response_text.partition("=")
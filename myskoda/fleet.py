@@ -0,0 +1,60 @@
+"""Results of loading several vehicles at once, e.g. while connecting."""
+
+from dataclasses import dataclass, field
+
+from .models.common import Vin
+from .vehicle import Vehicle
+
+
+@dataclass
+class VehicleLoadResult:
+    """Outcome of loading a single vehicle as part of a fleet load."""
+
+    vin: Vin
+    vehicle: Vehicle | None = None
+    error: Exception | None = None
+    duration: float = 0.0
+    timings: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def success(self) -> bool:
+        """Return True if the vehicle was loaded."""
+        return self.error is None
+
+
+@dataclass
+class FleetLoadReport:
+    """Outcome of loading several vehicles, in the order they completed."""
+
+    results: list[VehicleLoadResult] = field(default_factory=list)
+
+    @property
+    def vehicles(self) -> dict[Vin, Vehicle]:
+        """Return all successfully loaded vehicles by VIN."""
+        return {r.vin: r.vehicle for r in self.results if r.vehicle is not None}
+
+    @property
+    def failures(self) -> dict[Vin, Exception]:
+        """Return the error for every vehicle which could not be loaded."""
+        return {r.vin: r.error for r in self.results if r.error is not None}
+
+    @property
+    def complete(self) -> bool:
+        """Return True if every vehicle was loaded."""
+        return all(r.success for r in self.results)
+
+
+@dataclass
+class StartupReport:
+    """Timings of `MySkoda.connect`, in seconds.
+
+    `phases` holds the duration of every step taken: "authorize", "user", "garage", "fcm",
+    "mqtt" and "vehicles". Independent steps run concurrently, so their durations overlap.
+    `time_to_first_state` is the time from calling `connect` until the first vehicle was
+    loaded, if vehicles were loaded.
+    """
+
+    phases: dict[str, float] = field(default_factory=dict)
+    total: float = 0.0
+    time_to_first_state: float | None = None
+    fleet: FleetLoadReport | None = None
@@ -1,6 +1,7 @@
 """Models for MQTT Events."""
 
 from .base import BaseEvent, EventType
+from .dispatch import event_from_mqtt_message
 from .operation import OperationEvent, OperationName, OperationStatus
 from .service import (
     ServiceEvent,
@@ -65,4 +66,5 @@ __all__ = [
     "VehicleEventName",
     "VehicleEventVehicleIgnitionStatusData",
     "VehicleEventWarningBatterylevel",
+    "event_from_mqtt_message",
 ]
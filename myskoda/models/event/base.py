@@ -49,7 +49,7 @@ class BaseEvent(DataClassORJSONMixin):
     timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
 
     @classmethod
-    def from_mqtt_message(cls, topic: str, payload: str) -> "BaseEvent":
+    def from_mqtt_message(cls, topic: str, payload: bytes | bytearray | str) -> "BaseEvent":
         """Return a parsed event object.
 
         'topic' is the original MQTT topic on which the event was received
@@ -0,0 +1,82 @@
+"""Decode MQTT messages straight into the event class for their topic.
+
+`BaseEvent.from_mqtt_message` lets mashumaro find the event class by trying the discriminators
+of all event subtypes. The topics are known up front though: the table below maps every
+subscribed topic to its event class, or for service and vehicle events to the classes by their
+'name'. Messages on other topics take the generic path.
+"""
+
+from collections.abc import Iterator
+
+import orjson
+
+from myskoda.const import (
+    MQTT_ACCOUNT_EVENT_TOPICS,
+    MQTT_OPERATION_TOPICS,
+    MQTT_SERVICE_EVENT_TOPICS,
+    MQTT_VEHICLE_EVENT_TOPICS,
+)
+
+from .account import AccountEvent
+from .base import BaseEvent, EventType
+from .operation import OperationEvent
+from .service import ServiceEvent
+from .vehicle import VehicleEvent
+
+type _EventClasses = type[BaseEvent] | dict[str, type[BaseEvent]]
+
+
+def _subclasses(cls: type[BaseEvent]) -> Iterator[type[BaseEvent]]:
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _subclasses(subclass)
+
+
+def _by_name(cls: type[BaseEvent]) -> dict[str, type[BaseEvent]]:
+    """Map the 'name' of each event class derived from cls to that class."""
+    return {
+        str(subclass.__dict__["name"]): subclass
+        for subclass in _subclasses(cls)
+        if "name" in subclass.__dict__
+    }
+
+
+def _topic_table() -> dict[str, tuple[EventType, _EventClasses]]:
+    service_events = _by_name(ServiceEvent)
+    vehicle_events = _by_name(VehicleEvent)
+    table: dict[str, tuple[EventType, _EventClasses]] = {}
+    for event_type, topics, classes in (
+        (EventType.OPERATION, MQTT_OPERATION_TOPICS, OperationEvent),
+        (EventType.SERVICE_EVENT, MQTT_SERVICE_EVENT_TOPICS, service_events),
+        (EventType.ACCOUNT_EVENT, MQTT_ACCOUNT_EVENT_TOPICS, AccountEvent),
+        (EventType.VEHICLE_EVENT, MQTT_VEHICLE_EVENT_TOPICS, vehicle_events),
+    ):
+        for topic in topics:
+            table[f"{event_type}/{topic}"] = (event_type, classes)
+    return table
+
+
+# Keyed by the topic without the leading '{user_id}/{vin}/'.
+TOPIC_TABLE = _topic_table()
+
+
+def event_from_mqtt_message(topic: str, payload: bytes | bytearray | str) -> BaseEvent:
+    """Return the event for a message received on topic.
+
+    'payload' is parsed as is, without decoding it to a string first.
+    """
+    _user_id, vin, event_topic = topic.split("/", maxsplit=2)
+    entry = TOPIC_TABLE.get(event_topic)
+    if entry is None:
+        return BaseEvent.from_mqtt_message(topic=topic, payload=payload)
+
+    event_type, classes = entry
+    data = orjson.loads(payload)
+    data["vin"] = vin
+    data["event_type"] = event_type
+    if isinstance(classes, dict):
+        cls = classes.get(data.get("name"))
+        if cls is None:
+            return BaseEvent.from_dict(data)
+        return cls.from_dict(data)
+    return classes.from_dict(data)
@@ -12,12 +12,17 @@ import ssl
 import struct
 import time
 import uuid
-from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
+from collections import defaultdict
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from enum import StrEnum
 from random import uniform
 from types import TracebackType
 from typing import Any, Protocol, Self, cast
 
 import aiomqtt
+from paho.mqtt import client as paho_mqtt
 from paho.mqtt.packettypes import PacketTypes
 from paho.mqtt.properties import Properties
 from paho.mqtt.reasoncodes import ReasonCode
@@ -35,13 +40,25 @@ from .const import (
     MQTT_OPERATION_TOPICS,
     MQTT_RECONNECT_DELAY,
     MQTT_SERVICE_EVENT_TOPICS,
+    MQTT_SUBSCRIBE_BATCH_SIZE,
     MQTT_VEHICLE_EVENT_TOPICS,
 )
-from .models.event import BaseEvent, OperationEvent, OperationName, OperationStatus
+from .event_queue import EventQueue
+from .models.event import (
+    BaseEvent,
+    EventType,
+    OperationEvent,
+    OperationName,
+    OperationStatus,
+    event_from_mqtt_message,
+)
+from .operation_tracker import OperationFailedError, OperationTracker  # noqa: F401 - re-exported
 
 _LOGGER = logging.getLogger(__name__)
 TOPIC_RE = re.compile("^(.*?)/(.*?)/(.*?)/(.*?)$")
 
+type EventCallback = Callable[[BaseEvent], Coroutine[Any, Any, None]]
+
 # MQTT CONNACK reason codes that indicate the FCM-derived TOTP credential was
 # rejected. Mixing v3.1.1 return codes and MQTTv5 reason codes is intentional;
 # the underlying paho client may surface either depending on protocol level.
@@ -67,6 +84,71 @@ def _is_auth_failure(exc: BaseException) -> bool:
     return False
 
 
+def _subscribe_failures(result: tuple[int, ...] | list[ReasonCode]) -> int:
+    """Count the topic filters the broker rejected in a SUBACK.
+
+    MQTTv5 returns reason codes, v3.1.1 the granted QoS per filter with 0x80 for a failure.
+    """
+    return sum(
+        1
+        for code in result
+        if (code.is_failure if isinstance(code, ReasonCode) else code >= 0x80)  # noqa: PLR2004
+    )
+
+
+def vehicle_topics(user_id: str, vin: str) -> list[str]:
+    """Return the explicit topics to subscribe to for a single vehicle."""
+    prefix = f"{user_id}/{vin}"
+    return [
+        *(f"{prefix}/operation-request/{topic}" for topic in MQTT_OPERATION_TOPICS),
+        *(f"{prefix}/service-event/{topic}" for topic in MQTT_SERVICE_EVENT_TOPICS),
+        *(f"{prefix}/account-event/{topic}" for topic in MQTT_ACCOUNT_EVENT_TOPICS),
+        *(f"{prefix}/vehicle-event/{topic}" for topic in MQTT_VEHICLE_EVENT_TOPICS),
+    ]
+
+
+class SubscriptionMode(StrEnum):
+    """How MySkodaMqttClient subscribes to the topics of a vehicle.
+
+    EXPLICIT subscribes to every known topic. WILDCARD subscribes to `{user}/{vin}/#` instead,
+    falling back to EXPLICIT if the broker rejects it.
+    """
+
+    EXPLICIT = "explicit"
+    WILDCARD = "wildcard"
+
+
+@dataclass
+class SubscriptionStats:
+    """Counters for the subscriptions since the last (re)connect of a `MySkodaMqttClient`.
+
+    `duration` is the time in seconds it took to subscribe to all vehicles when connecting.
+    `fallbacks` counts, over all connects, how often a rejected wildcard subscription was
+    replaced by explicit topics.
+    """
+
+    mode: SubscriptionMode = SubscriptionMode.EXPLICIT
+    packets: int = 0
+    topics: int = 0
+    failed: int = 0
+    duration: float = 0.0
+    fallbacks: int = 0
+
+
+@dataclass
+class SessionStats:
+    """Counters for persistent MQTT sessions of a `MySkodaMqttClient`.
+
+    `resumed` counts reconnects which found the previous session on the broker and so skipped
+    resubscribing, `started` counts connects which had to start a new session. `recovered`
+    counts messages published while disconnected, which the broker queued in the session.
+    """
+
+    resumed: int = 0
+    started: int = 0
+    recovered: int = 0
+
+
 def _create_ssl_context() -> ssl.SSLContext:
     """Create a SSL context for the MQTT connection."""
     context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
@@ -79,27 +161,6 @@ _SSL_CONTEXT = _create_ssl_context()
 background_tasks = set()
 
 
-class OperationListener:
-    """Used to track callbacks to execute for a given OperationName."""
-
-    operation_name: OperationName
-    future: asyncio.Future[OperationEvent]
-
-    def __init__(
-        self, operation_name: OperationName, future: asyncio.Future[OperationEvent]
-    ) -> None:
-        self.operation_name = operation_name
-        self.future = future
-
-
-class OperationFailedError(Exception):  # pragma: no cover
-    def __init__(self, event: OperationEvent) -> None:
-        op = event.operation
-        error = event.error_code
-        trace = event.trace_id
-        super().__init__(f"Operation {op} with trace {trace} failed: {error}")
-
-
 class AbstractMqttClientWrapper(Protocol):
     """Interface for an aiomqtt.Client wrapper.
 
@@ -120,14 +181,37 @@ class AbstractMqttClientWrapper(Protocol):
     @property
     def messages(self) -> AsyncIterator: ...  # noqa: D102
 
-    async def subscribe(self, topic: str) -> None: ...  # noqa: D102
+    @property
+    def session_present(self) -> bool: ...  # noqa: D102
+
+    def subscribe(  # noqa: D102
+        self, topic: list[tuple[str, int]]
+    ) -> Awaitable[tuple[int, ...] | list[ReasonCode]]: ...
+
+    def unsubscribe(self, topic: list[str]) -> Awaitable[None]: ...  # noqa: D102
 
     def update_username_password(self, username: str, password: str) -> None: ...  # noqa: D102
 
-    def set_connect_properties(self, fcm_token: str) -> None: ...  # noqa: D102
+    def set_connect_properties(  # noqa: D102
+        self, fcm_token: str, session_expiry: int | None = None
+    ) -> None: ...
 
 
 class AioMqttClientWrapper(aiomqtt.Client):
+    session_present: bool = False
+
+    def _on_connect(
+        self,
+        client: paho_mqtt.Client,
+        userdata: Any,  # noqa: ANN401
+        flags: paho_mqtt.ConnectFlags,
+        reason_code: ReasonCode,
+        properties: Properties | None = None,
+    ) -> None:
+        """Remember whether the broker resumed a previous session."""
+        self.session_present = bool(flags.session_present)
+        super()._on_connect(client, userdata, flags, reason_code, properties)
+
     def update_username_password(self, username: str, password: str) -> None:
         """Update the username and password set in an aiomqtt.Client object.
 
@@ -139,7 +223,7 @@ class AioMqttClientWrapper(aiomqtt.Client):
         """
         self._client.username_pw_set(username=username, password=password)
 
-    def set_connect_properties(self, fcm_token: str) -> None:
+    def set_connect_properties(self, fcm_token: str, session_expiry: int | None = None) -> None:
         """Set MQTTv5 CONNECT properties based on an FCM Token.update_username_password.
 
         Similar to update_username_password, this must be set dynamically right before attempting
@@ -147,12 +231,15 @@ class AioMqttClientWrapper(aiomqtt.Client):
 
         Args:
             fcm_token: A valid Firebase Cloud Messaging Token.
+            session_expiry: Seconds the broker keeps the session after disconnecting, if any.
         """
         self._properties = Properties(PacketTypes.CONNECT)
         self._properties.UserProperty = [
             ("auth_method", "totp_v1"),
             ("auth_credentials", self._generate_totp(fcm_token)),
         ]
+        if session_expiry:
+            self._properties.SessionExpiryInterval = session_expiry
 
     @staticmethod
     def _generate_totp(fcm_token: str) -> str:
@@ -186,21 +273,34 @@ class MySkodaMqttClient:
         mqtt_client: A custom `aiomqtt.Client` subclass instance with additional methods to
                      update connection credentials and properties.
         ssl_context: An `ssl.SSLContext`
+        subscription_mode: Whether to subscribe to explicit topics or a wildcard per vehicle.
+        session_expiry: Keep the MQTT session on the broker for this many seconds after
+                        disconnecting, so reconnecting resumes it and receives the messages
+                        published meanwhile. Disabled by default.
+        client_id: The MQTT client identifier. Pass the same one after restarting to resume a
+                   session from a previous process. Random by default.
     """
 
     user_id: str | None
     vehicle_vins: list[str]
-    _callbacks: list[Callable[[BaseEvent], Coroutine[Any, Any, None]]]
-    _operation_listeners: list[OperationListener]
+    _routes: dict[tuple[str | None, EventType | None], list[EventCallback | EventQueue]]
+    operations: OperationTracker
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         authorization: Authorization,
         refresh_fcm_token: GetFcmToken,
         mqtt_client: AbstractMqttClientWrapper | None = None,
         ssl_context: ssl.SSLContext | None = None,
+        subscription_mode: SubscriptionMode = SubscriptionMode.EXPLICIT,
+        session_expiry: int | None = None,
+        client_id: str | None = None,
     ) -> None:
         self.authorization = authorization
+        self.subscription_mode = subscription_mode
+        self.subscription_stats = SubscriptionStats(mode=subscription_mode)
+        self.session_expiry = session_expiry
+        self.session_stats = SessionStats()
         self.vehicle_vins = []
         self.mqtt_client = mqtt_client
         if self.mqtt_client is None:
@@ -209,17 +309,24 @@ class MySkodaMqttClient:
             self.mqtt_client = AioMqttClientWrapper(
                 hostname=MQTT_BROKER_HOST,
                 port=MQTT_BROKER_PORT,
-                identifier=f"{uuid.uuid4()}#{uuid.uuid4()}",
+                identifier=client_id or f"{uuid.uuid4()}#{uuid.uuid4()}",
                 logger=_LOGGER,
                 tls_context=ssl_context or _SSL_CONTEXT,
                 keepalive=MQTT_KEEPALIVE,
                 protocol=aiomqtt.ProtocolVersion.V5,
+                clean_start=paho_mqtt.MQTT_CLEAN_START_FIRST_ONLY if not session_expiry else False,
             )
-        self._callbacks = []
-        self._operation_listeners = []
+        self._routes = defaultdict(list)
+        self.operations = OperationTracker()
         self._listener_task = None
         self._running = False
         self._subscribed = asyncio.Event()
+        # The connected client, while subscribed to all vehicles.
+        self._client: AbstractMqttClientWrapper | None = None
+        # The vehicles subscribed to in the current broker session, None if unknown.
+        self._session_vins: set[str] | None = None
+        # When the last resumed session was resumed, messages older than that were queued.
+        self._resumed_at: datetime | None = None
         self._reconnect_delay = MQTT_RECONNECT_DELAY
         self._fcm_token = None
         self._refresh_fcm_token = refresh_fcm_token
@@ -240,7 +347,7 @@ class MySkodaMqttClient:
         """
         _LOGGER.info("Connecting to MQTT with %s/%s", user_id, vehicle_vins)
         self.user_id = user_id
-        self.vehicle_vins = vehicle_vins
+        self.vehicle_vins = list(vehicle_vins)
         self._listener_task = asyncio.create_task(self._connect_and_listen())
         try:
             async with asyncio.timeout(connect_timeout):
@@ -252,25 +359,71 @@ class MySkodaMqttClient:
             raise TimeoutError(msg) from exc
 
     async def disconnect(self) -> None:
-        """Cancel listener task and set self_running to False, causing the listen loop to end."""
-        if self._listener_task is None:
-            return
-        self._listener_task.cancel()
-        self._listener_task = None
-        self._running = False
+        """Cancel listener task and set self_running to False, causing the listen loop to end.
 
-    def subscribe(self, callback: Callable[[BaseEvent], Coroutine[Any, Any, None]]) -> None:
-        """Listen for events emitted by MySkoda's MQTT broker."""
-        self._callbacks.append(callback)
+        Also stops the workers of subscribed event queues.
+        """
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            self._listener_task = None
+            self._running = False
+        for queue in {
+            subscriber
+            for subscribers in self._routes.values()
+            for subscriber in subscribers
+            if isinstance(subscriber, EventQueue)
+        }:
+            await queue.stop()
+
+    def subscribe(
+        self,
+        callback: EventCallback | EventQueue,
+        vins: Iterable[str] | None = None,
+        event_types: Iterable[EventType] | None = None,
+    ) -> Callable[[], None]:
+        """Listen for events emitted by MySkoda's MQTT broker.
 
-    def wait_for_operation(self, operation_name: OperationName) -> asyncio.Future[OperationEvent]:
-        """Wait until the next operation of the specified type completes."""
-        _LOGGER.debug("Waiting for operation %s complete.", operation_name)
-        future: asyncio.Future[OperationEvent] = asyncio.get_event_loop().create_future()
+        Args:
+            callback: Called with every matching event, each call in a new task. Pass an
+                      `EventQueue` to bound the number of events waiting for a slow callback.
+            vins: Only call for events of these vehicles. All vehicles if None.
+            event_types: Only call for events of these types. All types if None.
 
-        self._operation_listeners.append(OperationListener(operation_name, future))
+        Returns:
+            A function which unsubscribes the callback again.
+        """
+        keys = [
+            (vin, event_type)
+            for vin in ([None] if vins is None else set(vins))
+            for event_type in ([None] if event_types is None else set(event_types))
+        ]
+        for key in keys:
+            self._routes[key].append(callback)
+
+        def unsubscribe() -> None:
+            for key in keys:
+                if callback in (callbacks := self._routes.get(key, [])):
+                    callbacks.remove(callback)
+                    if not callbacks:
+                        del self._routes[key]
+
+        return unsubscribe
+
+    def wait_for_operation(
+        self,
+        operation_name: OperationName,
+        vin: str | None = None,
+        timeout: float | None = None,
+    ) -> asyncio.Future[OperationEvent]:
+        """Wait until the next operation of the specified type completes.
 
-        return future
+        Args:
+            operation_name: The operation to wait for.
+            vin: Only wait for the operation on this vehicle. Any vehicle if None.
+            timeout: Fail the future with `TimeoutError` after this many seconds.
+        """
+        _LOGGER.debug("Waiting for operation %s complete.", operation_name)
+        return self.operations.wait(operation_name, vin, timeout)
 
     async def _connect_and_listen(self) -> None:
         """Connect to the MQTT broker and listen for messages for the given user_id and VINs.
@@ -292,27 +445,22 @@ class MySkodaMqttClient:
                 self.mqtt_client.update_username_password(
                     username=self.user_id or "android-app", password=password
                 )
-                self.mqtt_client.set_connect_properties(fcm_token=self._fcm_token)
+                self.mqtt_client.set_connect_properties(
+                    fcm_token=self._fcm_token, session_expiry=self.session_expiry
+                )
                 async with self.mqtt_client as client:
                     _LOGGER.info("Connected to MQTT")
                     _LOGGER.debug("using MQTT client %s", client)
-                    for vin in self.vehicle_vins:
-                        for topic in MQTT_OPERATION_TOPICS:
-                            await client.subscribe(
-                                f"{self.user_id}/{vin}/operation-request/{topic}"
-                            )
-                        for topic in MQTT_SERVICE_EVENT_TOPICS:
-                            await client.subscribe(f"{self.user_id}/{vin}/service-event/{topic}")
-                        for topic in MQTT_ACCOUNT_EVENT_TOPICS:
-                            await client.subscribe(f"{self.user_id}/{vin}/account-event/{topic}")
-                        for topic in MQTT_VEHICLE_EVENT_TOPICS:
-                            await client.subscribe(f"{self.user_id}/{vin}/vehicle-event/{topic}")
-
+                    await self._resume_or_subscribe(client)
                     self._subscribed.set()
                     self._reconnect_delay = MQTT_RECONNECT_DELAY
                     retry_count = 0  # Reset retry count on successful connection
-                    async for message in client.messages:
-                        self._on_message(message)
+                    self._client = client
+                    try:
+                        async for message in client.messages:
+                            await self._on_message(message)
+                    finally:
+                        self._client = None
             except aiomqtt.MqttError as exc:
                 retry_count += 1
                 _LOGGER.info("Connection failed (%s); retrying in %ss", exc, self._reconnect_delay)
@@ -321,6 +469,129 @@ class MySkodaMqttClient:
                 if _is_auth_failure(exc):
                     await self._refresh_fcm_token_after_auth_failure()
 
+    async def add_vehicle(self, vin: str) -> None:
+        """Receive events of vin as well, without reconnecting.
+
+        Subscribes right away when connected. The vehicle is subscribed to again whenever the
+        client reconnects.
+        """
+        if vin in self.vehicle_vins:
+            return
+        self.vehicle_vins.append(vin)
+        if self._client is None:
+            return
+        try:
+            await self._subscribe_vehicles(self._client, [vin])
+        except aiomqtt.MqttError as exc:
+            _LOGGER.info("Subscribing to %s failed (%s), will retry on reconnect", vin, exc)
+
+    async def remove_vehicle(self, vin: str) -> None:
+        """Stop receiving events of vin, without reconnecting."""
+        if vin not in self.vehicle_vins:
+            return
+        self.vehicle_vins.remove(vin)
+        if self._client is None:
+            return
+        try:
+            await self._unsubscribe_vehicles(self._client, [vin])
+        except aiomqtt.MqttError as exc:
+            _LOGGER.info("Unsubscribing from %s failed (%s), dropped on reconnect", vin, exc)
+
+    def _topic_filters(self, vin: str) -> list[str]:
+        assert self.user_id is not None
+        if self.subscription_mode == SubscriptionMode.WILDCARD:
+            return [f"{self.user_id}/{vin}/#"]
+        return vehicle_topics(self.user_id, vin)
+
+    async def _resume_or_subscribe(self, client: AbstractMqttClientWrapper) -> None:
+        """Subscribe to all vehicles after connecting, unless the session was resumed.
+
+        A resumed session still holds its subscriptions, so only vehicles added or removed
+        while disconnected need to be (un)subscribed.
+        """
+        self._resumed_at = None
+        if not self.session_expiry:
+            await self._subscribe_all(client)
+            return
+        if not client.session_present or self._session_vins is None:
+            _LOGGER.debug("Starting a new MQTT session")
+            self.session_stats.started += 1
+            await self._subscribe_all(client)
+            return
+
+        _LOGGER.debug("Resumed MQTT session")
+        self.session_stats.resumed += 1
+        self._resumed_at = datetime.now(UTC)
+        if added := [vin for vin in self.vehicle_vins if vin not in self._session_vins]:
+            await self._subscribe_vehicles(client, added)
+        if removed := [vin for vin in self._session_vins if vin not in self.vehicle_vins]:
+            await self._unsubscribe_vehicles(client, removed)
+
+    async def _subscribe_all(self, client: AbstractMqttClientWrapper) -> None:
+        """Subscribe to all vehicles after connecting, including ones added meanwhile."""
+        self._session_vins = set()
+        self.subscription_stats = SubscriptionStats(
+            mode=self.subscription_mode, fallbacks=self.subscription_stats.fallbacks
+        )
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        subscribed: list[str] = []
+        while missing := [vin for vin in self.vehicle_vins if vin not in subscribed]:
+            await self._subscribe_vehicles(client, missing)
+            subscribed += missing
+        self.subscription_stats.duration = loop.time() - start
+        _LOGGER.debug("Subscribed: %s", self.subscription_stats)
+
+    async def _subscribe_vehicles(
+        self, client: AbstractMqttClientWrapper, vins: Sequence[str]
+    ) -> None:
+        """Subscribe to the topics of vins, sending as few SUBSCRIBE packets as possible."""
+        stats = self.subscription_stats
+        if self.subscription_mode == SubscriptionMode.WILDCARD:
+            topics = [f"{self.user_id}/{vin}/#" for vin in vins]
+            if (failed := await self._subscribe_topics(client, topics)) == 0:
+                self._mark_subscribed(vins)
+                return
+            # Topics which are not known explicitly are lost from here on, but that's better
+            # than not receiving anything.
+            _LOGGER.warning("Broker rejected wildcard subscriptions, subscribing to all topics")
+            self.subscription_mode = SubscriptionMode.EXPLICIT
+            stats.mode = SubscriptionMode.EXPLICIT
+            stats.fallbacks += 1
+            stats.failed -= failed
+
+        topics = [topic for vin in vins for topic in self._topic_filters(vin)]
+        if failed := await self._subscribe_topics(client, topics):
+            _LOGGER.warning("Broker rejected %d of %d topic subscriptions", failed, len(topics))
+        self._mark_subscribed(vins)
+
+    async def _unsubscribe_vehicles(
+        self, client: AbstractMqttClientWrapper, vins: Sequence[str]
+    ) -> None:
+        await client.unsubscribe([topic for vin in vins for topic in self._topic_filters(vin)])
+        if self._session_vins is not None:
+            self._session_vins.difference_update(vins)
+
+    def _mark_subscribed(self, vins: Sequence[str]) -> None:
+        if self._session_vins is not None:
+            self._session_vins.update(vins)
+
+    async def _subscribe_topics(
+        self, client: AbstractMqttClientWrapper, topics: Sequence[str]
+    ) -> int:
+        """Subscribe to topics in batches and return how many the broker rejected."""
+        stats = self.subscription_stats
+        failed = 0
+        # Brokers only queue messages of QoS 1 subscriptions for a disconnected session.
+        qos = 1 if self.session_expiry else 0
+        for offset in range(0, len(topics), MQTT_SUBSCRIBE_BATCH_SIZE):
+            batch = [(topic, qos) for topic in topics[offset : offset + MQTT_SUBSCRIBE_BATCH_SIZE]]
+            failed += _subscribe_failures(await client.subscribe(batch))
+            stats.packets += 1
+            stats.topics += len(batch)
+        stats.failed += failed
+        return failed
+
     def _increase_reconnect_backoff(self, retry_count: int) -> None:
         """Exponentially grow `self._reconnect_delay` after the fast-retry window."""
         if retry_count <= MQTT_FAST_RETRY or self._reconnect_delay >= MQTT_MAX_RECONNECT_DELAY:
@@ -358,33 +629,58 @@ class MySkodaMqttClient:
         _LOGGER.info("Refreshed FCM token after MQTT auth failure")
         self._fcm_token = new_token
 
-    def _on_message(self, msg: aiomqtt.Message) -> None:
+    async def _on_message(self, msg: aiomqtt.Message) -> None:
         """Deserialize received MQTT message and emit Event to subscribed callbacks."""
-        # Cast the data from binary string, ignoring empty messages.
-        payload = cast("str", msg.payload)
-        if len(payload) == 0:
+        # The payload is parsed as received, ignoring empty messages.
+        payload = cast("bytes", msg.payload)
+        if not payload:
             return
 
-        topic = str(msg.topic)
+        topic = msg.topic.value
 
         _LOGGER.debug("Message received on topic %s: %s", topic, payload)
 
         try:
-            self._emit(BaseEvent.from_mqtt_message(topic=topic, payload=payload))
+            event = event_from_mqtt_message(topic, payload)
         except Exception as exc:  # noqa: BLE001  pragma: no cover
             _LOGGER.warning("Exception parsing MQTT event: %s", exc)
+            return
+        if self._was_queued(event):
+            self.session_stats.recovered += 1
+        await self._emit(event)
+
+    def _was_queued(self, event: BaseEvent) -> bool:
+        """Check whether event was published before the session was resumed."""
+        if self._resumed_at is None or event.timestamp.tzinfo is None:
+            return False
+        return event.timestamp < self._resumed_at
 
-    def _emit(self, event: BaseEvent) -> None:
-        for callback in self._callbacks:
-            result = callback(event)
-            if result is not None:
-                task = asyncio.create_task(result)
-                background_tasks.add(task)
-                task.add_done_callback(background_tasks.discard)
+    async def _emit(self, event: BaseEvent) -> None:
+        """Schedule the callbacks subscribed to the vehicle and type of event.
 
+        Waits while an `EventQueue` with the BLOCK overflow policy is full.
+        """
         if isinstance(event, OperationEvent):
             self._handle_operation(event)
 
+        routes = self._routes
+        for key in (
+            (event.vin, event.event_type),
+            (event.vin, None),
+            (None, event.event_type),
+            (None, None),
+        ):
+            # Copied, callbacks may unsubscribe while being called.
+            for callback in tuple(routes.get(key, ())):
+                if isinstance(callback, EventQueue):
+                    await callback.put(event)
+                    continue
+                result = callback(event)
+                if result is not None:
+                    task = asyncio.create_task(result)
+                    background_tasks.add(task)
+                    task.add_done_callback(background_tasks.discard)
+
     def _handle_operation(self, event: OperationEvent) -> None:
         if event.status == OperationStatus.IN_PROGRESS:
             _LOGGER.debug(
@@ -392,33 +688,10 @@ class MySkodaMqttClient:
                 event.operation,
                 event.trace_id,
             )
-            return
-
-        _LOGGER.debug(
-            "Operation '%s' for trace id '%s' completed.",
-            event.operation,
-            event.trace_id,
-        )
-        self._handle_operation_completed(event)
-
-    def _handle_operation_completed(self, event: OperationEvent) -> None:
-        listeners = self._operation_listeners
-        self._operation_listeners = []
-        for listener in listeners:
-            if listener.operation_name != event.operation:
-                self._operation_listeners.append(listener)
-                continue
-
-            if event.status == OperationStatus.ERROR:
-                _LOGGER.error(
-                    "Resolving listener for operation '%s' with error '%s'.",
-                    event.operation,
-                    event.error_code,
-                )
-                listener.future.set_exception(OperationFailedError(event))
-            else:
-                if event.status == OperationStatus.COMPLETED_WARNING:
-                    _LOGGER.warning("Operation '%s' completed with warnings.", event.operation)
-
-                _LOGGER.debug("Resolving listener for operation '%s'.", event.operation)
-                listener.future.set_result(event)
+        else:
+            _LOGGER.debug(
+                "Operation '%s' for trace id '%s' completed.",
+                event.operation,
+                event.trace_id,
+            )
+        self.operations.handle(event)
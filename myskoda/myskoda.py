@@ -22,14 +22,24 @@ MQTT event callbacks can also be subscribed for using the subscribe_events metho
 import asyncio
 import logging
 from collections import defaultdict
-from collections.abc import Callable, Coroutine
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Iterable,
+)
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime, timedelta
+from functools import partial
 from ssl import SSLContext
 from traceback import format_exc
 from types import SimpleNamespace
 from typing import Any
 from warnings import deprecated
 
+import jwt
 from aiohttp import ClientSession, TraceConfig, TraceRequestEndParams
 
 from myskoda.anonymize import anonymize_url
@@ -44,17 +54,25 @@ from myskoda.models.fixtures import (
 
 from .__version__ import __version__ as version
 from .auth.authorization import Authorization
+from .auth.token_store import DEFAULT_TOKEN_STORE_KEY, TokenStore
+from .caching import ResponseCache, cache_max_age
 from .const import (
     BASE_URL_SKODA,
     CACHE_CLOCK_SKEW_TOLERANCE_IN_HOURS,
     CACHE_USER_ENDPOINT_IN_HOURS,
     CACHE_VEHICLE_HEALTH_IN_HOURS,
     CLIENT_ID,
+    GARAGE_SYNC_INTERVAL_IN_SECONDS,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_CONCURRENT_REQUESTS_PER_VEHICLE,
     MQTT_OPERATION_TIMEOUT,
     OPERATION_REFRESH_DELAY_SECONDS,
     REDIRECT_URI,
 )
-from .firebase import FirebaseClient
+from .endpoints import CAPABILITY_ENDPOINTS, ENDPOINTS
+from .event_queue import EventQueue
+from .firebase import FcmCredentialStore, FirebaseClient
+from .fleet import FleetLoadReport, StartupReport, VehicleLoadResult
 from .models.air_conditioning import (
     AirConditioning,
     AirConditioningAtUnlock,
@@ -71,15 +89,17 @@ from .models.auxiliary_heating import (
 from .models.charging import ChargeMode, Charging
 from .models.charging_history import ChargingHistory, ChargingSession, ChargingStatistics
 from .models.chargingprofiles import ChargingProfiles
-from .models.common import Vin
+from .models.common import BaseResponse, Vin
 from .models.departure import DepartureInfo, DepartureTimer
 from .models.driving_range import DrivingRange, EngineType
 from .models.driving_score import DrivingScore
 from .models.event import (
     BaseEvent,
+    EventType,
     OperationEvent,
     OperationName,
     OperationStatus,
+    ServiceEvent,
     ServiceEventAccess,
     ServiceEventAirConditioning,
     ServiceEventChangeSoc,
@@ -110,10 +130,13 @@ from .models.user import User
 from .models.vehicle_connection_status import VehicleConnectionStatus
 from .models.vehicle_info import VehicleEquipment, VehicleFullInfo, VehicleInfo, VehicleRenders
 from .models.widget import WidgetResponse
-from .mqtt import MySkodaMqttClient
+from .mqtt import MySkodaMqttClient, SubscriptionMode
+from .planner import EventCoalescer, EventCoalescerStats, RefreshPlanner
+from .rate_limit import RateLimiter
 from .rest_api import GetEndpointResult, OffsetType, RestApi
+from .retry import CircuitOpenError, RetryHandler
 from .utils import async_debounce
-from .vehicle import Vehicle
+from .vehicle import SectionRead, Vehicle, VehicleSection
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -158,6 +181,40 @@ async def trace_response(
 TRACE_CONFIG = TraceConfig()
 TRACE_CONFIG.on_request_end.append(trace_response)
 
+# The section of the vehicle to refresh once an operation completed.
+OPERATION_REFRESH_SECTIONS: dict[OperationName, VehicleSection] = {
+    OperationName.STOP_AIR_CONDITIONING: VehicleSection.AIR_CONDITIONING,
+    OperationName.START_AIR_CONDITIONING: VehicleSection.AIR_CONDITIONING,
+    OperationName.SET_AIR_CONDITIONING_TARGET_TEMPERATURE: VehicleSection.AIR_CONDITIONING,
+    OperationName.START_WINDOW_HEATING: VehicleSection.AIR_CONDITIONING,
+    OperationName.STOP_WINDOW_HEATING: VehicleSection.AIR_CONDITIONING,
+    OperationName.SET_AIR_CONDITIONING_TIMERS: VehicleSection.AIR_CONDITIONING,
+    OperationName.START_AUXILIARY_HEATING: VehicleSection.AUXILIARY_HEATING,
+    OperationName.STOP_AUXILIARY_HEATING: VehicleSection.AUXILIARY_HEATING,
+    OperationName.UPDATE_CHARGE_LIMIT: VehicleSection.CHARGING,
+    OperationName.UPDATE_CARE_MODE: VehicleSection.CHARGING,
+    OperationName.UPDATE_CHARGING_CURRENT: VehicleSection.CHARGING,
+    OperationName.START_CHARGING: VehicleSection.CHARGING,
+    OperationName.STOP_CHARGING: VehicleSection.CHARGING,
+    OperationName.UPDATE_AUTO_UNLOCK_PLUG: VehicleSection.CHARGING,
+    OperationName.LOCK: VehicleSection.STATUS,
+    OperationName.UNLOCK: VehicleSection.STATUS,
+    OperationName.UPDATE_DEPARTURE_TIMERS: VehicleSection.DEPARTURE_INFO,
+}
+
+# The section of the vehicle to refresh on a service event, None for the whole vehicle.
+SERVICE_EVENT_REFRESH_SECTIONS: dict[type[ServiceEvent], VehicleSection | None] = {
+    ServiceEventCharging: VehicleSection.CHARGING,
+    ServiceEventAccess: None,
+    ServiceEventAirConditioning: VehicleSection.AIR_CONDITIONING,
+    ServiceEventDeparture: VehicleSection.POSITIONS,
+}
+
+# Service events which arrive in bursts, only the latest of a burst is applied.
+COALESCED_EVENT_CLASSES: tuple[type[BaseEvent], ...] = (ServiceEventCharging,)
+
+type EventHandler = Callable[[Any], Coroutine[Any, Any, None]]
+
 
 class MySkodaAuthorization(Authorization):
     client_id: str = CLIENT_ID  #  pyright: ignore[reportIncompatibleMethodOverride]
@@ -173,24 +230,82 @@ class MySkoda:
     firebase: FirebaseClient
     ssl_context: SSLContext | None = None
     user: User | None = None
+    startup_report: StartupReport | None = None
     _vehicles: dict[Vin, Vehicle]
     _callbacks: dict[Vin, list[Callable[[Vin], Coroutine[Any, Any, None]]]]
+    _load_timings: dict[Vin, dict[str, float]]
+    _revalidated_at: dict[tuple[Vin, VehicleSection], datetime]
+    _revalidations: dict[tuple[Vin, VehicleSection], asyncio.Task[None]]
+    _refresh_planner: RefreshPlanner
+    _garage_sync_task: asyncio.Task[None] | None = None
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         session: ClientSession,
         ssl_context: SSLContext | None = None,
         mqtt_enabled: bool = True,
+        max_concurrent_requests_per_vehicle: int = MAX_CONCURRENT_REQUESTS_PER_VEHICLE,
+        response_cache: ResponseCache | None = None,
+        token_store: TokenStore | None = None,
+        fcm_credential_store: FcmCredentialStore | None = None,
+        mqtt_subscription_mode: SubscriptionMode = SubscriptionMode.EXPLICIT,
+        mqtt_session_expiry: int | None = None,
+        service_event_window: float = 0,
+        rate_limiter: RateLimiter | None = None,
+        retry_handler: RetryHandler | None = None,
     ) -> None:
+        if max_concurrent_requests_per_vehicle < 1:
+            msg = "max_concurrent_requests_per_vehicle must be at least 1"
+            raise ValueError(msg)
         self._callbacks = defaultdict(list)
         self._vehicles = {}
+        self._load_timings = {}
+        self._revalidated_at = {}
+        self._revalidations = {}
+        self._refresh_planner = RefreshPlanner(self._execute_refresh_plan)
+        self._event_coalescer = (
+            EventCoalescer(self._apply_event, service_event_window)
+            if service_event_window > 0
+            else None
+        )
+        self._max_concurrent_requests_per_vehicle = max_concurrent_requests_per_vehicle
         self.session = session
         self.authorization = MySkodaAuthorization(session)
-        self.rest_api = RestApi(self.session, self.authorization)
+        self.authorization.token_store = token_store
+        self.rest_api = RestApi(
+            self.session, self.authorization, response_cache, rate_limiter, retry_handler
+        )
         self.firebase = FirebaseClient(self.session)
+        self.fcm_credential_store = fcm_credential_store
         self.fcm_token: str | None = None
         self.ssl_context = ssl_context
         self._mqtt_enabled = mqtt_enabled
+        self._mqtt_subscription_mode = mqtt_subscription_mode
+        self._mqtt_session_expiry = mqtt_session_expiry
+        self._event_handlers: dict[type[BaseEvent], EventHandler] = {
+            OperationEvent: self._process_operation_event,
+            ServiceEventChangeSoc: self._process_charging_event,
+            ServiceEventOdometer: self._process_odometer_event,
+            **{
+                event_class: partial(self._refresh_on_event, section)
+                for event_class, section in SERVICE_EVENT_REFRESH_SECTIONS.items()
+            },
+        }
+        self._resolved_event_handlers: dict[type[BaseEvent], EventHandler | None] = {}
+        self._section_refreshers: dict[VehicleSection, Callable[[Vin], Awaitable[None]]] = {
+            VehicleSection.INFO: self._refresh_info,
+            VehicleSection.CHARGING: self._refresh_charging,
+            VehicleSection.STATUS: self._refresh_status,
+            VehicleSection.AIR_CONDITIONING: self._refresh_air_conditioning,
+            VehicleSection.AUXILIARY_HEATING: self._refresh_auxiliary_heating,
+            VehicleSection.POSITIONS: self._refresh_positions,
+            VehicleSection.DRIVING_RANGE: self._refresh_driving_range,
+            VehicleSection.TRIP_STATISTICS: self._refresh_trip_statistics,
+            VehicleSection.SINGLE_TRIP_STATISTICS: self._refresh_single_trip_statistics,
+            VehicleSection.MAINTENANCE: self._refresh_maintenance,
+            VehicleSection.HEALTH: self._refresh_health,
+            VehicleSection.DEPARTURE_INFO: self._refresh_departure_info,
+        }
 
     async def enable_mqtt(self, fcm_token: str | None = None) -> None:
         """If MQTT was not enabled when initializing MySkoda, enable it manually and connect.
@@ -200,20 +315,49 @@ class MySkoda:
                 MQTT_CONNECT_TIMEOUT seconds. The background reconnect loop is torn down
                 and `self.mqtt` is reset to None so callers can safely retry.
         """
+        vins = await self._prepare_mqtt(fcm_token)
+        await self._connect_mqtt(vins)
+
+    async def _prepare_mqtt(self, fcm_token: str | None = None) -> list[str]:
+        """Create the MQTT client and fetch what it needs to connect, returning the VINs.
+
+        The user, the garage and the FCM token are fetched concurrently.
+        """
         self._mqtt_enabled = True
+        if self.startup_report is None:
+            self.startup_report = StartupReport()
+        phases = self.startup_report.phases
+        steps: list[Coroutine[Any, Any, Any]] = [
+            self._timed(phases, "user", [], self.get_user),
+            self._timed(phases, "garage", [], self.list_vehicle_vins),
+        ]
         if not self.mqtt:
             self.fcm_token = fcm_token or self.fcm_token
             self.mqtt = MySkodaMqttClient(
                 authorization=self.authorization,
                 refresh_fcm_token=self._get_fcm_token,
                 ssl_context=self.ssl_context,
+                subscription_mode=self._mqtt_subscription_mode,
+                session_expiry=self._mqtt_session_expiry,
             )
+            # The client fetches the token itself when connecting, this just gets it early.
+            steps.append(self._timed(phases, "fcm", [], self._get_fcm_token))
 
         self.mqtt.subscribe(self._on_mqtt_event)
-        self.user = await self.get_user()
-        vehicles = await self.list_vehicle_vins()
+        self.user, vins, *_ = await self._gather_or_cancel(*steps)
+        return vins
+
+    async def _connect_mqtt(self, vins: list[str]) -> None:
+        assert self.mqtt is not None
+        assert self.user is not None
+        assert self.startup_report is not None
         try:
-            await self.mqtt.connect(self.user.id, vehicles)
+            await self._timed(
+                self.startup_report.phases,
+                "mqtt",
+                [],
+                partial(self.mqtt.connect, self.user.id, vins),
+            )
         except Exception:
             # Ensure callers see a clean "not connected" state on failure so they can retry.
             self.mqtt = None
@@ -225,50 +369,168 @@ class MySkoda:
         password: str | None = None,
         refresh_token: str | None = None,
         fcm_token: str | None = None,
+        load_vehicles: bool = False,
     ) -> None:
         """Authenticate on the rest api and connect to the MQTT broker.
 
         Note:
-            Must provide either 'email' and 'password' or 'refresh_token'.
+            Must provide either 'email' and 'password' or 'refresh_token', unless a
+            `token_store` was given which holds a session that can still be refreshed. The
+            stored session is used instead of logging in, the arguments are only used when
+            nothing usable was stored. Sessions are stored per account, by email or else by
+            the account id in the refresh token.
 
         Params:
             email: MySkoda account email address (username).
             password: MySkoda account password.
             refresh_token: MySkoda API refresh token JWT.
             fcm_token: Firebase Cloud Messaging token, used for MQTT authentication.
+            load_vehicles: Also load all vehicles of the account, while connecting to MQTT.
+                The results are available in `startup_report.fleet`.
+
+        The time spent on each step is recorded in `startup_report`.
         """
-        if not any([refresh_token, (email and password)]):
+        if not any([refresh_token, (email and password), self.authorization.token_store]):
             msg = "'connect() requires refresh_token' or 'email' and 'password' arguments"
             raise TypeError(msg)
 
-        if refresh_token:
-            await self.authorization.authorize_refresh_token(refresh_token)
-            _LOGGER.debug("IDK Authorization via refresh token was successful.")
-
-        if email and password:
-            await self.authorization.authorize(email, password)
-            _LOGGER.debug("IDK Authorization was successful.")
-
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        self.startup_report = StartupReport()
+        await self._timed(
+            self.startup_report.phases,
+            "authorize",
+            [],
+            partial(self._authorize, email, password, refresh_token),
+        )
         self.fcm_token = fcm_token or self.fcm_token
-        if self._mqtt_enabled:
-            await self.enable_mqtt()
+        if not load_vehicles:
+            if self._mqtt_enabled:
+                await self.enable_mqtt()
+        elif self._mqtt_enabled:
+            vins = await self._prepare_mqtt()
+            await self._gather_or_cancel(
+                self._connect_mqtt(vins), self._load_startup_vehicles(vins, start)
+            )
+        else:
+            phases = self.startup_report.phases
+            vins = await self._timed(phases, "garage", [], self.list_vehicle_vins)
+            await self._load_startup_vehicles(vins, start)
+
+        self.startup_report.total = loop.time() - start
         _LOGGER.info("MySkoda connection ready.")
+        _LOGGER.debug("Startup timings: %s", self.startup_report)
+
+    async def _authorize(
+        self, email: str | None, password: str | None, refresh_token: str | None
+    ) -> None:
+        """Restore the stored session or authorize with the given credentials."""
+        key = self._token_store_key(email, refresh_token)
+        self.authorization.token_store_key = key or DEFAULT_TOKEN_STORE_KEY
+        # Without a key of its own, the account can't be told apart from others in the store.
+        if key is not None and await self.authorization.restore_session():
+            _LOGGER.debug("IDK session restored from the token store.")
+        else:
+            if not any([refresh_token, (email and password)]):
+                msg = "No stored session, 'connect()' requires refresh_token or email and password"
+                raise TypeError(msg)
+
+            if refresh_token:
+                await self.authorization.authorize_refresh_token(refresh_token)
+                _LOGGER.debug("IDK Authorization via refresh token was successful.")
+
+            if email and password:
+                await self.authorization.authorize(email, password)
+                _LOGGER.debug("IDK Authorization was successful.")
+
+        if self.authorization.idk_session is not None:
+            self.authorization.start_token_refresher()
+
+    @staticmethod
+    def _token_store_key(email: str | None, refresh_token: str | None) -> str | None:
+        """Return the key of the account in the token store, None if it can't be told.
+
+        Logins by refresh token use the account id the token was issued for, so they never
+        restore the session of another account.
+        """
+        if email:
+            return email
+        if not refresh_token:
+            return DEFAULT_TOKEN_STORE_KEY
+        try:
+            claims = jwt.decode(refresh_token, options={"verify_signature": False})
+        except jwt.PyJWTError:
+            return None
+        return claims.get("sub") or None
+
+    async def _load_startup_vehicles(self, vins: list[str], start: float) -> None:
+        """Load vins into `startup_report.fleet`, noting when the first vehicle is ready."""
+        assert self.startup_report is not None
+        report = self.startup_report
+        fleet = FleetLoadReport()
+        loop = asyncio.get_running_loop()
+        vehicles_start = loop.time()
+        async for result in self.iter_vehicles(vins):
+            if report.time_to_first_state is None and result.success:
+                report.time_to_first_state = loop.time() - start
+            fleet.results.append(result)
+        report.phases["vehicles"] = loop.time() - vehicles_start
+        report.fleet = fleet
+
+    @staticmethod
+    async def _gather_or_cancel(*coros: Coroutine[Any, Any, Any]) -> list[Any]:
+        """Run coros concurrently and return their results, cancelling the others if one fails.
+
+        The cancelled coros have finished by the time the error is raised.
+        """
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                tasks = [task_group.create_task(coro) for coro in coros]
+        except ExceptionGroup as group:
+            # Raise the error itself, as running the steps one by one did.
+            raise group.exceptions[0] from None
+        return [task.result() for task in tasks]
 
     @deprecated("Deprecated. Use `MySkoda.connect()` instead.", category=RuntimeWarning)
     async def connect_with_refresh_token(self, refresh_token: str) -> None:
         """Authenticate using an existing OpenID refresh token and connect MQTT."""
         await self.connect(refresh_token=refresh_token)
 
+    @property
+    def event_coalescer_stats(self) -> EventCoalescerStats | None:
+        """Return how many charging events were coalesced, None if coalescing is disabled."""
+        return self._event_coalescer.stats if self._event_coalescer is not None else None
+
     async def disconnect(self) -> None:
         """Disconnect from the MQTT broker."""
+        self._refresh_planner.cancel()
+        if self._event_coalescer is not None:
+            self._event_coalescer.cancel()
+        self.stop_garage_sync()
+        await self.authorization.stop_token_refresher()
         if self.mqtt:
             await self.mqtt.disconnect()
 
-    def subscribe_events(self, callback: Callable[[BaseEvent], Coroutine[Any, Any, None]]) -> None:
-        """Listen for events emitted by MySkoda's MQTT broker."""
+    def subscribe_events(
+        self,
+        callback: Callable[[BaseEvent], Coroutine[Any, Any, None]] | EventQueue,
+        vins: Iterable[Vin] | None = None,
+        event_types: Iterable[EventType] | None = None,
+    ) -> Callable[[], None]:
+        """Listen for events emitted by MySkoda's MQTT broker.
+
+        Args:
+            callback: Called with every matching event, each call in a new task. Pass an
+                      `EventQueue` to bound the number of events waiting for a slow callback.
+            vins: Only call for events of these vehicles. All vehicles if None.
+            event_types: Only call for events of these types. All types if None.
+
+        Returns:
+            A function which unsubscribes the callback again.
+        """
         if self.mqtt is None:
             raise MqttDisabledError
-        self.mqtt.subscribe(callback=callback)
+        return self.mqtt.subscribe(callback=callback, vins=vins, event_types=event_types)
 
     def subscribe(self, callback: Callable[[BaseEvent], Coroutine[Any, Any, None]]) -> None:
         """See subscribe_events. For backwards compatibility."""
@@ -294,6 +556,65 @@ class MySkoda:
             return []
         return [vehicle.vin for vehicle in garage.vehicles]
 
+    async def sync_garage(self) -> tuple[list[Vin], list[Vin]]:
+        """Pick up vehicles added to or removed from the garage, without reconnecting MQTT.
+
+        Added vehicles are subscribed to on the live MQTT connection, removed ones are
+        unsubscribed from and dropped from the loaded vehicles.
+
+        Returns:
+            The VINs of the added and the removed vehicles.
+        """
+        with cache_max_age(0):
+            vins = await self.list_vehicle_vins()
+        known = list(self.mqtt.vehicle_vins) if self.mqtt else list(self._vehicles)
+        added = [vin for vin in vins if vin not in known]
+        removed = [vin for vin in known if vin not in vins]
+        for vin in added:
+            _LOGGER.info("Vehicle %s was added to the garage", vin)
+            if self.mqtt:
+                await self.mqtt.add_vehicle(vin)
+        for vin in removed:
+            _LOGGER.info("Vehicle %s was removed from the garage", vin)
+            if self.mqtt:
+                await self.mqtt.remove_vehicle(vin)
+            self._vehicles.pop(vin, None)
+        return added, removed
+
+    def start_garage_sync(
+        self,
+        interval: float = GARAGE_SYNC_INTERVAL_IN_SECONDS,
+        on_change: Callable[[list[Vin], list[Vin]], Coroutine[Any, Any, None]] | None = None,
+    ) -> None:
+        """Call `sync_garage` every interval seconds until disconnecting.
+
+        on_change is awaited with the added and removed VINs whenever the garage changed.
+        """
+        self.stop_garage_sync()
+        self._garage_sync_task = asyncio.create_task(
+            self._sync_garage_periodically(interval, on_change)
+        )
+
+    def stop_garage_sync(self) -> None:
+        """Stop checking the garage for changes."""
+        if self._garage_sync_task is not None:
+            self._garage_sync_task.cancel()
+            self._garage_sync_task = None
+
+    async def _sync_garage_periodically(
+        self,
+        interval: float,
+        on_change: Callable[[list[Vin], list[Vin]], Coroutine[Any, Any, None]] | None,
+    ) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                added, removed = await self.sync_garage()
+                if (added or removed) and on_change is not None:
+                    await on_change(added, removed)
+            except Exception:
+                _LOGGER.exception("Checking the garage for changes failed.")
+
     def vehicle(self, vin: Vin) -> Vehicle:
         """Return the currently cached vehicle."""
         if vin in self._vehicles:
@@ -304,27 +625,126 @@ class MySkoda:
         self, vin: Vin, excluded_capabilities: list[CapabilityId] | None = None
     ) -> Vehicle:
         """Load and return a full vehicle based on its capabilities."""
-        capabilities = [
-            CapabilityId.AIR_CONDITIONING,
-            CapabilityId.AUXILIARY_HEATING,
-            CapabilityId.CHARGING,
-            CapabilityId.PARKING_POSITION,
-            CapabilityId.STATE,
-            CapabilityId.TRIP_STATISTICS,
-            CapabilityId.VEHICLE_HEALTH_INSPECTION,
-            CapabilityId.DEPARTURE_TIMERS,
-            CapabilityId.READINESS,
-        ]
+        return await self.get_partial_vehicle(
+            vin, self._vehicle_capabilities(excluded_capabilities)
+        )
+
+    async def get_partial_vehicle(self, vin: Vin, capabilities: list[CapabilityId]) -> Vehicle:
+        """Load and return a partial vehicle, based on list of capabilities.
+
+        Info and maintenance are loaded first, since info determines which capabilities are
+        available. All capability requests are then issued concurrently, with at most
+        `max_concurrent_requests_per_vehicle` HTTP requests in flight at once, even for
+        capabilities which need several of them. A failing capability is logged and does not
+        affect the others.
+
+        The time spent on each request is available afterwards through `load_timings()`.
+        """
+        return await self._load_vehicle(vin, capabilities)
+
+    async def get_vehicles(
+        self,
+        vins: list[Vin],
+        refresh: bool = False,
+        max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
+    ) -> FleetLoadReport:
+        """Load several vehicles concurrently and report which ones succeeded.
+
+        See `iter_vehicles` for the meaning of the arguments.
+        """
+        report = FleetLoadReport()
+        async for result in self.iter_vehicles(vins, refresh, max_concurrent_requests):
+            report.results.append(result)
+        return report
+
+    async def iter_vehicles(
+        self,
+        vins: list[Vin],
+        refresh: bool = False,
+        max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
+    ) -> AsyncGenerator[VehicleLoadResult]:
+        """Load several vehicles concurrently, yielding each one as soon as it is loaded.
+
+        All vehicles share a budget of `max_concurrent_requests` requests in flight, on top of
+        the per-vehicle `max_concurrent_requests_per_vehicle` limit. A vehicle that fails to load
+        is yielded with its error instead of aborting the other ones.
+
+        When `refresh` is True the vehicles are refreshed like `refresh_vehicle` does: health is
+        only fetched when its cached data expired, and update callbacks are notified.
+        """
+        if max_concurrent_requests < 1:
+            msg = "max_concurrent_requests must be at least 1"
+            raise ValueError(msg)
+        budget = asyncio.Semaphore(max_concurrent_requests)
+
+        async def load(vin: Vin) -> VehicleLoadResult:
+            excluded = self._refresh_excluded_capabilities(vin) if refresh else None
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            try:
+                vehicle = await self._load_vehicle(
+                    vin, self._vehicle_capabilities(excluded), budget
+                )
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.warning("Loading vehicle %s failed: %s", vin, err)
+                return VehicleLoadResult(vin=vin, error=err, duration=loop.time() - start)
+            if refresh:
+                self._notify_callbacks(vin)
+            return VehicleLoadResult(
+                vin=vin,
+                vehicle=vehicle,
+                duration=loop.time() - start,
+                timings=self.load_timings(vin),
+            )
+
+        tasks = [asyncio.create_task(load(vin)) for vin in dict.fromkeys(vins)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Loads still running when the caller stops iterating must not outlive the call.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    def _vehicle_capabilities(
+        excluded_capabilities: list[CapabilityId] | None = None,
+    ) -> list[CapabilityId]:
+        """Return the capabilities loaded for a full vehicle."""
+        capabilities = list(CAPABILITY_ENDPOINTS)
 
         if excluded_capabilities:
             capabilities = [c for c in capabilities if c not in excluded_capabilities]
 
-        return await self.get_partial_vehicle(vin, capabilities)
+        return capabilities
 
-    async def get_partial_vehicle(self, vin: Vin, capabilities: list[CapabilityId]) -> Vehicle:
-        """Load and return a partial vehicle, based on list of capabilities."""
-        info = await self.get_info(vin)
-        maintenance = await self.get_maintenance(vin)
+    async def _load_vehicle(
+        self,
+        vin: Vin,
+        capabilities: list[CapabilityId],
+        budget: asyncio.Semaphore | None = None,
+    ) -> Vehicle:
+        """Load a vehicle, optionally sharing a request budget with other vehicles."""
+        limiters = [asyncio.Semaphore(self._max_concurrent_requests_per_vehicle)]
+        if budget is not None:
+            limiters.append(budget)
+        timings: dict[str, float] = {}
+
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                info_task = task_group.create_task(
+                    self._timed(timings, "info", limiters, partial(self.get_info, vin))
+                )
+                maintenance_task = task_group.create_task(
+                    self._timed(
+                        timings, "maintenance", limiters, partial(self.get_maintenance, vin)
+                    )
+                )
+        except ExceptionGroup as group:
+            # Raise the error itself, as loading info and maintenance one by one did.
+            raise group.exceptions[0] from None
+        info, maintenance = info_task.result(), maintenance_task.result()
 
         if vin in self._vehicles:
             self._vehicles[vin].info = info
@@ -332,12 +752,25 @@ class MySkoda:
         else:
             self._vehicles[vin] = Vehicle(info=info, maintenance=maintenance)
 
-        for capa in capabilities:
-            if info.is_capability_available(capa):
-                await self._request_capability_data(vin, capa)
+        async with asyncio.TaskGroup() as task_group:
+            for capa in capabilities:
+                if info.is_capability_available(capa):
+                    # The limiters apply to each request of the capability, not to it as a whole.
+                    request = partial(self._request_capability_data, vin, capa, limiters)
+                    task_group.create_task(self._timed(timings, capa, [], request))
 
+        self._load_timings[vin] = timings
+        _LOGGER.debug("Loaded vehicle %s, request timings: %s", vin, timings)
         return self.vehicle(vin)
 
+    def load_timings(self, vin: Vin) -> dict[str, float]:
+        """Return the time in seconds spent per request during the last load of a vehicle.
+
+        Keys are "info", "maintenance" and the `CapabilityId` of every loaded capability. The time
+        of a capability covers all of its requests, including waiting for a free request slot.
+        """
+        return dict(self._load_timings.get(vin, {}))
+
     async def get_auth_token(self) -> str:
         """Retrieve the main access token for the IDK session."""
         return await self.rest_api.authorization.get_access_token()
@@ -635,183 +1068,154 @@ class MySkoda:
 
     async def start_charging(self, vin: Vin) -> None:
         """Start charging the car."""
-        future = self._wait_for_operation(OperationName.START_CHARGING)
-        await self.rest_api.start_charging(vin)
-        await future
+        async with self._operation(vin, OperationName.START_CHARGING):
+            await self.rest_api.start_charging(vin)
 
     async def stop_charging(self, vin: Vin) -> None:
         """Stop the car from charging."""
-        future = self._wait_for_operation(OperationName.STOP_CHARGING)
-        await self.rest_api.stop_charging(vin)
-        await future
+        async with self._operation(vin, OperationName.STOP_CHARGING):
+            await self.rest_api.stop_charging(vin)
 
     async def set_charge_mode(self, vin: Vin, mode: ChargeMode) -> None:
         """Set the charge mode."""
-        future = self._wait_for_operation(OperationName.UPDATE_CHARGE_MODE)
-        await self.rest_api.set_charge_mode(vin, mode=mode)
-        await future
+        async with self._operation(vin, OperationName.UPDATE_CHARGE_MODE):
+            await self.rest_api.set_charge_mode(vin, mode=mode)
 
     async def honk_flash(self, vin: Vin) -> None:
         """Honk and flash."""
-        future = self._wait_for_operation(OperationName.START_HONK)
-        await self.rest_api.honk_flash(vin, (await self.get_positions(vin)).positions)
-        await future
+        async with self._operation(vin, OperationName.START_HONK):
+            await self.rest_api.honk_flash(vin, (await self.get_positions(vin)).positions)
 
     async def flash(self, vin: Vin) -> None:
         """Flash lights."""
-        future = self._wait_for_operation(OperationName.START_FLASH)
-        await self.rest_api.flash(vin, (await self.get_positions(vin)).positions)
-        await future
+        async with self._operation(vin, OperationName.START_FLASH):
+            await self.rest_api.flash(vin, (await self.get_positions(vin)).positions)
 
     async def wakeup(self, vin: Vin) -> None:
         """Wake the vehicle up. Can be called maximum three times a day."""
-        future = self._wait_for_operation(OperationName.WAKEUP)
-        await self.rest_api.wakeup(vin)
-        await future
+        async with self._operation(vin, OperationName.WAKEUP):
+            await self.rest_api.wakeup(vin)
 
     async def set_reduced_current_limit(self, vin: Vin, reduced: bool) -> None:
         """Enable reducing the current limit by which the car is charged."""
-        future = self._wait_for_operation(OperationName.UPDATE_CHARGING_CURRENT)
-        await self.rest_api.set_reduced_current_limit(vin, reduced=reduced)
-        await future
+        async with self._operation(vin, OperationName.UPDATE_CHARGING_CURRENT):
+            await self.rest_api.set_reduced_current_limit(vin, reduced=reduced)
 
     async def set_battery_care_mode(self, vin: Vin, enabled: bool) -> None:
         """Enable or disable the battery care mode."""
-        future = self._wait_for_operation(OperationName.UPDATE_CARE_MODE)
-        await self.rest_api.set_battery_care_mode(vin, enabled)
-        await future
+        async with self._operation(vin, OperationName.UPDATE_CARE_MODE):
+            await self.rest_api.set_battery_care_mode(vin, enabled)
 
     async def set_auto_unlock_plug(self, vin: Vin, enabled: bool) -> None:
         """Enable or disable auto unlock plug when charged."""
-        future = self._wait_for_operation(OperationName.UPDATE_AUTO_UNLOCK_PLUG)
-        await self.rest_api.set_auto_unlock_plug(vin, enabled)
-        await future
+        async with self._operation(vin, OperationName.UPDATE_AUTO_UNLOCK_PLUG):
+            await self.rest_api.set_auto_unlock_plug(vin, enabled)
 
     async def set_charge_limit(self, vin: Vin, limit: int) -> None:
         """Set the maximum charge limit in percent."""
-        future = self._wait_for_operation(OperationName.UPDATE_CHARGE_LIMIT)
-        await self.rest_api.set_charge_limit(vin, limit)
-        await future
+        async with self._operation(vin, OperationName.UPDATE_CHARGE_LIMIT):
+            await self.rest_api.set_charge_limit(vin, limit)
 
     async def set_minimum_charge_limit(self, vin: Vin, limit: int) -> None:
         """Set minimum battery SoC in percent for departure timer."""
-        future = self._wait_for_operation(OperationName.UPDATE_MINIMAL_SOC)
-        await self.rest_api.set_minimum_charge_limit(vin, limit)
-        await future
+        async with self._operation(vin, OperationName.UPDATE_MINIMAL_SOC):
+            await self.rest_api.set_minimum_charge_limit(vin, limit)
 
     async def stop_window_heating(self, vin: Vin) -> None:
         """Stop heating both the front and rear window."""
-        future = self._wait_for_operation(OperationName.STOP_WINDOW_HEATING)
-        await self.rest_api.stop_window_heating(vin)
-        await future
+        async with self._operation(vin, OperationName.STOP_WINDOW_HEATING):
+            await self.rest_api.stop_window_heating(vin)
 
     async def start_window_heating(self, vin: Vin) -> None:
         """Start heating both the front and rear window."""
-        future = self._wait_for_operation(OperationName.START_WINDOW_HEATING)
-        await self.rest_api.start_window_heating(vin)
-        await future
+        async with self._operation(vin, OperationName.START_WINDOW_HEATING):
+            await self.rest_api.start_window_heating(vin)
 
     async def set_ac_without_external_power(
         self, vin: Vin, settings: AirConditioningWithoutExternalPower
     ) -> None:
         """Enable or disable AC without external power."""
-        future = self._wait_for_operation(OperationName.SET_AIR_CONDITIONING_WITHOUT_EXTERNAL_POWER)
-        await self.rest_api.set_ac_without_external_power(vin, settings)
-        await future
+        async with self._operation(vin, OperationName.SET_AIR_CONDITIONING_WITHOUT_EXTERNAL_POWER):
+            await self.rest_api.set_ac_without_external_power(vin, settings)
 
     async def set_ac_at_unlock(self, vin: Vin, settings: AirConditioningAtUnlock) -> None:
         """Enable or disable AC at unlock."""
-        future = self._wait_for_operation(OperationName.SET_AIR_CONDITIONING_AT_UNLOCK)
-        await self.rest_api.set_ac_at_unlock(vin, settings)
-        await future
+        async with self._operation(vin, OperationName.SET_AIR_CONDITIONING_AT_UNLOCK):
+            await self.rest_api.set_ac_at_unlock(vin, settings)
 
     async def set_windows_heating(self, vin: Vin, settings: WindowHeating) -> None:
         """Enable or disable windows heating with AC."""
-        future = self._wait_for_operation(OperationName.WINDOWS_HEATING)
-        await self.rest_api.set_windows_heating(vin, settings)
-        await future
+        async with self._operation(vin, OperationName.WINDOWS_HEATING):
+            await self.rest_api.set_windows_heating(vin, settings)
 
     async def set_seats_heating(self, vin: Vin, settings: SeatHeating) -> None:
         """Enable or disable seats heating with AC."""
-        future = self._wait_for_operation(OperationName.SET_AIR_CONDITIONING_SEATS_HEATING)
-        await self.rest_api.set_seats_heating(vin, settings)
-        await future
+        async with self._operation(vin, OperationName.SET_AIR_CONDITIONING_SEATS_HEATING):
+            await self.rest_api.set_seats_heating(vin, settings)
 
     async def set_target_temperature(self, vin: Vin, temperature: float) -> None:
         """Set the air conditioning's target temperature in °C."""
-        future = self._wait_for_operation(OperationName.SET_AIR_CONDITIONING_TARGET_TEMPERATURE)
-        await self.rest_api.set_target_temperature(vin, temperature)
-        await future
+        async with self._operation(vin, OperationName.SET_AIR_CONDITIONING_TARGET_TEMPERATURE):
+            await self.rest_api.set_target_temperature(vin, temperature)
 
     async def start_air_conditioning(self, vin: Vin, temperature: float) -> None:
         """Start the air conditioning with the provided target temperature in °C."""
-        future = self._wait_for_operation(OperationName.START_AIR_CONDITIONING)
-        await self.rest_api.start_air_conditioning(vin, temperature)
-        await future
+        async with self._operation(vin, OperationName.START_AIR_CONDITIONING):
+            await self.rest_api.start_air_conditioning(vin, temperature)
 
     async def stop_air_conditioning(self, vin: Vin) -> None:
         """Stop the air conditioning."""
-        future = self._wait_for_operation(OperationName.STOP_AIR_CONDITIONING)
-        await self.rest_api.stop_air_conditioning(vin)
-        await future
+        async with self._operation(vin, OperationName.STOP_AIR_CONDITIONING):
+            await self.rest_api.stop_air_conditioning(vin)
 
     async def start_ventilation(self, vin: Vin) -> None:
         """Start the ventilation."""
-        future = self._wait_for_operation(OperationName.START_ACTIVE_VENTILATION)
-        await self.rest_api.start_ventilation(vin)
-        await future
+        async with self._operation(vin, OperationName.START_ACTIVE_VENTILATION):
+            await self.rest_api.start_ventilation(vin)
 
     async def stop_ventilation(self, vin: Vin) -> None:
         """Start the ventilation."""
-        future = self._wait_for_operation(OperationName.STOP_ACTIVE_VENTILATION)
-        await self.rest_api.stop_ventilation(vin)
-        await future
+        async with self._operation(vin, OperationName.STOP_ACTIVE_VENTILATION):
+            await self.rest_api.stop_ventilation(vin)
 
     async def start_auxiliary_heating(
         self, vin: Vin, spin: str, config: AuxiliaryConfig | None = None
     ) -> None:
         """Start the auxiliary heating with the provided configuration."""
-        future = self._wait_for_operation(OperationName.START_AUXILIARY_HEATING)
-        await self.rest_api.start_auxiliary_heating(vin, spin, config=config)
-        await future
+        async with self._operation(vin, OperationName.START_AUXILIARY_HEATING):
+            await self.rest_api.start_auxiliary_heating(vin, spin, config=config)
 
     async def stop_auxiliary_heating(self, vin: Vin) -> None:
         """Stop the auxiliary heating."""
-        future = self._wait_for_operation(OperationName.STOP_AUXILIARY_HEATING)
-        await self.rest_api.stop_auxiliary_heating(vin)
-        await future
+        async with self._operation(vin, OperationName.STOP_AUXILIARY_HEATING):
+            await self.rest_api.stop_auxiliary_heating(vin)
 
     async def set_ac_timer(self, vin: Vin, timer: AirConditioningTimer) -> None:
         """Send provided air-conditioning timer to the vehicle."""
-        future = self._wait_for_operation(OperationName.SET_AIR_CONDITIONING_TIMERS)
-        await self.rest_api.set_ac_timer(vin, timer)
-        await future
+        async with self._operation(vin, OperationName.SET_AIR_CONDITIONING_TIMERS):
+            await self.rest_api.set_ac_timer(vin, timer)
 
     async def set_auxiliary_heating_timer(
         self, vin: Vin, timer: AuxiliaryHeatingTimer, spin: str
     ) -> None:
         """Send provided auxiliary heating timer to the vehicle."""
-        future = self._wait_for_operation(OperationName.SET_AIR_CONDITIONING_TIMERS)
-        await self.rest_api.set_auxiliary_heating_timer(vin, timer, spin)
-        await future
+        async with self._operation(vin, OperationName.SET_AIR_CONDITIONING_TIMERS):
+            await self.rest_api.set_auxiliary_heating_timer(vin, timer, spin)
 
     async def lock(self, vin: Vin, spin: str) -> None:
         """Lock the car."""
-        future = self._wait_for_operation(OperationName.LOCK)
-        await self.rest_api.lock(vin, spin)
-        await future
+        async with self._operation(vin, OperationName.LOCK):
+            await self.rest_api.lock(vin, spin)
 
     async def unlock(self, vin: Vin, spin: str) -> None:
         """Unlock the car."""
-        future = self._wait_for_operation(OperationName.UNLOCK)
-        await self.rest_api.unlock(vin, spin)
-        await future
+        async with self._operation(vin, OperationName.UNLOCK):
+            await self.rest_api.unlock(vin, spin)
 
     async def set_departure_timer(self, vin: Vin, timer: DepartureTimer) -> None:
         """Send provided departure timer to the vehicle."""
-        future = self._wait_for_operation(OperationName.UPDATE_DEPARTURE_TIMERS)
-        await self.rest_api.set_departure_timer(vin, timer)
-        await future
+        async with self._operation(vin, OperationName.UPDATE_DEPARTURE_TIMERS):
+            await self.rest_api.set_departure_timer(vin, timer)
 
     async def refresh_user(self) -> None:
         """Refresh user data for the provided Vin."""
@@ -834,123 +1238,262 @@ class MySkoda:
         This avoids triggering battery protection, such as in Citigoe and Karoq.
         https://github.com/skodaconnect/homeassistant-myskoda/issues/468
         """
-        excluded_capabilities = []
-        if (vehicle := self._vehicles.get(vin)) and vehicle.health and vehicle.health.timestamp:
-            cache_expiry = vehicle.health.timestamp + timedelta(hours=CACHE_VEHICLE_HEALTH_IN_HOURS)
+        await self._refresh_vehicle(vin, notify)
 
-            if datetime.now(UTC) > cache_expiry:
-                _LOGGER.debug("Refreshing health - cache expired at %s", cache_expiry)
-            else:
-                _LOGGER.debug("Skipping health refresh - cache is still valid.")
-                excluded_capabilities.append(CapabilityId.VEHICLE_HEALTH_INSPECTION)
+    @async_debounce(immediate=True)
+    async def refresh_info(self, vin: Vin, notify: bool = True) -> None:
+        """Refresh info data for the provided Vin."""
+        await self._refresh_info(vin, notify)
+
+    @async_debounce(immediate=True)
+    async def refresh_charging(self, vin: Vin, notify: bool = True) -> None:
+        """Refresh charging data for the provided Vin."""
+        await self._refresh_charging(vin, notify)
+
+    @async_debounce(immediate=True)
+    async def refresh_status(self, vin: Vin, notify: bool = True) -> None:
+        """Refresh status data for the provided Vin."""
+        await self._refresh_status(vin, notify)
+
+    @async_debounce(immediate=True)
+    async def refresh_air_conditioning(self, vin: Vin, notify: bool = True) -> None:
+        """Refresh air_conditioning data for the provided Vin."""
+        await self._refresh_air_conditioning(vin, notify)
+
+    @async_debounce(immediate=True)
+    async def refresh_auxiliary_heating(self, vin: Vin, notify: bool = True) -> None:
+        """Refresh auxiliary_heating data for the provided Vin."""
+        await self._refresh_auxiliary_heating(vin, notify)
+
+    @async_debounce(immediate=True)
+    async def refresh_positions(self, vin: Vin, notify: bool = True) -> None:
+        """Refresh positions data for the provided Vin."""
+        await self._refresh_positions(vin, notify)
+
+    @async_debounce(immediate=True)
+    async def refresh_driving_range(self, vin: Vin, notify: bool = True) -> None:
+        """Refresh driving_range data for the provided Vin."""
+        await self._refresh_driving_range(vin, notify)
 
+    @async_debounce(immediate=True)
+    async def refresh_trip_statistics(
+        self,
+        vin: Vin,
+        notify: bool = True,
+        offset: int = 0,
+        offset_type: OffsetType = OffsetType.WEEK,
+    ) -> None:
+        """Refresh trip_statistics data for the provided Vin."""
+        await self._refresh_trip_statistics(vin, notify, offset, offset_type)
+
+    @async_debounce(immediate=True)
+    async def refresh_single_trip_statistics(self, vin: Vin, notify: bool = True) -> None:
+        """Refresh single_trip_statistics data for the provided Vin."""
+        await self._refresh_single_trip_statistics(vin, notify)
+
+    @async_debounce(immediate=True)
+    async def refresh_maintenance(self, vin: Vin, notify: bool = True) -> None:
+        """Refresh maintenance data for the provided Vin."""
+        await self._refresh_maintenance(vin, notify)
+
+    @async_debounce(immediate=True)
+    async def refresh_maintenance_report(self, vin: Vin, notify: bool = True) -> None:
+        """Refresh only the maintenance report for the provided Vin."""
+        await self._refresh_maintenance_report(vin, notify)
+
+    @async_debounce(immediate=True)
+    async def refresh_health(self, vin: Vin, notify: bool = True) -> None:
+        """Refresh health data for the provided Vin."""
+        await self._refresh_health(vin, notify)
+
+    @async_debounce(immediate=True)
+    async def refresh_departure_info(self, vin: Vin, notify: bool = True) -> None:
+        """Refresh departure_info data for the provided Vin."""
+        await self._refresh_departure_info(vin, notify)
+
+    # The refresh_ methods without debounce, for callers which deduplicate requests themselves.
+
+    async def _refresh_vehicle(self, vin: Vin, notify: bool = True) -> None:
+        excluded_capabilities = self._refresh_excluded_capabilities(vin)
         self._vehicles[vin] = await self.get_vehicle(vin, excluded_capabilities)
 
         if notify:
             self._notify_callbacks(vin)
 
-    @async_debounce(immediate=True)
-    async def refresh_info(self, vin: Vin, notify: bool = True) -> None:
-        """Refresh info data for the provided Vin."""
+    async def _refresh_info(self, vin: Vin, notify: bool = True) -> None:
         self._vehicles[vin].info = await self.get_info(vin)
         if notify:
             self._notify_callbacks(vin)
 
-    @async_debounce(immediate=True)
-    async def refresh_charging(self, vin: Vin, notify: bool = True) -> None:
-        """Refresh charging data for the provided Vin."""
+    async def _refresh_charging(self, vin: Vin, notify: bool = True) -> None:
         if self._vehicles[vin].update_charging(await self.get_charging(vin)) and notify:
             self._notify_callbacks(vin)
 
-    @async_debounce(immediate=True)
-    async def refresh_status(self, vin: Vin, notify: bool = True) -> None:
-        """Refresh status data for the provided Vin."""
+    async def _refresh_status(self, vin: Vin, notify: bool = True) -> None:
         if self._vehicles[vin].update_status(await self.get_status(vin)) and notify:
             self._notify_callbacks(vin)
 
-    @async_debounce(immediate=True)
-    async def refresh_air_conditioning(self, vin: Vin, notify: bool = True) -> None:
-        """Refresh air_conditioning data for the provided Vin."""
+    async def _refresh_air_conditioning(self, vin: Vin, notify: bool = True) -> None:
         if (
             self._vehicles[vin].update_air_conditioning(await self.get_air_conditioning(vin))
             and notify
         ):
             self._notify_callbacks(vin)
 
-    @async_debounce(immediate=True)
-    async def refresh_auxiliary_heating(self, vin: Vin, notify: bool = True) -> None:
-        """Refresh auxiliary_heating data for the provided Vin."""
+    async def _refresh_auxiliary_heating(self, vin: Vin, notify: bool = True) -> None:
         if (
             self._vehicles[vin].update_auxiliary_heating(await self.get_auxiliary_heating(vin))
             and notify
         ):
             self._notify_callbacks(vin)
 
-    @async_debounce(immediate=True)
-    async def refresh_positions(self, vin: Vin, notify: bool = True) -> None:
-        """Refresh positions data for the provided Vin."""
+    async def _refresh_positions(self, vin: Vin, notify: bool = True) -> None:
         self._vehicles[vin].positions = await self.get_positions(vin)
         if notify:
             self._notify_callbacks(vin)
 
-    @async_debounce(immediate=True)
-    async def refresh_driving_range(self, vin: Vin, notify: bool = True) -> None:
-        """Refresh driving_range data for the provided Vin."""
+    async def _refresh_driving_range(self, vin: Vin, notify: bool = True) -> None:
         if self._vehicles[vin].update_driving_range(await self.get_driving_range(vin)) and notify:
             self._notify_callbacks(vin)
 
-    @async_debounce(immediate=True)
-    async def refresh_trip_statistics(
+    async def _refresh_trip_statistics(
         self,
         vin: Vin,
         notify: bool = True,
         offset: int = 0,
         offset_type: OffsetType = OffsetType.WEEK,
     ) -> None:
-        """Refresh trip_statistics data for the provided Vin."""
         self._vehicles[vin].trip_statistics = await self.get_trip_statistics(
             vin, offset=offset, offset_type=offset_type
         )
         if notify:
             self._notify_callbacks(vin)
 
-    @async_debounce(immediate=True)
-    async def refresh_single_trip_statistics(self, vin: Vin, notify: bool = True) -> None:
-        """Refresh single_trip_statistics data for the provided Vin."""
+    async def _refresh_single_trip_statistics(self, vin: Vin, notify: bool = True) -> None:
         self._vehicles[vin].single_trip_statistics = await self.get_single_trip_statistics(vin)
         if notify:
             self._notify_callbacks(vin)
 
-    @async_debounce(immediate=True)
-    async def refresh_maintenance(self, vin: Vin, notify: bool = True) -> None:
-        """Refresh maintenance data for the provided Vin."""
+    async def _refresh_maintenance(self, vin: Vin, notify: bool = True) -> None:
         self._vehicles[vin].maintenance = await self.get_maintenance(vin)
         if notify:
             self._notify_callbacks(vin)
 
-    @async_debounce(immediate=True)
-    async def refresh_maintenance_report(self, vin: Vin, notify: bool = True) -> None:
-        """Refresh only the maintenance report for the provided Vin."""
+    async def _refresh_maintenance_report(self, vin: Vin, notify: bool = True) -> None:
         self._vehicles[vin].maintenance.maintenance_report = await self.get_maintenance_report(vin)
         if notify:
             self._notify_callbacks(vin)
 
-    @async_debounce(immediate=True)
-    async def refresh_health(self, vin: Vin, notify: bool = True) -> None:
-        """Refresh health data for the provided Vin."""
+    async def _refresh_health(self, vin: Vin, notify: bool = True) -> None:
         self._vehicles[vin].health = await self.get_health(vin)
         if notify:
             self._notify_callbacks(vin)
 
-    @async_debounce(immediate=True)
-    async def refresh_departure_info(self, vin: Vin, notify: bool = True) -> None:
-        """Refresh departure_info data for the provided Vin."""
+    async def _refresh_departure_info(self, vin: Vin, notify: bool = True) -> None:
         if (
             self._vehicles[vin].update_departure_info(await self.get_departure_timers(vin))
             and notify
         ):
             self._notify_callbacks(vin)
 
+    async def read_section(
+        self,
+        vin: Vin,
+        section: VehicleSection,
+        soft_ttl: timedelta,
+        hard_ttl: timedelta | None = None,
+    ) -> SectionRead[Any]:
+        """Return a section of a loaded vehicle without waiting for the API if possible.
+
+        Data younger than soft_ttl is returned as is. Older data is returned right away as
+        well, while the section is refreshed in the background; registered callbacks are
+        notified once that refresh changed something. Missing data and data older than
+        hard_ttl is refreshed before returning.
+        """
+        vehicle = self.vehicle(vin)
+        age = self._section_age(vehicle, section)
+        if age is None or (hard_ttl is not None and age > hard_ttl):
+            await asyncio.shield(self._revalidate_section(vin, section))
+            return SectionRead(getattr(vehicle, section), self._section_age(vehicle, section))
+
+        if age > soft_ttl:
+            self._revalidate_section(vin, section)
+        return SectionRead(getattr(vehicle, section), age, (vin, section) in self._revalidations)
+
+    def _section_age(self, vehicle: Vehicle, section: VehicleSection) -> timedelta | None:
+        value: BaseResponse | None = getattr(vehicle, section, None)
+        if value is None:
+            return None
+        # update_* keep the previous object if the car did not report anything newer, so the
+        # last refresh may be more recent than the timestamp of the stored data.
+        fetched_at = value.timestamp
+        if (revalidated_at := self._revalidated_at.get((vehicle.info.vin, section))) is not None:
+            fetched_at = max(fetched_at, revalidated_at)
+        return datetime.now(UTC) - fetched_at
+
+    def _revalidate_section(self, vin: Vin, section: VehicleSection) -> asyncio.Task[None]:
+        """Start refreshing a section, or return the refresh already running for it."""
+        key = (vin, section)
+        if (task := self._revalidations.get(key)) is not None:
+            return task
+
+        async def revalidate() -> None:
+            await self._refresh_now(vin, section)
+            self._revalidated_at[key] = datetime.now(UTC)
+
+        def finish(task: asyncio.Task[None]) -> None:
+            self._revalidations.pop(key, None)
+            if not task.cancelled() and (err := task.exception()) is not None:
+                _LOGGER.warning("Failed to revalidate %s of %s: %s", section, vin, err)
+
+        task = asyncio.create_task(revalidate())
+        self._revalidations[key] = task
+        task.add_done_callback(finish)
+        return task
+
+    async def schedule_refresh(self, vin: Vin, *sections: VehicleSection) -> None:
+        """Refresh sections of the vehicle, or the whole vehicle if none given, in a merged plan.
+
+        Unlike the individual refresh_ methods, refreshes requested for the same vehicle in
+        short succession are merged: sections covered by a planned full refresh are dropped and
+        the planned refresh is never postponed by more than DEFAULT_DEBOUNCE_MAX_WAIT_SECONDS.
+        """
+        await self._refresh_planner.request(vin, *sections)
+
+    async def _execute_refresh_plan(
+        self, vin: Vin, sections: frozenset[VehicleSection] | None
+    ) -> None:
+        if sections is None:
+            await self._refresh_now(vin, None)
+            return
+        async with asyncio.TaskGroup() as task_group:
+            for section in sections:
+                task_group.create_task(self._refresh_now(vin, section))
+
+    async def _refresh_now(self, vin: Vin, section: VehicleSection | None) -> None:
+        """Run refresh_vehicle or refresh_<section> right away.
+
+        Bypasses the debounce of the refresh_ methods: callers deduplicate requests themselves
+        and a debounced call may return before anything was fetched.
+        """
+        if section is None:
+            await self._refresh_vehicle(vin)
+        else:
+            await self._section_refreshers[section](vin)
+
+    def _refresh_excluded_capabilities(self, vin: Vin) -> list[CapabilityId]:
+        """Return the capabilities whose cached data is still valid for a vehicle refresh."""
+        excluded_capabilities = []
+        if (vehicle := self._vehicles.get(vin)) and vehicle.health and vehicle.health.timestamp:
+            cache_expiry = vehicle.health.timestamp + timedelta(hours=CACHE_VEHICLE_HEALTH_IN_HOURS)
+
+            if datetime.now(UTC) > cache_expiry:
+                _LOGGER.debug("Refreshing health - cache expired at %s", cache_expiry)
+            else:
+                _LOGGER.debug("Skipping health refresh - cache is still valid.")
+                excluded_capabilities.append(CapabilityId.VEHICLE_HEALTH_INSPECTION)
+        return excluded_capabilities
+
     async def generate_fixture_report(
         self, vin: Vin, vehicle: FixtureVehicle, endpoint: Endpoint
     ) -> FixtureReportGet:
@@ -980,32 +1523,11 @@ class MySkoda:
         self, vin: Vin, endpoint: Endpoint, anonymize: bool = False
     ) -> GetEndpointResult[Any]:
         """Invoke a get endpoint by endpoint enum."""
-        # Mapping of endpoints to corresponding methods
-        endpoint_method_map = {
-            Endpoint.INFO: self.rest_api.get_info,
-            Endpoint.STATUS: self.rest_api.get_status,
-            Endpoint.AIR_CONDITIONING: self.rest_api.get_air_conditioning,
-            Endpoint.AUXILIARY_HEATING: self.rest_api.get_auxiliary_heating,
-            Endpoint.POSITIONS: self.rest_api.get_positions,
-            Endpoint.HEALTH: self.rest_api.get_health,
-            Endpoint.CHARGING: self.rest_api.get_charging,
-            Endpoint.CHARGING_PROFILES: self.rest_api.get_charging_profiles,
-            Endpoint.MAINTENANCE: self.rest_api.get_maintenance,
-            Endpoint.DRIVING_RANGE: self.rest_api.get_driving_range,
-            Endpoint.TRIP_STATISTICS: self.rest_api.get_trip_statistics,
-            Endpoint.DEPARTURE_INFO: self.rest_api.get_departure_timers,
-            Endpoint.VEHICLE_CONNECTION_STATUS: self.rest_api.get_vehicle_connection_status,
-            Endpoint.DRIVING_SCORE: self.rest_api.get_driving_score,
-        }
-
-        # Look up the method, or raise an error if unsupported
-        method = endpoint_method_map.get(endpoint)
-        if not method:
+        spec = ENDPOINTS.get(endpoint)
+        if spec is None:
             error_message = f"Unsupported endpoint: {endpoint}"
             raise UnsupportedEndpointError(error_message)
-
-        # Call the method and return the result
-        return await method(vin, anonymize=anonymize)
+        return await self.rest_api.fetch(spec, anonymize, vin=vin)
 
     async def generate_get_fixture(
         self, name: str, description: str, vins: list[str], endpoint: Endpoint
@@ -1036,75 +1558,85 @@ class MySkoda:
             library_version=version,
         )
 
-    async def _request_capability_data(self, vin: Vin, capa: CapabilityId) -> None:
-        """Request specific capability data from MySkoda API."""
-        capa_request_map = {
-            CapabilityId.AIR_CONDITIONING: self._request_air_conditioning,
-            CapabilityId.AUXILIARY_HEATING: self._request_auxiliary_heating,
-            CapabilityId.CHARGING: self._request_charging,
-            CapabilityId.PARKING_POSITION: self._request_positions,
-            CapabilityId.STATE: self._request_state,
-            CapabilityId.TRIP_STATISTICS: self._request_trip_statistics,
-            CapabilityId.VEHICLE_HEALTH_INSPECTION: self._request_health,
-            CapabilityId.DEPARTURE_TIMERS: self._request_departure_info,
-            CapabilityId.READINESS: self._request_connection_status,
-        }
+    async def _request_capability_data(
+        self, vin: Vin, capa: CapabilityId, limiters: list[asyncio.Semaphore] | None = None
+    ) -> None:
+        """Request the endpoints of a capability and store their results in the vehicle.
 
+        Each request waits for all limiters. If one request fails, the others are cancelled and
+        nothing is stored.
+        """
+        endpoints = CAPABILITY_ENDPOINTS.get(capa, ())
         try:
-            request_fn = capa_request_map.get(capa)
-            if request_fn:
-                await request_fn(vin)
-        except Exception as err:  # noqa: BLE001
-            _LOGGER.warning("Requesting %s failed: %s, continue", capa, err)
-
-    async def _request_air_conditioning(self, vin: Vin) -> None:
-        """Update state with air conditioning data."""
-        self._vehicles[vin].air_conditioning = await self.get_air_conditioning(vin)
-
-    async def _request_auxiliary_heating(self, vin: Vin) -> None:
-        """Update state with auxiliary heating data."""
-        self._vehicles[vin].auxiliary_heating = await self.get_auxiliary_heating(vin)
-
-    async def _request_charging(self, vin: Vin) -> None:
-        """Update state with charging data."""
-        self._vehicles[vin].charging = await self.get_charging(vin)
-
-    async def _request_positions(self, vin: Vin) -> None:
-        """Update state with parking position data."""
-        self._vehicles[vin].positions = await self.get_positions(vin)
-
-    async def _request_state(self, vin: Vin) -> None:
-        """Update state with state and driving range data."""
-        self._vehicles[vin].status = await self.get_status(vin)
-        self._vehicles[vin].driving_range = await self.get_driving_range(vin)
-
-    async def _request_trip_statistics(self, vin: Vin) -> None:
-        """Update state with trip statistics data."""
-        self._vehicles[vin].trip_statistics = await self.get_trip_statistics(vin)
-        self._vehicles[vin].single_trip_statistics = await self.get_single_trip_statistics(vin)
+            async with asyncio.TaskGroup() as task_group:
+                tasks = [
+                    task_group.create_task(
+                        self._limited(
+                            limiters or [], partial(self.rest_api.fetch, endpoint, vin=vin)
+                        )
+                    )
+                    for endpoint in endpoints
+                ]
+        except ExceptionGroup as group:
+            if all(isinstance(err, CircuitOpenError) for err in group.exceptions):
+                _LOGGER.debug("Skipping %s: %s", capa, group.exceptions[0])
+            else:
+                _LOGGER.warning("Requesting %s failed: %s, continue", capa, group.exceptions[0])
+            return
+        for endpoint, task in zip(endpoints, tasks, strict=True):
+            if endpoint.attribute is not None:
+                setattr(self._vehicles[vin], endpoint.attribute, task.result().result)
 
-    async def _request_health(self, vin: Vin) -> None:
-        """Update state with vehicle health inspection data."""
-        self._vehicles[vin].health = await self.get_health(vin)
+    @staticmethod
+    async def _limited[T](limiters: list[asyncio.Semaphore], func: Callable[[], Awaitable[T]]) -> T:
+        """Await func() once all limiters allow it.
 
-    async def _request_departure_info(self, vin: Vin) -> None:
-        """Update state with departure timer data."""
-        self._vehicles[vin].departure_info = await self.get_departure_timers(vin)
+        Taking a function rather than a coroutine, nothing is left unawaited when the task
+        running this is cancelled before it starts.
+        """
+        if limiters:
+            async with limiters[0]:
+                return await MySkoda._limited(limiters[1:], func)
+        return await func()
 
-    async def _request_connection_status(self, vin: Vin) -> None:
-        """Update state with connection status data."""
-        self._vehicles[vin].connection_status = await self.get_connection_status(vin)
+    @staticmethod
+    async def _timed[T](
+        timings: dict[str, float],
+        name: str,
+        limiters: list[asyncio.Semaphore],
+        func: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Await func() once all limiters allow it, recording its duration in timings[name]."""
+        if limiters:
+            return await MySkoda._limited(
+                limiters, partial(MySkoda._timed, timings, name, [], func)
+            )
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        try:
+            return await func()
+        finally:
+            timings[name] = loop.time() - start
 
-    async def _request_software_update_status(self, vin: Vin) -> None:
-        """Update state with software update status."""
-        self._vehicles[vin].software_update_status = await self.get_software_update_status(vin)
+    @asynccontextmanager
+    async def _operation(self, vin: Vin, operation: OperationName) -> AsyncIterator[None]:
+        """Send the request in the block, then wait for operation on vin to complete.
 
-    async def _wait_for_operation(self, operation: OperationName) -> None:
+        The listener is registered before the request is sent, so a fast confirmation via MQTT
+        can't slip through while the request is still in flight. It is cancelled if the request
+        fails, and expires after MQTT_OPERATION_TIMEOUT otherwise.
+        """
         if self.mqtt is None:
+            yield
             return
+        future = self.mqtt.wait_for_operation(operation, vin, timeout=MQTT_OPERATION_TIMEOUT)
         try:
-            async with asyncio.timeout(MQTT_OPERATION_TIMEOUT):
-                await self.mqtt.wait_for_operation(operation)
+            yield
+        except BaseException:
+            future.cancel()
+            raise
+        try:
+            await future
         except TimeoutError:
             _LOGGER.warning("Timeout occurred while waiting for %s. Aborted.", operation)
 
@@ -1120,16 +1652,35 @@ class MySkoda:
     async def _get_fcm_token(self, force_refresh: bool = False) -> str:
         """Get FCM Token from Google and register it with MySkoda.
 
+        A registration saved in `fcm_credential_store` is reused until it expires, then only
+        the FCM token is renewed. force_refresh, used when the broker rejects the token,
+        always registers from scratch.
+
         Returns:
             The new FCM Token.
         """
         if self.fcm_token and not force_refresh:
             return self.fcm_token
 
-        fcm_token = await self.firebase.get_fcm_token()
-        await self.rest_api.register_fcm_token(fcm_token=fcm_token)
-        self.fcm_token = fcm_token
-        return fcm_token
+        store = self.fcm_credential_store
+        key = self.authorization.token_store_key
+        previous = None
+        if store is not None and not force_refresh:
+            previous = await store.load(key)
+            if previous is not None and not previous.is_expired():
+                _LOGGER.debug("Reusing stored FCM registration.")
+                self.fcm_token = previous.fcm_token
+                return previous.fcm_token
+
+        credentials = await self.firebase.register(previous)
+        await self.rest_api.register_fcm_token(fcm_token=credentials.fcm_token)
+        self.fcm_token = credentials.fcm_token
+        if store is not None:
+            try:
+                await store.save(key, credentials)
+            except Exception:
+                _LOGGER.exception("Failed to save FCM credentials.")
+        return credentials.fcm_token
 
     async def _on_mqtt_event(self, event: BaseEvent) -> None:
         """Handle MQTT events.
@@ -1140,20 +1691,40 @@ class MySkoda:
             _LOGGER.debug("Received event for unknown VIN %s", event)
             return
 
-        if isinstance(event, OperationEvent):
-            await self._process_operation_event(event)
-        elif isinstance(event, ServiceEventChangeSoc):
-            await self._process_charging_event(event)
-        elif isinstance(event, ServiceEventCharging):
-            await self.refresh_charging(event.vin)
-        elif isinstance(event, ServiceEventAccess):
-            await self.refresh_vehicle(event.vin)
-        elif isinstance(event, ServiceEventAirConditioning):
-            await self.refresh_air_conditioning(event.vin)
-        elif isinstance(event, ServiceEventDeparture):
-            await self.refresh_positions(event.vin)
-        elif isinstance(event, ServiceEventOdometer):
-            await self.refresh_maintenance_report(event.vin)
+        # Whatever changed, cached live data of this vehicle can't be trusted anymore.
+        self.rest_api.invalidate_cache(event.vin)
+
+        if self._event_coalescer is not None and isinstance(event, COALESCED_EVENT_CLASSES):
+            self._event_coalescer.submit(event)
+        else:
+            await self._apply_event(event)
+
+    async def _apply_event(self, event: BaseEvent) -> None:
+        """Update the vehicle with the event, or refresh the data it is about."""
+        if (handler := self._event_handler(type(event))) is not None:
+            await handler(event)
+
+    def _event_handler(self, event_class: type[BaseEvent]) -> EventHandler | None:
+        """Return the handler for the most specific class of event_class which has one."""
+        if event_class not in self._resolved_event_handlers:
+            self._resolved_event_handlers[event_class] = next(
+                (
+                    self._event_handlers[cls]
+                    for cls in event_class.__mro__
+                    if cls in self._event_handlers
+                ),
+                None,
+            )
+        return self._resolved_event_handlers[event_class]
+
+    async def _refresh_on_event(self, section: VehicleSection | None, event: BaseEvent) -> None:
+        if section is None:
+            await self.schedule_refresh(event.vin)
+        else:
+            await self.schedule_refresh(event.vin, section)
+
+    async def _process_odometer_event(self, event: ServiceEventOdometer) -> None:
+        await self.schedule_refresh(event.vin, VehicleSection.MAINTENANCE)
 
     async def _process_operation_event(self, event: OperationEvent) -> None:
         """Refresh the appropriate vehicle data based on the operation details."""
@@ -1171,36 +1742,8 @@ class MySkoda:
         # a little bit before refreshing data. Magic numbers are bad but there is no way for us
         # to know when the backend has updated data...
         await asyncio.sleep(OPERATION_REFRESH_DELAY_SECONDS)
-        if event.operation in [
-            OperationName.STOP_AIR_CONDITIONING,
-            OperationName.START_AIR_CONDITIONING,
-            OperationName.SET_AIR_CONDITIONING_TARGET_TEMPERATURE,
-            OperationName.START_WINDOW_HEATING,
-            OperationName.STOP_WINDOW_HEATING,
-            OperationName.SET_AIR_CONDITIONING_TIMERS,
-        ]:
-            await self.refresh_air_conditioning(event.vin)
-        elif event.operation in [
-            OperationName.START_AUXILIARY_HEATING,
-            OperationName.STOP_AUXILIARY_HEATING,
-        ]:
-            await self.refresh_auxiliary_heating(event.vin)
-        elif event.operation in [
-            OperationName.UPDATE_CHARGE_LIMIT,
-            OperationName.UPDATE_CARE_MODE,
-            OperationName.UPDATE_CHARGING_CURRENT,
-            OperationName.START_CHARGING,
-            OperationName.STOP_CHARGING,
-            OperationName.UPDATE_AUTO_UNLOCK_PLUG,
-        ]:
-            await self.refresh_charging(event.vin)
-        elif event.operation in [
-            OperationName.LOCK,
-            OperationName.UNLOCK,
-        ]:
-            await self.refresh_status(event.vin)
-        elif event.operation == OperationName.UPDATE_DEPARTURE_TIMERS:
-            await self.refresh_departure_info(event.vin)
+        if (section := OPERATION_REFRESH_SECTIONS.get(event.operation)) is not None:
+            await self.schedule_refresh(event.vin, section)
 
     async def _process_charging_event(self, event: ServiceEventChangeSoc) -> None:
         """Update self._vehicles with data from the event.
@@ -1208,10 +1751,14 @@ class MySkoda:
         Start by fully refreshing Vehicle.charging and Vehicle.driving_range as the endpoints
         may return updated data which is not included in the event. At the same time, the event
         may have more recent data so still apply data extracted from the event on top...
+
+        The refreshes are planned like any other, so they may run after the event was applied.
+        They only replace the data if the car reported something newer since.
         """
         _LOGGER.debug("Processing charging event: %s", event)
-        await self.refresh_charging(event.vin, notify=False)
-        await self.refresh_driving_range(event.vin, notify=False)
+        await self.schedule_refresh(
+            event.vin, VehicleSection.CHARGING, VehicleSection.DRIVING_RANGE
+        )
 
         vehicle = self._vehicles[event.vin]
         if charging := vehicle.charging:
@@ -0,0 +1,165 @@
+"""Match operation events from the MQTT broker to the requests waiting for them."""
+
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from .models.event import OperationEvent, OperationName, OperationStatus
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class OperationFailedError(Exception):  # pragma: no cover
+    def __init__(self, event: OperationEvent) -> None:
+        op = event.operation
+        error = event.error_code
+        trace = event.trace_id
+        super().__init__(f"Operation {op} with trace {trace} failed: {error}")
+
+
+@dataclass
+class OperationTrackerStats:
+    """Counters for an `OperationTracker`.
+
+    `unmatched` counts completed operations nobody was waiting for, `expired` counts waits
+    which timed out before the operation completed.
+    """
+
+    tracked: int = 0
+    resolved: int = 0
+    failed: int = 0
+    expired: int = 0
+    unmatched: int = 0
+
+
+@dataclass(eq=False)
+class PendingOperation:
+    """An operation a caller is waiting for.
+
+    `vin` is None when waiting for the operation on any vehicle. `trace_id` is set once the
+    broker reported the operation in progress.
+    """
+
+    operation: OperationName
+    vin: str | None
+    future: asyncio.Future[OperationEvent] = field(repr=False)
+    started_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    trace_id: str | None = None
+
+
+class OperationTracker:
+    """Track pending operations by vehicle, operation name and trace id.
+
+    Events are matched by trace id first, then to the oldest pending operation of that name
+    for the vehicle, and finally to one waiting for that operation on any vehicle. Operations
+    are forgotten as soon as their future is done, including when it times out or is cancelled.
+    """
+
+    def __init__(self) -> None:
+        self._by_operation: dict[tuple[str | None, OperationName], deque[PendingOperation]] = {}
+        self._by_trace_id: dict[str, PendingOperation] = {}
+        self._expiries: dict[PendingOperation, asyncio.TimerHandle] = {}
+        self.stats = OperationTrackerStats()
+
+    def wait(
+        self, operation: OperationName, vin: str | None = None, timeout: float | None = None
+    ) -> asyncio.Future[OperationEvent]:
+        """Return a future resolving with the event completing operation.
+
+        The future fails with `OperationFailedError` if the operation failed, or with
+        `TimeoutError` if it didn't complete within timeout seconds.
+        """
+        loop = asyncio.get_running_loop()
+        pending = PendingOperation(operation, vin, loop.create_future())
+        self._by_operation.setdefault((vin, operation), deque()).append(pending)
+        if timeout is not None:
+            self._expiries[pending] = loop.call_later(timeout, self._expire, pending)
+        pending.future.add_done_callback(lambda _future: self._forget(pending))
+        self.stats.tracked += 1
+        return pending.future
+
+    def pending(self, vin: str | None = None) -> list[PendingOperation]:
+        """Return the pending operations, optionally only those for vin."""
+        return [
+            pending
+            for (pending_vin, _operation), queue in self._by_operation.items()
+            if vin is None or pending_vin == vin
+            for pending in queue
+        ]
+
+    def handle(self, event: OperationEvent) -> None:
+        """Process an operation event, resolving the matching pending operation if it ended."""
+        if event.status == OperationStatus.IN_PROGRESS:
+            self._bind(event)
+            return
+
+        pending = self._match(event)
+        if pending is None:
+            self.stats.unmatched += 1
+            _LOGGER.debug("Nobody is waiting for operation '%s'.", event.operation)
+            return
+
+        self._forget(pending)
+        if event.status == OperationStatus.ERROR:
+            _LOGGER.error(
+                "Resolving listener for operation '%s' with error '%s'.",
+                event.operation,
+                event.error_code,
+            )
+            self.stats.failed += 1
+            pending.future.set_exception(OperationFailedError(event))
+        else:
+            if event.status == OperationStatus.COMPLETED_WARNING:
+                _LOGGER.warning("Operation '%s' completed with warnings.", event.operation)
+            _LOGGER.debug("Resolving listener for operation '%s'.", event.operation)
+            self.stats.resolved += 1
+            pending.future.set_result(event)
+
+    def cancel(self) -> None:
+        """Cancel all pending operations."""
+        for pending in self.pending():
+            pending.future.cancel()
+
+    def _bind(self, event: OperationEvent) -> None:
+        """Attach the trace id of an operation in progress to the oldest unbound waiter."""
+        if event.trace_id in self._by_trace_id:
+            return
+        for key in ((event.vin, event.operation), (None, event.operation)):
+            for pending in self._by_operation.get(key, ()):
+                if pending.trace_id is None:
+                    pending.trace_id = event.trace_id
+                    self._by_trace_id[event.trace_id] = pending
+                    return
+
+    def _match(self, event: OperationEvent) -> PendingOperation | None:
+        # Futures cancelled by their caller are only forgotten once the loop ran the callback.
+        pending = self._by_trace_id.get(event.trace_id)
+        if pending is not None and not pending.future.done():
+            return pending
+        for key in ((event.vin, event.operation), (None, event.operation)):
+            for pending in self._by_operation.get(key, ()):
+                if not pending.future.done():
+                    return pending
+        return None
+
+    def _expire(self, pending: PendingOperation) -> None:
+        if pending.future.done():
+            return
+        self.stats.expired += 1
+        self._forget(pending)
+        pending.future.set_exception(TimeoutError(f"Timed out waiting for {pending.operation}"))
+        # Nobody may be awaiting the future anymore, e.g. when the request itself failed.
+        pending.future.exception()
+
+    def _forget(self, pending: PendingOperation) -> None:
+        if (expiry := self._expiries.pop(pending, None)) is not None:
+            expiry.cancel()
+        key = (pending.vin, pending.operation)
+        if (queue := self._by_operation.get(key)) is not None and pending in queue:
+            queue.remove(pending)
+            if not queue:
+                del self._by_operation[key]
+        if pending.trace_id is not None and self._by_trace_id.get(pending.trace_id) is pending:
+            del self._by_trace_id[pending.trace_id]
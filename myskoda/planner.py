@@ -0,0 +1,196 @@
+"""Merge refresh requests and events for a vehicle into as few API calls as possible."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from .const import DEFAULT_DEBOUNCE_MAX_WAIT_SECONDS, DEFAULT_DEBOUNCE_WAIT_SECONDS
+from .models.common import Vin
+from .models.event import BaseEvent
+from .vehicle import VehicleSection
+
+_LOGGER = logging.getLogger(__name__)
+
+# Called with the sections to refresh, or None to refresh the whole vehicle.
+type RefreshExecutor = Callable[[Vin, frozenset[VehicleSection] | None], Awaitable[None]]
+type EventApplier = Callable[[BaseEvent], Awaitable[None]]
+
+
+@dataclass
+class RefreshPlannerStats:
+    """Counters for a `RefreshPlanner`.
+
+    `merged` counts requests which joined a pending refresh, `absorbed` counts section
+    refreshes which were dropped because a full refresh of the vehicle was pending.
+    """
+
+    requests: int = 0
+    executions: int = 0
+    merged: int = 0
+    absorbed: int = 0
+
+
+@dataclass
+class _Plan:
+    sections: set[VehicleSection] = field(default_factory=set)
+    full: bool = False
+    task: asyncio.Task | None = None
+    deadline: float | None = None
+    last_execution_time: float = float("-inf")
+
+    @property
+    def pending(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+
+class RefreshPlanner:
+    """Plan refreshes per vehicle.
+
+    The first request for a vehicle is executed right away. Requests arriving within 'wait'
+    seconds after that are merged into a single delayed refresh, which is postponed by every
+    new request but never by more than 'max_wait' seconds. Section refreshes are dropped when a
+    refresh of the whole vehicle is planned anyway.
+    """
+
+    def __init__(
+        self,
+        execute: RefreshExecutor,
+        wait: float = DEFAULT_DEBOUNCE_WAIT_SECONDS,
+        max_wait: float = DEFAULT_DEBOUNCE_MAX_WAIT_SECONDS,
+    ) -> None:
+        self._execute = execute
+        self._wait = wait
+        self._max_wait = max_wait
+        self._plans: dict[Vin, _Plan] = {}
+        self._running: set[asyncio.Task] = set()
+        self.stats = RefreshPlannerStats()
+
+    def pending(self, vin: Vin) -> frozenset[VehicleSection] | None:
+        """Return the sections planned for vin, None for a full refresh or nothing planned."""
+        plan = self._plans.get(vin)
+        if plan is None or not plan.pending or plan.full:
+            return None
+        return frozenset(plan.sections)
+
+    async def request(self, vin: Vin, *sections: VehicleSection) -> None:
+        """Request a refresh of sections of the vehicle, or the whole vehicle if none given."""
+        now = asyncio.get_running_loop().time()
+        self.stats.requests += 1
+        self._prune(now)
+        plan = self._plans.setdefault(vin, _Plan())
+
+        if not plan.pending and now - plan.last_execution_time >= self._wait:
+            plan.last_execution_time = now
+            self.stats.executions += 1
+            await self._execute(vin, frozenset(sections) or None)
+            return
+
+        if plan.pending:
+            self.stats.merged += 1
+            assert plan.task is not None
+            plan.task.cancel()
+        if not sections:
+            self.stats.absorbed += len(plan.sections)
+            plan.sections.clear()
+            plan.full = True
+        elif plan.full:
+            self.stats.absorbed += len(sections)
+        else:
+            plan.sections.update(sections)
+
+        if plan.deadline is None:
+            plan.deadline = now + self._max_wait
+        delay = max(0.0, min(self._wait, plan.deadline - now))
+        plan.task = asyncio.create_task(self._execute_later(vin, plan, delay))
+
+    async def _execute_later(self, vin: Vin, plan: _Plan, delay: float) -> None:
+        await asyncio.sleep(delay)
+        sections = None if plan.full else frozenset(plan.sections)
+        # Reset the plan before executing it, so requests coming in meanwhile start a new one
+        # instead of cancelling this refresh.
+        task = plan.task
+        plan.sections, plan.full, plan.task, plan.deadline = set(), False, None, None
+        plan.last_execution_time = asyncio.get_running_loop().time()
+        if task is not None:
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+        self.stats.executions += 1
+        try:
+            await self._execute(vin, sections)
+        except Exception:
+            _LOGGER.exception("Planned refresh of %s failed", vin)
+
+    def _prune(self, now: float) -> None:
+        """Forget vehicles without a planned refresh whose wait time has passed."""
+        idle = [
+            vin
+            for vin, plan in self._plans.items()
+            if not plan.pending and now - plan.last_execution_time >= self._wait
+        ]
+        for vin in idle:
+            del self._plans[vin]
+
+    def cancel(self) -> None:
+        """Cancel all planned refreshes and the planned refreshes already running."""
+        for plan in self._plans.values():
+            if plan.pending and plan.task is not None:
+                plan.task.cancel()
+        for task in self._running:
+            task.cancel()
+        self._plans.clear()
+
+
+@dataclass
+class EventCoalescerStats:
+    """Counters for an `EventCoalescer`.
+
+    `folded` counts events which were superseded by a later event within the window.
+    """
+
+    received: int = 0
+    applied: int = 0
+    folded: int = 0
+
+
+class EventCoalescer:
+    """Apply only the latest event per vehicle and event class of a burst.
+
+    The first event starts a window of 'window' seconds. Events of the same class for the same
+    vehicle arriving within it replace the pending one, which is applied when the window ends.
+    """
+
+    def __init__(self, apply: EventApplier, window: float) -> None:
+        self._apply = apply
+        self._window = window
+        self._pending: dict[tuple[str, type[BaseEvent]], BaseEvent] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self.stats = EventCoalescerStats()
+
+    def submit(self, event: BaseEvent) -> None:
+        """Apply event at the end of its window, unless a later one replaces it."""
+        self.stats.received += 1
+        key = (event.vin, type(event))
+        if key in self._pending:
+            self.stats.folded += 1
+            self._pending[key] = event
+            return
+        self._pending[key] = event
+        task = asyncio.create_task(self._apply_later(key))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _apply_later(self, key: tuple[str, type[BaseEvent]]) -> None:
+        await asyncio.sleep(self._window)
+        event = self._pending.pop(key)
+        self.stats.applied += 1
+        try:
+            await self._apply(event)
+        except Exception:
+            _LOGGER.exception("Applying coalesced %s failed", type(event).__name__)
+
+    def cancel(self) -> None:
+        """Drop all pending events."""
+        for task in self._tasks:
+            task.cancel()
+        self._pending.clear()
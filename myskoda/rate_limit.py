@@ -0,0 +1,199 @@
+"""Client side rate limiting of requests to the MySkoda API.
+
+Requests queue on token buckets before they are sent: one shared by every account using the
+same `RateLimiter`, one per account, one per vehicle and one per class of endpoint. When the
+API answers with a `Retry-After` header, the bucket of the account is paused for that long.
+"""
+
+import asyncio
+import re
+import time
+from collections.abc import Callable, Hashable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from enum import StrEnum
+from types import MappingProxyType
+
+from .const import (
+    RATE_LIMIT_ACCOUNT_BURST,
+    RATE_LIMIT_ACCOUNT_PER_SECOND,
+    RATE_LIMIT_GLOBAL_BURST,
+    RATE_LIMIT_GLOBAL_PER_SECOND,
+    RATE_LIMIT_VIN_BURST,
+    RATE_LIMIT_VIN_PER_SECOND,
+    RATE_LIMIT_WRITE_BURST,
+    RATE_LIMIT_WRITE_PER_SECOND,
+)
+
+# A VIN as path segment or query parameter of an API URL.
+_VIN_IN_URL = re.compile(r"(?:/|\bvin=)([A-Z0-9]{16,17})(?=[/?&]|$)")
+
+
+class EndpointClass(StrEnum):
+    """Requests which only read data, and those which change the state of a vehicle."""
+
+    READ = "read"
+    WRITE = "write"
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Allow `per_second` requests on average, and bursts of up to `burst` requests."""
+
+    per_second: float
+    burst: int
+
+
+@dataclass
+class RateLimiterStats:
+    """Counters for a `RateLimiter`.
+
+    `throttled` counts requests which had to wait for a token, `wait_time` is the time they
+    waited in total, in seconds. `retry_after` counts responses whose `Retry-After` header
+    paused an account.
+    """
+
+    requests: int = 0
+    throttled: int = 0
+    wait_time: float = 0.0
+    max_wait: float = 0.0
+    retry_after: int = 0
+
+
+DEFAULT_GLOBAL_LIMIT = RateLimit(RATE_LIMIT_GLOBAL_PER_SECOND, RATE_LIMIT_GLOBAL_BURST)
+DEFAULT_ACCOUNT_LIMIT = RateLimit(RATE_LIMIT_ACCOUNT_PER_SECOND, RATE_LIMIT_ACCOUNT_BURST)
+DEFAULT_VIN_LIMIT = RateLimit(RATE_LIMIT_VIN_PER_SECOND, RATE_LIMIT_VIN_BURST)
+DEFAULT_CLASS_LIMITS: Mapping[EndpointClass, RateLimit] = MappingProxyType(
+    {EndpointClass.WRITE: RateLimit(RATE_LIMIT_WRITE_PER_SECOND, RATE_LIMIT_WRITE_BURST)}
+)
+
+
+def vin_from_url(url: str) -> str | None:
+    """Return the VIN a request URL refers to, if any."""
+    match = _VIN_IN_URL.search(url)
+    return match.group(1) if match else None
+
+
+def parse_retry_after(value: str | None, now: datetime | None = None) -> float | None:
+    """Return the seconds to wait according to a `Retry-After` header, in either format."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        until = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (until - (now or datetime.now(UTC))).total_seconds())
+
+
+class TokenBucket:
+    """A token bucket callers wait on in the order they arrive."""
+
+    def __init__(self, limit: RateLimit, clock: Callable[[], float] = time.monotonic) -> None:
+        if limit.per_second <= 0 or limit.burst < 1:
+            msg = "per_second must be positive and burst at least 1"
+            raise ValueError(msg)
+        self.limit = limit
+        self._clock = clock
+        self._tokens = float(limit.burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def delay(self, cost: float = 1) -> float:
+        """Return how long a request of cost has to wait for its tokens."""
+        now = self._clock()
+        self._tokens = min(
+            self.limit.burst, self._tokens + (now - self._updated) * self.limit.per_second
+        )
+        self._updated = now
+        missing = min(cost, self.limit.burst) - self._tokens
+        return max(self._paused_until - now, missing / self.limit.per_second, 0.0)
+
+    async def acquire(self, cost: float = 1) -> float:
+        """Take cost tokens, waiting for them if needed, and return the time waited."""
+        waited = 0.0
+        async with self._lock:
+            while (delay := self.delay(cost)) > 0:
+                waited += delay
+                await asyncio.sleep(delay)
+            self._tokens -= min(cost, self.limit.burst)
+        return waited
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for the next seconds."""
+        self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+
+class RateLimiter:
+    """Token buckets requests queue on before they are sent.
+
+    Share one limiter between several `MySkoda` instances to limit their requests in total as
+    well. Write requests additionally queue on the bucket of their `EndpointClass`, a request
+    takes as many tokens as the cost of its endpoint.
+    """
+
+    def __init__(
+        self,
+        global_limit: RateLimit | None = DEFAULT_GLOBAL_LIMIT,
+        account_limit: RateLimit | None = DEFAULT_ACCOUNT_LIMIT,
+        vin_limit: RateLimit | None = DEFAULT_VIN_LIMIT,
+        class_limits: Mapping[EndpointClass, RateLimit] = DEFAULT_CLASS_LIMITS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._clock = clock
+        self._global = TokenBucket(global_limit, clock) if global_limit else None
+        self._account_limit = account_limit
+        self._vin_limit = vin_limit
+        self._class_limits = dict(class_limits)
+        self._buckets: dict[Hashable, TokenBucket] = {}
+        self.stats = RateLimiterStats()
+
+    async def acquire(
+        self,
+        account: Hashable,
+        vin: str | None = None,
+        endpoint_class: EndpointClass = EndpointClass.READ,
+        cost: float = 1,
+    ) -> None:
+        """Wait until a request of account for vin may be sent."""
+        waited = 0.0
+        for bucket in self._buckets_for(account, vin, endpoint_class):
+            waited += await bucket.acquire(cost)
+        self.stats.requests += 1
+        if waited > 0:
+            self.stats.throttled += 1
+            self.stats.wait_time += waited
+            self.stats.max_wait = max(self.stats.max_wait, waited)
+
+    def retry_after(self, account: Hashable, seconds: float) -> None:
+        """Pause the requests of account, as asked for by a `Retry-After` header."""
+        self.stats.retry_after += 1
+        bucket = self._bucket(("account", account), self._account_limit) or self._global
+        if bucket is not None:
+            bucket.pause(seconds)
+
+    def _buckets_for(
+        self, account: Hashable, vin: str | None, endpoint_class: EndpointClass
+    ) -> list[TokenBucket]:
+        buckets = [
+            self._global,
+            self._bucket(("account", account), self._account_limit),
+            self._bucket(("vin", vin), self._vin_limit) if vin else None,
+            self._bucket(
+                ("class", account, endpoint_class), self._class_limits.get(endpoint_class)
+            ),
+        ]
+        return [bucket for bucket in buckets if bucket is not None]
+
+    def _bucket(self, key: Hashable, limit: RateLimit | None) -> TokenBucket | None:
+        if limit is None:
+            return None
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(limit, self._clock)
+        return bucket
@@ -3,57 +3,75 @@
 import asyncio
 import json
 import logging
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import StrEnum
-from urllib.parse import quote, urlencode
+from functools import cached_property
+from typing import Any
 
+import orjson
 from aiohttp import ClientResponseError, ClientSession
+from mashumaro.mixins.dict import DataClassDictMixin
 
 from myskoda.anonymize import (
-    anonymize_air_conditioning,
-    anonymize_auxiliary_heating,
-    anonymize_charging,
-    anonymize_chargingprofiles,
-    anonymize_departure_timers,
-    anonymize_driving_range,
-    anonymize_driving_score,
-    anonymize_garage,
-    anonymize_health,
     anonymize_info,
-    anonymize_loyalty_program_badge,
-    anonymize_loyalty_program_badges,
-    anonymize_loyalty_program_challenges,
-    anonymize_loyalty_program_details,
-    anonymize_loyalty_program_games,
-    anonymize_loyalty_program_member,
-    anonymize_loyalty_program_rewards,
-    anonymize_loyalty_program_salesforce_contacts,
-    anonymize_loyalty_program_transactions,
-    anonymize_maintenance,
-    anonymize_parking_position,
-    anonymize_positions,
-    anonymize_single_trip_statistics,
-    anonymize_software_update_status,
-    anonymize_status,
-    anonymize_trip_statistics,
     anonymize_url,
-    anonymize_user,
-    anonymize_vehicle_connection_status,
-    anonymize_vehicle_equipment,
-    anonymize_vehicle_info,
-    anonymize_vehicle_renders,
-    anonymize_widget,
 )
 
 from .auth.authorization import Authorization
+from .caching import (
+    Generations,
+    ResponseCache,
+    ResponseCacheStats,
+    SingleFlight,
+    SingleFlightStats,
+    current_max_age,
+)
 from .const import (
     BASE_URL_CHARGING,
     BASE_URL_SKODA,
     MYSKODA_APP_VERSION,
     REQUEST_TIMEOUT_IN_SECONDS,
 )
+from .endpoints import (
+    AIR_CONDITIONING,
+    AUXILIARY_HEATING,
+    CHARGING,
+    CHARGING_HISTORY,
+    CHARGING_PROFILES,
+    DEPARTURE_INFO,
+    DRIVING_RANGE,
+    DRIVING_SCORE,
+    EQUIPMENT,
+    GARAGE,
+    HEALTH,
+    INFO,
+    LOYALTY_PROGRAM_BADGE,
+    LOYALTY_PROGRAM_BADGES,
+    LOYALTY_PROGRAM_CHALLENGES,
+    LOYALTY_PROGRAM_DETAILS,
+    LOYALTY_PROGRAM_GAMES,
+    LOYALTY_PROGRAM_MEMBER,
+    LOYALTY_PROGRAM_REWARDS,
+    LOYALTY_PROGRAM_SALESFORCE_CONTACTS,
+    LOYALTY_PROGRAM_TRANSACTIONS,
+    MAINTENANCE,
+    MAINTENANCE_REPORT,
+    PARKING_POSITION,
+    POSITIONS,
+    RENDERS,
+    SINGLE_TRIP_STATISTICS,
+    SOFTWARE_UPDATE_STATUS,
+    STATUS,
+    TRIP_STATISTICS,
+    USER,
+    VEHICLE_CONNECTION_STATUS,
+    VEHICLE_INFO,
+    WIDGET,
+    EndpointSpec,
+)
 from .models.air_conditioning import (
     AirConditioning,
     AirConditioningAtUnlock,
@@ -71,7 +89,7 @@ from .models.charging_history import (
     ChargingStatisticsRequest,
 )
 from .models.chargingprofiles import ChargingProfiles
-from .models.common import Vin
+from .models.common import BaseResponse, Vin
 from .models.departure import DepartureInfo, DepartureTimer
 from .models.driving_range import DrivingRange
 from .models.driving_score import DrivingScore
@@ -99,17 +117,60 @@ from .models.user import User
 from .models.vehicle_connection_status import VehicleConnectionStatus
 from .models.vehicle_info import VehicleEquipment, VehicleInfo, VehicleRenders
 from .models.widget import WidgetResponse
+from .rate_limit import (
+    EndpointClass,
+    RateLimiter,
+    RateLimiterStats,
+    parse_retry_after,
+    vin_from_url,
+)
+from .retry import RetryHandler, RetryStats
 from .utils import to_iso8601
 
 _LOGGER = logging.getLogger(__name__)
 
+# Responses whose Retry-After header pauses the requests of the account.
+RETRY_AFTER_STATUSES = frozenset({429, 503})
+
+
+@contextmanager
+def _logging_request_errors(url: str, method: str) -> Iterator[None]:
+    try:
+        yield
+    except TimeoutError:  # pragma: no cover
+        _LOGGER.exception("Timeout while sending %s request to %s", method, url)
+        raise
+    except ClientResponseError as err:  # pragma: no cover
+        _LOGGER.exception("Invalid status for %s request to %s: %d", method, url, err.status)
+        raise
 
-@dataclass
+
+@dataclass(init=False)
 class GetEndpointResult[T]:
+    """The deserialized response of an endpoint, and the payload it was built from.
+
+    The payload is the response body, or the anonymized data parsed from it. The response text
+    is still accepted as `raw`, as it was before the payload was kept undecoded.
+    """
+
     url: str
-    raw: str
+    payload: str | bytes | dict = field(repr=False)
     result: T
 
+    def __init__(self, url: str, raw: str | bytes | dict, result: T) -> None:
+        self.url = url
+        self.payload = raw
+        self.result = result
+
+    @cached_property
+    def raw(self) -> str:
+        """Return the payload as text, decoded or serialized only when asked for."""
+        if isinstance(self.payload, str):
+            return self.payload
+        if isinstance(self.payload, dict):
+            return json.dumps(self.payload)
+        return self.payload.decode()
+
 
 class OffsetType(StrEnum):
     WEEK = "week"
@@ -121,59 +182,221 @@ class RestApi:
 
     session: ClientSession
     authorization: Authorization
+    cache: ResponseCache | None
+    rate_limiter: RateLimiter | None
+    retry_handler: RetryHandler | None
+    _single_flight: SingleFlight[bytes]
+    _generations: Generations
 
-    def __init__(self, session: ClientSession, authorization: Authorization) -> None:
+    def __init__(
+        self,
+        session: ClientSession,
+        authorization: Authorization,
+        cache: ResponseCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_handler: RetryHandler | None = None,
+    ) -> None:
         self.session = session
         self.authorization = authorization
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry_handler = retry_handler
+        self._single_flight = SingleFlight()
+        self._generations = Generations()
 
     def process_json(
         self,
-        data: str,
+        data: bytes,
         anonymize: bool,
-        anonymization_fn: Callable[[dict], dict],
-    ) -> str:
-        """Process the raw json returned by the API with some preprocessor logic."""
+        anonymization_fn: Callable[[dict], dict] | None,
+    ) -> bytes | dict:
+        """Process the raw json returned by the API with some preprocessor logic.
+
+        Anonymized data is returned as a dict, so that it is not parsed again to build the model.
+        """
         if not anonymize:
             return data
-        parsed = json.loads(data)
-        anonymized = anonymization_fn(parsed)
-        return json.dumps(anonymized)
+        if anonymization_fn is None:
+            msg = "This endpoint can't be anonymized"
+            raise ValueError(msg)
+        return anonymization_fn(orjson.loads(data))
 
-    async def _make_request(self, url: str, method: str, json: dict | None = None) -> str:
-        try:
-            async with asyncio.timeout(REQUEST_TIMEOUT_IN_SECONDS):
-                async with self.session.request(
-                    method=method,
-                    url=f"{BASE_URL_SKODA}/api{url}",
-                    headers=await self._headers(),
-                    json=json,
-                ) as response:
-                    await response.text()  # Ensure response is fully read
-                    response.raise_for_status()
-                    return await response.text()
-        except TimeoutError:  # pragma: no cover
-            _LOGGER.exception("Timeout while sending %s request to %s", method, url)
-            raise
-        except ClientResponseError as err:  # pragma: no cover
-            _LOGGER.exception("Invalid status for %s request to %s: %d", method, url, err.status)
-            raise
+    async def fetch[T: DataClassDictMixin](
+        self,
+        endpoint: EndpointSpec[T],
+        anonymize: bool = False,
+        params: Mapping[str, Any] | None = None,
+        **path_args: str,
+    ) -> GetEndpointResult[T]:
+        """Request endpoint and parse the response into its model.
+
+        Args:
+            endpoint: the endpoint, see `myskoda.endpoints`
+            anonymize: set to true if personal information should be removed from result
+            params: query parameters overriding the defaults of the endpoint
+            path_args: the arguments of the path, such as vin
+        """
+        return await self._fetch_url(endpoint, endpoint.url(params, **path_args), anonymize)
+
+    async def _fetch_url[T: DataClassDictMixin](
+        self, endpoint: EndpointSpec[T], url: str, anonymize: bool = False
+    ) -> GetEndpointResult[T]:
+        body, fetched_at = await self._get(url, endpoint.cost, endpoint.name)
+        payload = self.process_json(
+            data=body,
+            anonymize=anonymize,
+            anonymization_fn=endpoint.anonymizer,
+        )
+        result = self._deserialize(payload, endpoint.model)
+        if fetched_at is not None and isinstance(result, BaseResponse):
+            # A cached response is as old as when it was fetched, not as when it was parsed.
+            result.timestamp = fetched_at
+        url = anonymize_url(url) if anonymize else url
+        return GetEndpointResult(url, payload, result)
+
+    @property
+    def single_flight_stats(self) -> SingleFlightStats:
+        """Counters of GET requests which were sent upstream (misses) or shared (hits)."""
+        return self._single_flight.stats
+
+    @property
+    def cache_stats(self) -> ResponseCacheStats | None:
+        """Counters of the response cache, or None if caching is disabled."""
+        return self.cache.stats if self.cache is not None else None
+
+    @property
+    def rate_limiter_stats(self) -> RateLimiterStats | None:
+        """Counters of the rate limiter, or None if rate limiting is disabled."""
+        return self.rate_limiter.stats if self.rate_limiter is not None else None
+
+    @property
+    def retry_stats(self) -> RetryStats | None:
+        """Counters of retries and circuit breakers, or None if retrying is disabled."""
+        return self.retry_handler.stats if self.retry_handler is not None else None
+
+    def invalidate_cache(self, vin: Vin | None = None, names: list[str] | None = None) -> None:
+        """Drop cached responses, see `ResponseCache.invalidate`.
+
+        GETs in flight for vin are no longer shared with later requests either.
+        """
+        self._generations.bump(vin)
+        if self.cache is not None:
+            self.cache.invalidate(vin, names)
+
+    async def _make_request(
+        self,
+        url: str,
+        method: str,
+        json: dict | None = None,
+        cost: int = 1,
+        endpoint: str | None = None,
+    ) -> bytes:
+        if method == "GET" and json is None:
+            body, _fetched_at = await self._get(url, cost, endpoint)
+            return body
+        body = await self._send_request(url, method, await self._headers(), json, cost)
+        if (vin := vin_from_url(url)) is not None:
+            self._generations.bump(vin)
+        if self.cache is not None:
+            self.cache.invalidate_url(url)
+        return body
+
+    async def _get(
+        self, url: str, cost: int = 1, endpoint: str | None = None
+    ) -> tuple[bytes, datetime | None]:
+        """Return the body of a GET request, and when it was fetched if it is from the cache."""
+        if self.cache is not None:
+            cached = self.cache.get(url, current_max_age())
+            if cached is not None:
+                return cached.body, cached.fetched_at
+        cache_generation = self.cache.generation(url) if self.cache is not None else None
+        headers = await self._headers()
+        # Concurrent identical GETs for the same token share a single upstream request, unless
+        # it was sent before the data of the vehicle was invalidated.
+        generation = self._generations.current(vin_from_url(url))
+        key = ("GET", url, headers["authorization"], generation)
+        body = await self._single_flight.run(
+            key, lambda: self._send_idempotent(url, "GET", cost, endpoint)
+        )
+        if self.cache is not None:
+            self.cache.put(url, body, generation=cache_generation)
+        return body, None
+
+    async def _send_request(
+        self,
+        url: str,
+        method: str,
+        headers: dict[str, str],
+        json: dict | None = None,
+        cost: int = 1,
+    ) -> bytes:
+        with _logging_request_errors(url, method):
+            return await self._send(url, method, headers, json, cost)
+
+    async def _send(
+        self, url: str, method: str, headers: dict[str, str], json: dict | None, cost: int
+    ) -> bytes:
+        # Queue on the rate limiter before the timeout starts, waiting is not the API's fault.
+        endpoint_class = EndpointClass.READ if method == "GET" else EndpointClass.WRITE
+        await self._throttle(url, endpoint_class, cost)
+        async with asyncio.timeout(REQUEST_TIMEOUT_IN_SECONDS):
+            async with self.session.request(
+                method=method,
+                url=f"{BASE_URL_SKODA}/api{url}",
+                headers=headers,
+                json=json,
+            ) as response:
+                body = await response.read()  # Ensure response is fully read
+                self._handle_retry_after(response.status, response.headers)
+                response.raise_for_status()
+                return body
+
+    async def _send_idempotent(
+        self, url: str, method: str, cost: int, endpoint: str | None
+    ) -> bytes:
+        """Send a request which may be repeated, retrying it if a retry handler is set.
+
+        Only the final failure is logged as an error, the retry handler logs failed attempts.
+        """
+        if self.retry_handler is None:
+            return await self._send_request(url, method, await self._headers(), cost=cost)
+
+        async def attempt() -> bytes:
+            # The token may have been refreshed while waiting for a retry.
+            return await self._send(url, method, await self._headers(), None, cost)
+
+        # One circuit per endpoint and vehicle, requests outside the registry by their path.
+        key = (endpoint or url.split("?", 1)[0], vin_from_url(url))
+        with _logging_request_errors(url, method):
+            return await self.retry_handler.run(key, attempt)
 
     async def raw_request(self, url: str, method: str, json: dict | None = None) -> str:
         """Send an authenticated request to the given API path."""
-        return await self._make_request(url=url, method=method, json=json)
+        return (await self._make_request(url=url, method=method, json=json)).decode()
 
-    async def _make_get_request[T](self, url: str) -> str:
-        return await self._make_request(url=url, method="GET")
+    async def _make_get_request(
+        self, url: str, cost: int = 1, endpoint: str | None = None
+    ) -> bytes:
+        return await self._make_request(url=url, method="GET", cost=cost, endpoint=endpoint)
 
-    async def _make_post_request(self, url: str, json: dict | None = None) -> str:
+    async def _make_post_request(self, url: str, json: dict | None = None) -> bytes:
         return await self._make_request(url=url, method="POST", json=json)
 
-    async def _make_put_request(self, url: str, json: dict | None = None) -> str:
+    async def _make_put_request(self, url: str, json: dict | None = None) -> bytes:
         return await self._make_request(url=url, method="PUT", json=json)
 
-    async def _make_charging_post_request(self, path: str, json: dict | None = None) -> str:
-        """POST to the cariad charging service. Path is appended to BASE_URL_CHARGING."""
+    async def _make_charging_post_request(
+        self,
+        path: str,
+        json: dict | None = None,
+        endpoint_class: EndpointClass = EndpointClass.WRITE,
+    ) -> bytes:
+        """POST to the cariad charging service. Path is appended to BASE_URL_CHARGING.
+
+        Pass endpoint_class READ for POSTs which only query data.
+        """
         url = f"{BASE_URL_CHARGING}/{path.lstrip('/')}"
+        await self._throttle(url, endpoint_class)
         try:
             async with asyncio.timeout(REQUEST_TIMEOUT_IN_SECONDS):
                 async with self.session.request(
@@ -182,9 +405,10 @@ class RestApi:
                     headers=await self._headers(),
                     json=json,
                 ) as response:
-                    await response.text()
+                    body = await response.read()
+                    self._handle_retry_after(response.status, response.headers)
                     response.raise_for_status()
-                    return await response.text()
+                    return body
         except TimeoutError:  # pragma: no cover
             _LOGGER.exception("Timeout while sending POST request to %s", url)
             raise
@@ -192,56 +416,45 @@ class RestApi:
             _LOGGER.exception("Invalid status for POST request to %s: %d", url, err.status)
             raise
 
+    async def _throttle(self, url: str, endpoint_class: EndpointClass, cost: int = 1) -> None:
+        if self.rate_limiter is None:
+            return
+        await self.rate_limiter.acquire(self.authorization, vin_from_url(url), endpoint_class, cost)
+
+    def _handle_retry_after(self, status: int, headers: Mapping[str, str]) -> None:
+        if self.rate_limiter is None or status not in RETRY_AFTER_STATUSES:
+            return
+        delay = parse_retry_after(headers.get("Retry-After"))
+        if delay is not None:
+            _LOGGER.warning("Rate limited by the API, pausing requests for %.0f s", delay)
+            self.rate_limiter.retry_after(self.authorization, delay)
+
     async def verify_spin(self, spin: str, anonymize: bool = False) -> GetEndpointResult[Spin]:
         """Verify SPIN."""
         url = "/v1/spin/verify"
         json_data = {"currentSpin": spin}
-        raw = self.process_json(
+        payload = self.process_json(
             data=await self._make_post_request(url, json_data),
             anonymize=anonymize,
             anonymization_fn=anonymize_info,
         )
-        result = self._deserialize(raw, Spin.from_json)
+        result = self._deserialize(payload, Spin)
         url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return GetEndpointResult(url, payload, result)
 
     async def get_info(self, vin: str, anonymize: bool = False) -> GetEndpointResult[Info]:
         """Retrieve information related to basic information for the specified vehicle."""
-        url = f"/v2/garage/vehicles/{vin}?connectivityGenerations=MOD1&connectivityGenerations=MOD2&connectivityGenerations=MOD3&connectivityGenerations=MOD4"  # noqa: E501
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_info,
-        )
-        result = self._deserialize(raw, Info.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(INFO, anonymize, vin=vin)
 
     async def get_charging(self, vin: str, anonymize: bool = False) -> GetEndpointResult[Charging]:
         """Retrieve information related to charging for the specified vehicle."""
-        url = f"/v1/charging/{vin}"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_charging,
-        )
-        result = self._deserialize(raw, Charging.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(CHARGING, anonymize, vin=vin)
 
     async def get_charging_profiles(
         self, vin: str, anonymize: bool = False
     ) -> GetEndpointResult[ChargingProfiles]:
         """Retrieve information related to chargingprofiles for the specified vehicle."""
-        url = f"/v1/charging/{vin}/profiles"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_chargingprofiles,
-        )
-        result = self._deserialize(raw, ChargingProfiles.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(CHARGING_PROFILES, anonymize, vin=vin)
 
     async def get_charging_history(
         self,
@@ -252,16 +465,9 @@ class RestApi:
         limit: int = 50,
     ) -> GetEndpointResult[ChargingHistory]:
         """Retrieve charging history information for the specified vehicle."""
-        url = f"/v1/charging/{vin}/history?userTimezone=UTC&limit={limit}"
+        url = CHARGING_HISTORY.url({"limit": limit}, vin=vin)
         url = self._apply_date_filter(url, cursor=cursor, start=start, end=end)
-
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=False,
-            anonymization_fn=anonymize_info,
-        )
-        result = self._deserialize(raw, ChargingHistory.from_json)
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self._fetch_url(CHARGING_HISTORY, url)
 
     async def get_charging_statistics(
         self,
@@ -280,96 +486,49 @@ class RestApi:
             started_before=end.date(),
             selected_filter_options=[ChargingStatisticsFilterOption(filter_type="VEHICLE", id=vin)],
         )
-        raw = self.process_json(
+        payload = self.process_json(
             data=await self._make_charging_post_request(
-                "charging_statistics", json=request.to_dict()
+                "charging_statistics", json=request.to_dict(), endpoint_class=EndpointClass.READ
             ),
             anonymize=False,
             anonymization_fn=anonymize_info,
         )
-        result = self._deserialize(raw, ChargingStatistics.from_json)
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        result = self._deserialize(payload, ChargingStatistics)
+        return GetEndpointResult(url, payload, result)
 
     async def get_status(self, vin: str, anonymize: bool = False) -> GetEndpointResult[Status]:
         """Retrieve the current status for the specified vehicle."""
-        url = f"/v2/vehicle-status/{vin}"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_status,
-        )
-        result = self._deserialize(raw, Status.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(STATUS, anonymize, vin=vin)
 
     async def get_air_conditioning(
         self, vin: str, anonymize: bool = False
     ) -> GetEndpointResult[AirConditioning]:
         """Retrieve the current air conditioning status for the specified vehicle."""
-        url = f"/v2/air-conditioning/{vin}"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_air_conditioning,
-        )
-        result = self._deserialize(raw, AirConditioning.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(AIR_CONDITIONING, anonymize, vin=vin)
 
     async def get_auxiliary_heating(
         self, vin: str, anonymize: bool = False
     ) -> GetEndpointResult[AuxiliaryHeating]:
         """Retrieve the current auxiliary heating status for the specified vehicle."""
-        url = f"/v2/air-conditioning/{vin}/auxiliary-heating"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_auxiliary_heating,
-        )
-        result = self._deserialize(raw, AuxiliaryHeating.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(AUXILIARY_HEATING, anonymize, vin=vin)
 
     async def get_positions(
         self, vin: str, anonymize: bool = False
     ) -> GetEndpointResult[Positions]:
         """Retrieve the current position for the specified vehicle."""
-        url = f"/v1/maps/positions?vin={vin}"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_positions,
-        )
-        result = self._deserialize(raw, Positions.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(POSITIONS, anonymize, vin=vin)
 
     async def get_parking_position(
         self, vin: Vin, anonymize: bool = False
     ) -> GetEndpointResult[ParkingPositionV3]:
         """Retrieve the last known parking position for the specified vehicle."""
-        url = f"/v3/maps/positions/vehicles/{vin}/parking"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_parking_position,
-        )
-        result = self._deserialize(raw, ParkingPositionV3.from_json)
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(PARKING_POSITION, anonymize, vin=vin)
 
     async def get_driving_range(
         self, vin: str, anonymize: bool = False
     ) -> GetEndpointResult[DrivingRange]:
         """Retrieve estimated driving range for combustion vehicles."""
-        url = f"/v2/vehicle-status/{vin}/driving-range"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_driving_range,
-        )
-        result = self._deserialize(raw, DrivingRange.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(DRIVING_RANGE, anonymize, vin=vin)
 
     async def get_trip_statistics(
         self,
@@ -387,21 +546,8 @@ class RestApi:
                 2 = two periods back, etc.
             anonymize: set to true if personal information should be removed from result
         """
-        endpoint_url = f"/v1/trip-statistics/{vin}"
-        params = {
-            "offsetType": offset_type,
-            "offset": offset,
-            "timezone": "Europe/Berlin",
-        }
-        url = f"{endpoint_url}?{urlencode(params)}"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_trip_statistics,
-        )
-        result = self._deserialize(raw, TripStatistics.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        params = {"offsetType": offset_type, "offset": offset}
+        return await self.fetch(TRIP_STATISTICS, anonymize, params, vin=vin)
 
     async def get_single_trip_statistics(
         self,
@@ -414,328 +560,138 @@ class RestApi:
 
         If you want to filter by date, provide both start and end date.
         """
-        url = f"/v1/trip-statistics/{vin}/single-trips?timezone=Europe%2FBerlin"
-        url = self._apply_date_filter(url, cursor=None, start=start, end=end)
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_single_trip_statistics,
+        url = self._apply_date_filter(
+            SINGLE_TRIP_STATISTICS.url(vin=vin), cursor=None, start=start, end=end
         )
-        result = self._deserialize(raw, SingleTrips.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self._fetch_url(SINGLE_TRIP_STATISTICS, url, anonymize)
 
     async def get_maintenance(
         self, vin: str, anonymize: bool = False
     ) -> GetEndpointResult[Maintenance]:
         """Retrieve maintenance report, settings and history."""
-        url = f"/v3/vehicle-maintenance/vehicles/{vin}"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_maintenance,
-        )
-        result = self._deserialize(raw, Maintenance.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(MAINTENANCE, anonymize, vin=vin)
 
     async def get_maintenance_report(
         self, vin: str, anonymize: bool = False
     ) -> GetEndpointResult[MaintenanceReport]:
         """Retrieve just the maintenance report."""
-        url = f"/v3/vehicle-maintenance/vehicles/{vin}/report"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_maintenance,
-        )
-        result = self._deserialize(raw, MaintenanceReport.from_json)
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(MAINTENANCE_REPORT, anonymize, vin=vin)
 
     async def get_health(self, vin: str, anonymize: bool = False) -> GetEndpointResult[Health]:
         """Retrieve health information for the specified vehicle."""
-        url = f"/v1/vehicle-health-report/warning-lights/{vin}"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_health,
-        )
-        result = self._deserialize(raw, Health.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(HEALTH, anonymize, vin=vin)
 
     async def get_vehicle_info(
         self, vin: str, anonymize: bool = False
     ) -> GetEndpointResult[VehicleInfo]:
         """Retrieve vehicle info for the specified vehicle."""
-        url = f"/v1/vehicle-information/{vin}"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_vehicle_info,
-        )
-        result = self._deserialize(raw, VehicleInfo.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(VEHICLE_INFO, anonymize, vin=vin)
 
     async def get_software_update_status(
         self, vin: str, anonymize: bool = False
     ) -> GetEndpointResult[SoftwareUpdateStatus]:
         """Retrieve software update status."""
-        url = f"/v1/vehicle-information/{vin}/software-version/update-status"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_software_update_status,
-        )
-        result = self._deserialize(raw, SoftwareUpdateStatus.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(SOFTWARE_UPDATE_STATUS, anonymize, vin=vin)
 
     async def get_vehicle_renders(
         self, vin: str, anonymize: bool = False
     ) -> GetEndpointResult[VehicleRenders]:
         """Retrieve vehicle renders for the specified vehicle."""
-        url = f"/v1/vehicle-information/{vin}/renders"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_vehicle_renders,
-        )
-        result = self._deserialize(raw, VehicleRenders.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(RENDERS, anonymize, vin=vin)
 
     async def get_vehicle_equipment(
         self, vin: str, anonymize: bool = False
     ) -> GetEndpointResult[VehicleEquipment]:
         """Retrieve vehicle equipment information for the specified vehicle."""
-        url = f"/v1/vehicle-information/{vin}/equipment"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_vehicle_equipment,
-        )
-        result = self._deserialize(raw, VehicleEquipment.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(EQUIPMENT, anonymize, vin=vin)
 
     async def get_widget(
         self, vin: str, anonymize: bool = False
     ) -> GetEndpointResult[WidgetResponse]:
         """Retrieve widget information for the specified vehicle."""
-        url = f"/v2/widgets/vehicle-status/{vin}"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_widget,
-        )
-        result = self._deserialize(raw, WidgetResponse.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(WIDGET, anonymize, vin=vin)
 
     async def get_loyalty_program_details(
         self, anonymize: bool = False
     ) -> GetEndpointResult[LoyaltyProgramDetailsResponse]:
         """Retrieve loyalty program details for the specified user."""
-        url = "/v2/loyalty-program/details"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_loyalty_program_details,
-        )
-        result = self._deserialize(raw, LoyaltyProgramDetailsResponse.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(LOYALTY_PROGRAM_DETAILS, anonymize)
 
     async def get_loyalty_program_member(
         self, user_id: str, anonymize: bool = False
     ) -> GetEndpointResult[LoyaltyProgramMember]:
         """Retrieve loyalty program member information for the specified user."""
-        url = f"/v2/loyalty-program/members/{user_id}"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_loyalty_program_member,
-        )
-        result = self._deserialize(raw, LoyaltyProgramMember.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(LOYALTY_PROGRAM_MEMBER, anonymize, user_id=user_id)
 
     async def get_loyalty_program_badges(
         self, user_id: str, anonymize: bool = False
     ) -> GetEndpointResult[BadgesResponse]:
         """Retrieve loyalty program badges information for the specified user."""
-        url = f"/v2/loyalty-program/members/{user_id}/badges"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_loyalty_program_badges,
-        )
-        result = self._deserialize(raw, BadgesResponse.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(LOYALTY_PROGRAM_BADGES, anonymize, user_id=user_id)
 
     async def get_loyalty_program_badge(
         self, user_id: str, badge_id: str, anonymize: bool = False
     ) -> GetEndpointResult[BadgeResponse]:
         """Retrieve loyalty program member badge information for the specified badge."""
-        url = f"/v2/loyalty-program/members/{user_id}/badges/{badge_id}"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_loyalty_program_badge,
+        return await self.fetch(
+            LOYALTY_PROGRAM_BADGE, anonymize, user_id=user_id, badge_id=badge_id
         )
-        result = self._deserialize(raw, BadgeResponse.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
 
     async def get_loyalty_program_challenges(
         self, user_id: str, anonymize: bool = False
     ) -> GetEndpointResult[ChallengesResponse]:
         """Retrieve loyalty program challenges information for the specified user."""
-        url = f"/v2/loyalty-program/members/{user_id}/challenges"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_loyalty_program_challenges,
-        )
-        result = self._deserialize(raw, ChallengesResponse.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(LOYALTY_PROGRAM_CHALLENGES, anonymize, user_id=user_id)
 
     async def get_loyalty_program_games(
         self, user_id: str, anonymize: bool = False
     ) -> GetEndpointResult[GamesResponse]:
         """Retrieve loyalty program games information for the specified user."""
-        url = f"/v2/loyalty-program/members/{user_id}/games"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_loyalty_program_games,
-        )
-        result = self._deserialize(raw, GamesResponse.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(LOYALTY_PROGRAM_GAMES, anonymize, user_id=user_id)
 
     async def get_loyalty_program_rewards(
         self, user_id: str, anonymize: bool = False
     ) -> GetEndpointResult[RewardResponse]:
         """Retrieve loyalty program rewards information for the specified user."""
-        url = f"/v2/loyalty-program/members/{user_id}/rewards"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_loyalty_program_rewards,
-        )
-        result = self._deserialize(raw, RewardResponse.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(LOYALTY_PROGRAM_REWARDS, anonymize, user_id=user_id)
 
     async def get_loyalty_program_transactions(
         self, user_id: str, anonymize: bool = False
     ) -> GetEndpointResult[TransactionsResponse]:
         """Retrieve loyalty program transactions information for the specified user."""
-        url = f"/v2/loyalty-program/members/{user_id}/transactions"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_loyalty_program_transactions,
-        )
-        result = self._deserialize(raw, TransactionsResponse.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(LOYALTY_PROGRAM_TRANSACTIONS, anonymize, user_id=user_id)
 
     async def get_loyalty_program_salesforce_contacts(
         self, user_id: str, anonymize: bool = False
     ) -> GetEndpointResult[SalesforceContactResponse]:
         """Retrieve Salesforce contact information for the specified user."""
-        url = f"/v2/loyalty-program/salesforce-contacts/{user_id}"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_loyalty_program_salesforce_contacts,
-        )
-        result = self._deserialize(raw, SalesforceContactResponse.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(LOYALTY_PROGRAM_SALESFORCE_CONTACTS, anonymize, user_id=user_id)
 
     async def get_user(self, anonymize: bool = False) -> GetEndpointResult[User]:
         """Retrieve user information about logged in user."""
-        url = "/v1/users"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_user,
-        )
-        result = self._deserialize(raw, User.from_json)
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(USER, anonymize)
 
     async def get_garage(self, anonymize: bool = False) -> GetEndpointResult[Garage]:
         """Fetch the garage (list of vehicles with limited info)."""
-        url = "/v2/garage?connectivityGenerations=MOD1&connectivityGenerations=MOD2&connectivityGenerations=MOD3&connectivityGenerations=MOD4"  # noqa: E501
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_garage,
-        )
-        result = self._deserialize(raw, Garage.from_json)
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(GARAGE, anonymize)
 
     async def get_departure_timers(
         self, vin: str, anonymize: bool = False
     ) -> GetEndpointResult[DepartureInfo]:
         """Retrieve departure timers for the vehicle."""
-        # Get the current local time with timezone
-        now = datetime.now().astimezone()
-        # Format the datetime string with timezone
-        formatted_time = (
-            now.strftime("%Y-%m-%dT%H:%M:%S.%f")
-            + now.strftime("%z")[:3]
-            + ":"
-            + now.strftime("%z")[3:]
-        )
-
-        url = (
-            f"/v1/vehicle-automatization/{vin}/departure/timers"
-            f"?deviceDateTime={quote(formatted_time, safe='')}"
-        )
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_departure_timers,
-        )
-        result = self._deserialize(raw, DepartureInfo.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(DEPARTURE_INFO, anonymize, vin=vin)
 
     async def get_driving_score(
         self, vin: str, anonymize: bool = False
     ) -> GetEndpointResult[DrivingScore]:
         """Retrieve driving score for the specified vehicle."""
-        url = f"/v2/vehicle-status/{vin}/driving-score"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_driving_score,
-        )
-        result = self._deserialize(raw, DrivingScore.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(DRIVING_SCORE, anonymize, vin=vin)
 
     async def get_vehicle_connection_status(
         self, vin: str, anonymize: bool = False
     ) -> GetEndpointResult[VehicleConnectionStatus]:
         """Retrieve vehicle connection status."""
-        url = f"/v2/connection-status/{vin}/readiness"
-        raw = self.process_json(
-            data=await self._make_get_request(url),
-            anonymize=anonymize,
-            anonymization_fn=anonymize_vehicle_connection_status,
-        )
-        result = self._deserialize(raw, VehicleConnectionStatus.from_json)
-        url = anonymize_url(url) if anonymize else url
-        return GetEndpointResult(url=url, raw=raw, result=result)
+        return await self.fetch(VEHICLE_CONNECTION_STATUS, anonymize, vin=vin)
 
     async def _headers(self) -> dict[str, str]:
         return {"authorization": f"Bearer {await self.authorization.get_access_token()}"}
@@ -1050,14 +1006,14 @@ class RestApi:
             json=json_data,
         )
 
-    def _deserialize[T](self, text: str, deserialize: Callable[[str], T]) -> T:  # pragma: no cover
+    def _deserialize[T: DataClassDictMixin](self, payload: bytes | dict, model: type[T]) -> T:
+        """Build the model from payload, parsing it first if it is still the response body."""
         try:
-            data = deserialize(text)
-        except Exception:
-            _LOGGER.exception("Failed to deserialize data: %s", text)
+            data = orjson.loads(payload) if isinstance(payload, bytes) else payload
+            return model.from_dict(data)
+        except Exception:  # pragma: no cover
+            _LOGGER.exception("Failed to deserialize data: %s", payload)
             raise
-        else:
-            return data
 
     def _apply_date_filter(
         self,
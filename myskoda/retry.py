@@ -0,0 +1,249 @@
+"""Retrying failed GET requests, and failing fast for endpoints which keep failing.
+
+Transient failures, such as timeouts, connection errors and 5xx responses, are retried with
+decorrelated jitter until the attempts or the deadline of the `RetryPolicy` are used up. Every
+endpoint of a vehicle has its own circuit breaker: after a number of consecutive failures its
+requests fail with `CircuitOpenError` without being sent, until a single probe request is let
+through after a while.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from enum import StrEnum
+
+from aiohttp import ClientConnectionError, ClientResponseError
+
+from .const import (
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_RESET_TIMEOUT_IN_SECONDS,
+    RETRY_ATTEMPTS,
+    RETRY_BASE_DELAY_IN_SECONDS,
+    RETRY_DEADLINE_IN_SECONDS,
+    RETRY_MAX_DELAY_IN_SECONDS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Responses a repeated request may succeed for.
+TRANSIENT_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """Requests of an endpoint are not sent because it failed too often recently."""
+
+    def __init__(self, key: Hashable, retry_in: float) -> None:
+        super().__init__(f"Circuit open for {key}, retrying in {retry_in:.0f}s")
+        self.key = key
+        self.retry_in = retry_in
+
+
+def is_transient(err: BaseException) -> bool:
+    """Return whether a request that failed with err may succeed when sent again."""
+    if isinstance(err, ClientResponseError):
+        return err.status in TRANSIENT_STATUSES
+    return isinstance(err, TimeoutError | ClientConnectionError)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Send a request `attempts` times at most, not starting any attempt after `deadline` seconds.
+
+    The wait before each retry is random, between `base_delay` and three times the previous
+    wait, and at most `max_delay` seconds.
+    """
+
+    attempts: int = RETRY_ATTEMPTS
+    base_delay: float = RETRY_BASE_DELAY_IN_SECONDS
+    max_delay: float = RETRY_MAX_DELAY_IN_SECONDS
+    deadline: float = RETRY_DEADLINE_IN_SECONDS
+
+    def __post_init__(self) -> None:
+        """Check that at least one attempt is made."""
+        if self.attempts < 1:
+            msg = "attempts must be at least 1"
+            raise ValueError(msg)
+
+    def next_delay(self, previous: float) -> float:
+        """Return the wait before the next retry, given the previous one."""
+        upper = 3 * max(previous, self.base_delay)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))  # noqa: S311
+
+
+class CircuitState(StrEnum):
+    """Requests are sent (closed), fail fast (open) or are probed one at a time (half open)."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Consecutive failures of a single endpoint, and whether its requests may be sent."""
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_BREAKER_RESET_TIMEOUT_IN_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self._clock = clock
+        self._opened_at = 0.0
+        self._probing = False
+
+    def allow(self) -> bool:
+        """Return whether a request may be sent, letting a single probe through when half open."""
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.OPEN:
+            if self.retry_in() > 0:
+                return False
+            self.state = CircuitState.HALF_OPEN
+        if self._probing:
+            return False
+        self._probing = True
+        return True
+
+    def retry_in(self) -> float:
+        """Return the seconds until the next probe request is let through."""
+        return max(0.0, self._opened_at + self.reset_timeout - self._clock())
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self) -> bool:
+        """Count a failure, and return whether it opened the circuit."""
+        self._probing = False
+        self.failures += 1
+        if self.state == CircuitState.OPEN:
+            return False
+        if self.state == CircuitState.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = CircuitState.OPEN
+            self._opened_at = self._clock()
+            return True
+        return False
+
+    def release(self) -> None:
+        """Let the next request probe again, as the current probe did not finish."""
+        self._probing = False
+
+
+@dataclass
+class RetryStats:
+    """Counters for a `RetryHandler`.
+
+    `retries` counts repeated attempts, `recovered` the requests which succeeded after a retry
+    and `exhausted` those which failed after using up their attempts or deadline.
+    `short_circuited` counts requests failed by an open circuit without being sent, `opened`
+    how often a circuit was opened.
+    """
+
+    retries: int = 0
+    recovered: int = 0
+    exhausted: int = 0
+    short_circuited: int = 0
+    opened: int = 0
+
+
+class RetryHandler:
+    """Retry transient failures of idempotent requests, with a circuit breaker per key.
+
+    `RestApi` uses the name of the endpoint and the VIN as key. Pass `RetryPolicy(attempts=1)`
+    to send every request only once, keeping the circuit breakers.
+    """
+
+    def __init__(
+        self,
+        policy: RetryPolicy | None = None,
+        failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_BREAKER_RESET_TIMEOUT_IN_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.policy = policy if policy is not None else RetryPolicy()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        # Only endpoints which failed recently have a breaker, closed ones are dropped on success.
+        self._breakers: dict[Hashable, CircuitBreaker] = {}
+        self.stats = RetryStats()
+
+    def breaker(self, key: Hashable) -> CircuitBreaker:
+        """Return the circuit breaker of key."""
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = self._breakers[key] = CircuitBreaker(
+                self.failure_threshold, self.reset_timeout, self._clock
+            )
+        return breaker
+
+    @property
+    def open_circuits(self) -> list[Hashable]:
+        """Return the keys whose requests currently fail fast or are probed."""
+        return [
+            key for key, breaker in self._breakers.items() if breaker.state != CircuitState.CLOSED
+        ]
+
+    async def run[T](self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """Await call(), retrying transient failures unless the circuit of key is open."""
+        breaker = self.breaker(key)
+        if not breaker.allow():
+            self.stats.short_circuited += 1
+            raise CircuitOpenError(key, breaker.retry_in())
+        try:
+            result = await self._retry(call)
+        except asyncio.CancelledError:
+            breaker.release()
+            raise
+        except Exception as err:
+            if not is_transient(err):
+                # The API answered, so the endpoint works as such.
+                self._close(key, breaker)
+            elif breaker.record_failure():
+                self.stats.opened += 1
+                _LOGGER.warning(
+                    "Requests for %s failed %d times, pausing them for %.0fs",
+                    key,
+                    breaker.failures,
+                    breaker.reset_timeout,
+                )
+            raise
+        self._close(key, breaker)
+        return result
+
+    def _close(self, key: Hashable, breaker: CircuitBreaker) -> None:
+        breaker.record_success()
+        if self._breakers.get(key) is breaker:
+            del self._breakers[key]
+
+    async def _retry[T](self, call: Callable[[], Awaitable[T]]) -> T:
+        deadline = self._clock() + self.policy.deadline
+        delay = 0.0
+        attempt = 1
+        while True:
+            try:
+                result = await call()
+            except Exception as err:
+                if not is_transient(err):
+                    raise
+                delay = self.policy.next_delay(delay)
+                if attempt == self.policy.attempts or self._clock() + delay > deadline:
+                    self.stats.exhausted += 1
+                    raise
+                _LOGGER.debug("Attempt %d failed: %s, retrying in %.1fs", attempt, err, delay)
+                self.stats.retries += 1
+                await asyncio.sleep(delay)
+                attempt += 1
+            else:
+                if attempt > 1:
+                    self.stats.recovered += 1
+                return result
@@ -2,21 +2,147 @@
 
 import asyncio
 import functools
-from collections.abc import Awaitable, Callable
+import inspect
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from hashlib import sha256
 from typing import ParamSpec
 
-from .const import DEFAULT_DEBOUNCE_WAIT_SECONDS
+from .const import (
+    DEBOUNCE_MAX_KEYS,
+    DEFAULT_DEBOUNCE_MAX_WAIT_SECONDS,
+    DEFAULT_DEBOUNCE_WAIT_SECONDS,
+)
 
 # TODO @dvx76: Switch to Python 3.13 generics syntax once we're on 3.13
 # https://docs.python.org/3/library/typing.html#typing.ParamSpec
 
 P = ParamSpec("P")  # Represents the function parameters
 
+# Arguments which only change how a call reports back, not what it does.
+_DEBOUNCE_IGNORED_ARGS = frozenset({"notify"})
+_DEBOUNCE_STATS_ATTR = "debounce_stats"
 
-def async_debounce(
-    wait: float = DEFAULT_DEBOUNCE_WAIT_SECONDS, immediate: bool = False, queue: bool = True
+
+@dataclass
+class _DebounceSlot:
+    task: asyncio.Task | None = None
+    last_execution_time: float = float("-inf")
+    # Latest time the pending execution may start, set while a delayed execution is waiting.
+    deadline: float | None = None
+
+    @property
+    def pending(self) -> bool:
+        return self.deadline is not None and self.task is not None and not self.task.done()
+
+
+@dataclass
+class DebounceStats:
+    """Counters and state of a debounced function.
+
+    `coalesced` counts calls which were absorbed by another call for the same key instead of
+    being executed on their own.
+    """
+
+    calls: int = 0
+    executions: int = 0
+    coalesced: int = 0
+    evicted_keys: int = 0
+    _slots: dict[Hashable, _DebounceSlot] = field(default_factory=dict, repr=False)
+    _running: set[asyncio.Task] = field(default_factory=set, repr=False)
+
+    @property
+    def keys(self) -> int:
+        """Return the number of keys currently tracked."""
+        return len(self._slots)
+
+    @property
+    def pending(self) -> int:
+        """Return the number of keys with a delayed execution scheduled."""
+        return sum(1 for slot in self._slots.values() if slot.pending)
+
+    def _slot(self, key: Hashable, now: float, wait: float, max_keys: int) -> _DebounceSlot:
+        if (slot := self._slots.get(key)) is not None:
+            return slot
+        if len(self._slots) >= max_keys:
+            # A key without a pending call whose wait time has passed behaves like a new one.
+            idle = [
+                k
+                for k, slot in self._slots.items()
+                if (slot.task is None or slot.task.done())
+                and now - slot.last_execution_time >= wait
+            ]
+            for k in idle:
+                del self._slots[k]
+            self.evicted_keys += len(idle)
+        while len(self._slots) >= max_keys:
+            # All keys are busy: forget the oldest. Its pending call still runs, but no longer
+            # absorbs new calls.
+            oldest = self._slots.pop(next(iter(self._slots)))
+            if oldest.task is not None and not oldest.task.done():
+                self._running.add(oldest.task)
+                oldest.task.add_done_callback(self._running.discard)
+            self.evicted_keys += 1
+        slot = self._slots[key] = _DebounceSlot()
+        return slot
+
+    def _forget_later(self, key: Hashable, slot: _DebounceSlot, wait: float) -> None:
+        """Forget key once it is idle and its wait time has passed.
+
+        Keys and pending calls hold the arguments, including self, which must not be kept alive
+        by the debounce state.
+        """
+        loop = asyncio.get_running_loop()
+
+        def forget() -> None:
+            if self._slots.get(key) is not slot or loop.time() - slot.last_execution_time < wait:
+                # Replaced, or executed again, which forgets it later.
+                return
+            if slot.task is not None and not slot.task.done():
+                loop.call_later(wait, forget)
+                return
+            del self._slots[key]
+
+        loop.call_later(wait, forget)
+
+
+def debounce_stats(func: Callable) -> DebounceStats:
+    """Return the stats of a function (or bound method) decorated with `async_debounce`."""
+    return getattr(func, _DEBOUNCE_STATS_ATTR)
+
+
+def _default_debounce_key(signature: inspect.Signature) -> Callable[..., Hashable]:
+    """Build a key from all bound arguments, including self, except the ignored ones."""
+
+    def key(*args: object, **kwargs: object) -> Hashable:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return tuple(
+            (name, _hashable_or_id(value))
+            for name, value in bound.arguments.items()
+            if name not in _DEBOUNCE_IGNORED_ARGS
+        )
+
+    return key
+
+
+def _hashable_or_id(value: object) -> Hashable:
+    # isinstance(value, Hashable) is also true for tuples containing unhashable values.
+    try:
+        hash(value)
+    except TypeError:
+        return id(value)
+    return value
+
+
+def async_debounce(  # noqa: PLR0913
+    wait: float = DEFAULT_DEBOUNCE_WAIT_SECONDS,
+    immediate: bool = False,
+    queue: bool = True,
+    key: Callable[..., Hashable] | None = None,
+    max_keys: int = DEBOUNCE_MAX_KEYS,
+    max_wait: float | None = DEFAULT_DEBOUNCE_MAX_WAIT_SECONDS,
 ) -> Callable[[Callable[P, Awaitable[object]]], Callable[P, Awaitable[None]]]:
     """Debounce decorator for async functions.
 
@@ -28,34 +154,61 @@ def async_debounce(
     When 'immediate' is True the first call is executed immediatally.
     When queue is True subsequent calls are still debounced normally. 'queue' does nothing when
     'immediate' is False.
+
+    Calls are debounced per key. 'key' receives the arguments of the call; by default the key
+    is made of all arguments (including self) except 'notify', so calls for different
+    instances or VINs never affect each other. A key is forgotten once its wait time has passed
+    without a pending call, so the state doesn't keep instances or arguments alive. Once
+    'max_keys' keys are tracked, idle keys are also evicted when a new key is added, or the
+    oldest key if all of them are busy. See `debounce_stats` for counters.
+
+    A delayed execution is postponed by every new call, but never to more than 'max_wait'
+    seconds after the first call it absorbed, so a steady stream of calls can't starve it.
     """
-    task: asyncio.Task | None = None
-    last_execution_time: float = 0.0
 
     def decorator(func: Callable[P, Awaitable[object]]) -> Callable[P, Awaitable[None]]:
+        make_key = key or _default_debounce_key(inspect.signature(func))
+        stats = DebounceStats()
+
         @functools.wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> None:
-            nonlocal task, last_execution_time
-
-            async def delayed_execution() -> object:
-                nonlocal last_execution_time
-                await asyncio.sleep(wait)
-                last_execution_time = now
-                return await func(*args, **kwargs)
-
             now = asyncio.get_running_loop().time()
+            stats.calls += 1
+            slot_key = make_key(*args, **kwargs)
+            slot = stats._slot(slot_key, now, wait, max_keys)  # noqa: SLF001
+
+            async def delayed_execution(delay: float) -> object:
+                await asyncio.sleep(delay)
+                # From here on a new call schedules another execution instead of cancelling
+                # this one.
+                slot.deadline = None
+                slot.last_execution_time = now
+                stats.executions += 1
+                stats._forget_later(slot_key, slot, wait)  # noqa: SLF001
+                return await func(*args, **kwargs)
 
-            if immediate and now - last_execution_time >= wait:
-                last_execution_time = now
+            if immediate and now - slot.last_execution_time >= wait:
+                slot.last_execution_time = now
+                stats.executions += 1
+                stats._forget_later(slot_key, slot, wait)  # noqa: SLF001
                 await func(*args, **kwargs)
                 return
 
-            if task:
-                task.cancel()
+            if slot.pending or (immediate and not queue):
+                stats.coalesced += 1
+            if slot.pending and slot.task:
+                slot.task.cancel()
+            elif slot.task and not slot.task.done():
+                stats._running.add(slot.task)  # noqa: SLF001
+                slot.task.add_done_callback(stats._running.discard)  # noqa: SLF001
 
             if not immediate or queue:
-                task = asyncio.create_task(delayed_execution())
+                if slot.deadline is None:
+                    slot.deadline = now + max_wait if max_wait is not None else float("inf")
+                delay = max(0.0, min(wait, slot.deadline - now))
+                slot.task = asyncio.create_task(delayed_execution(delay))
 
+        wrapper.__dict__[_DEBOUNCE_STATS_ATTR] = stats
         return wrapper
 
     return decorator
@@ -1,5 +1,9 @@
 """Represents a whole vehicle."""
 
+from dataclasses import dataclass
+from datetime import timedelta
+from enum import StrEnum
+
 from .models.air_conditioning import AirConditioning
 from .models.auxiliary_heating import AuxiliaryHeating
 from .models.charging import Charging
@@ -16,6 +20,39 @@ from .models.trip_statistics import SingleTrips, TripStatistics
 from .models.vehicle_connection_status import VehicleConnectionStatus
 
 
+class VehicleSection(StrEnum):
+    """Parts of a `Vehicle` which can be refreshed on their own.
+
+    Values are the attribute names on `Vehicle`.
+    """
+
+    INFO = "info"
+    CHARGING = "charging"
+    STATUS = "status"
+    AIR_CONDITIONING = "air_conditioning"
+    AUXILIARY_HEATING = "auxiliary_heating"
+    POSITIONS = "positions"
+    DRIVING_RANGE = "driving_range"
+    TRIP_STATISTICS = "trip_statistics"
+    SINGLE_TRIP_STATISTICS = "single_trip_statistics"
+    MAINTENANCE = "maintenance"
+    HEALTH = "health"
+    DEPARTURE_INFO = "departure_info"
+
+
+@dataclass
+class SectionRead[T]:
+    """A section of a vehicle as returned by `MySkoda.read_section`.
+
+    `age` is the time since the data was last fetched, or None if it was never loaded.
+    `revalidating` is True while a background refresh of the section is running.
+    """
+
+    value: T | None
+    age: timedelta | None
+    revalidating: bool = False
+
+
 def _ts_changed(existing: BaseResponse | None, new: BaseResponse) -> bool:
     """Return True when car_captured_timestamp has changed or was absent."""
     return existing is None or existing.car_captured_timestamp != new.car_captured_timestamp
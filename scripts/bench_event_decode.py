@@ -0,0 +1,100 @@
+"""Benchmark for decoding MQTT messages into events.
+
+Compares event_from_mqtt_message, which parses the payload bytes with orjson and looks up the
+event class by topic, against BaseEvent.from_mqtt_message, which parses it with the json module
+and lets mashumaro resolve the event class. Uses the recorded service events in
+tests/fixtures/events plus a message for every other event type. Both run on a single core.
+
+Run with `python -m scripts.bench_event_decode`.
+"""
+
+import json
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from myskoda.models.event import BaseEvent, event_from_mqtt_message
+
+ITERATIONS = 2_000
+FIXTURES_DIR = Path(__file__).parent.parent / "tests" / "fixtures" / "events"
+USER_ID = "b8bc126c-ee36-402b-8723-2c1c3dff8dec"
+VIN = "TMOCKAA0AA000000"
+
+
+def _event(name: str, data: dict | None = None) -> dict:
+    return {
+        "version": 1,
+        "traceId": "800a74737b5a4328862d958c35b71b74",
+        "producer": "SKODA_MHUB",
+        "name": name,
+        "timestamp": "2025-05-11T07:35:18Z",
+        "data": {"userId": USER_ID, "vin": VIN, **(data or {})},
+    }
+
+
+def _messages() -> list[tuple[str, bytes]]:
+    """Return (topic, payload) of one message per event type."""
+    recorded = [
+        (f"service-event/{path.stem.split('_')[2]}", path.read_bytes())
+        for path in sorted(FIXTURES_DIR.glob("service_event_*.json"))
+    ]
+    operation = {
+        "version": 1,
+        "operation": "start-charging",
+        "status": "COMPLETED_SUCCESS",
+        "traceId": "f0b638f7bba08ec4acb5de64cdb97ba9",
+        "requestId": "72f24950-b3db-4b7e-948f-7032f533773a",
+    }
+    other = [
+        ("operation-request/charging/start-stop-charging", operation),
+        ("service-event/vehicle-status/access", _event("change-access")),
+        ("service-event/vehicle-status/lights", _event("change-lights")),
+        ("service-event/vehicle-status/odometer", _event("change-odometer")),
+        ("service-event/air-conditioning", _event("climatisation-completed")),
+        ("vehicle-event/vehicle-connection-status-update", _event("vehicle-awake")),
+        (
+            "vehicle-event/vehicle-ignition-status",
+            _event("vehicle-ignition-status-changed", {"ignitionStatus": "ON"}),
+        ),
+    ]
+    return [
+        (f"{USER_ID}/{VIN}/{topic}", payload)
+        for topic, payload in [
+            *recorded,
+            *((topic, json.dumps(payload).encode()) for topic, payload in other),
+        ]
+    ]
+
+
+def _events_per_second(
+    messages: list[tuple[str, bytes]], decode: Callable[[str, bytes], BaseEvent]
+) -> float:
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        for topic, payload in messages:
+            decode(topic, payload)
+    return ITERATIONS * len(messages) / (time.perf_counter() - start)
+
+
+def _generic(topic: str, payload: bytes) -> BaseEvent:
+    # As MySkodaMqttClient did before.
+    return BaseEvent.from_mqtt_message(topic=topic, payload=payload)
+
+
+def main() -> None:
+    """Print how many events per second each decode path handles."""
+    messages = _messages()
+    for topic, payload in messages:
+        assert type(event_from_mqtt_message(topic, payload)) is type(_generic(topic, payload))
+
+    generic = _events_per_second(messages, _generic)
+    dispatched = _events_per_second(messages, event_from_mqtt_message)
+
+    print(f"{len(messages)} event types, {ITERATIONS} iterations")
+    print(f"generic:     {generic:10,.0f} events/s ({1e6 / generic:5.1f} µs/event)")
+    print(f"dispatched:  {dispatched:10,.0f} events/s ({1e6 / dispatched:5.1f} µs/event)")
+    print(f"speedup:     {dispatched / generic:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
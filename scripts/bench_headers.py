@@ -0,0 +1,59 @@
+"""Micro-benchmark for building the headers of a REST request.
+
+Compares RestApi._headers, which checks the token expiry on every call, against decoding the
+access token on every call as was done before the expiry was cached.
+
+Run with `python -m scripts.bench_headers`.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+import jwt
+from aiohttp import ClientSession
+
+from myskoda.auth.authorization import IDKSession
+from myskoda.myskoda import MySkodaAuthorization
+from myskoda.rest_api import RestApi
+
+ITERATIONS = 100_000
+
+
+def _token() -> str:
+    claims = {"exp": int(time.time()) + 3600, "sub": "b8bc126c-ee36-402b-8723-2c1c3dff8dec"}
+    return jwt.encode(claims, "secret", algorithm="HS256")
+
+
+async def _per_call(iterations: int, build: Callable[[], Awaitable[dict[str, str]]]) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await build()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+async def main() -> None:
+    """Print the time it takes to build request headers."""
+    async with ClientSession() as session:
+        authorization = MySkodaAuthorization(session)
+        token = _token()
+        authorization.idk_session = IDKSession(
+            access_token=token, refresh_token=token, id_token=token
+        )
+        api = RestApi(session, authorization)
+
+        async def decode_per_call() -> dict[str, str]:
+            meta = jwt.decode(token, options={"verify_signature": False})
+            _ = time.time() + 600 > float(meta.get("exp", "0"))
+            return {"authorization": f"Bearer {token}"}
+
+        cached = await _per_call(ITERATIONS, api._headers)  # noqa: SLF001
+        decoded = await _per_call(ITERATIONS, decode_per_call)
+
+    print(f"decode per call:  {decoded:6.2f} µs/request")
+    print(f"cached expiry:    {cached:6.2f} µs/request")
+    print(f"speedup:          {decoded / cached:6.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
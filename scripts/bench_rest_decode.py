@@ -0,0 +1,130 @@
+"""Benchmark for turning REST response bodies into models.
+
+Compares RestApi._deserialize, which parses the response bytes once with orjson and builds the
+model from the parsed data, against the previous path: decoding the body to text twice, and
+handing that text to the model's from_json. Uses the recorded responses in tests/fixtures.
+Reports the time to decode all of them and the peak memory allocated doing so, on a single core.
+
+Run with `python -m scripts.bench_rest_decode`.
+"""
+
+import asyncio
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import replace
+from pathlib import Path
+
+from aiohttp import ClientSession
+
+from myskoda.models.air_conditioning import AirConditioning
+from myskoda.models.auxiliary_heating import AuxiliaryHeating
+from myskoda.models.charging import Charging
+from myskoda.models.charging_history import ChargingHistory
+from myskoda.models.chargingprofiles import ChargingProfiles
+from myskoda.models.common import BaseResponse
+from myskoda.models.departure import DepartureInfo
+from myskoda.models.driving_range import DrivingRange
+from myskoda.models.driving_score import DrivingScore
+from myskoda.models.info import Info
+from myskoda.models.position import Positions
+from myskoda.models.software_status import SoftwareUpdateStatus
+from myskoda.models.status import Status
+from myskoda.models.trip_statistics import SingleTrips, TripStatistics
+from myskoda.models.vehicle_connection_status import VehicleConnectionStatus
+from myskoda.models.vehicle_info import VehicleEquipment, VehicleInfo, VehicleRenders
+from myskoda.models.widget import WidgetResponse
+from myskoda.myskoda import MySkodaAuthorization
+from myskoda.rest_api import RestApi
+
+ITERATIONS = 500
+FIXTURES_DIR = Path(__file__).parent.parent / "tests" / "fixtures"
+
+# Fixture file name prefix -> model of the endpoint it was recorded from.
+MODELS: dict[str, type[BaseResponse]] = {
+    "air-conditioning": AirConditioning,
+    "auxiliary-heating": AuxiliaryHeating,
+    "charging-history": ChargingHistory,
+    "charging-profiles": ChargingProfiles,
+    "charging-statistics": ChargingHistory,
+    "charging-iV": Charging,
+    "departure-timers": DepartureInfo,
+    "driving-range": DrivingRange,
+    "driving-score": DrivingScore,
+    "garage_vehicles": Info,
+    "positions": Positions,
+    "single-trips": SingleTrips,
+    "software-version": SoftwareUpdateStatus,
+    "trip-statistics": TripStatistics,
+    "vehicle-connection-status": VehicleConnectionStatus,
+    "vehicle-equipment": VehicleEquipment,
+    "vehicle-info": VehicleInfo,
+    "vehicle-renders": VehicleRenders,
+    "vehicle-status": Status,
+    "widget": WidgetResponse,
+}
+# Responses of the garage endpoint, not of a single vehicle.
+EXCLUDED = {"garage_with_429_error"}
+
+
+def _responses() -> list[tuple[str, type[BaseResponse], bytes]]:
+    """Return (name, model, body) of every fixture with a known model."""
+    responses = []
+    for path in sorted(FIXTURES_DIR.glob("*/*.json")):
+        if path.stem in EXCLUDED:
+            continue
+        for prefix, model in MODELS.items():
+            if path.stem.startswith(prefix):
+                responses.append((f"{path.parent.name}/{path.stem}", model, path.read_bytes()))
+                break
+    return responses
+
+
+def _text(body: bytes, model: type[BaseResponse]) -> BaseResponse:
+    # As RestApi did before: response.text() was awaited twice, decoding the body each time,
+    # and the resulting text was parsed.
+    body.decode()
+    return model.from_json(body.decode())
+
+
+def _measure(
+    responses: list[tuple[str, type[BaseResponse], bytes]],
+    decode: Callable[[bytes, type[BaseResponse]], object],
+) -> tuple[float, float]:
+    """Return the time in µs and the memory in KiB it takes to decode all responses once."""
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        for _name, model, body in responses:
+            decode(body, model)
+    elapsed = (time.perf_counter() - start) / ITERATIONS * 1e6
+
+    tracemalloc.start()
+    for _name, model, body in responses:
+        decode(body, model)
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024
+
+
+async def main() -> None:
+    """Print how long decoding the recorded responses takes with both paths."""
+    async with ClientSession() as session:
+        api = RestApi(session, MySkodaAuthorization(session))
+    responses = _responses()
+    for _name, model, body in responses:
+        parsed, expected = api._deserialize(body, model), _text(body, model)  # noqa: SLF001
+        # The timestamp is set when the model is built.
+        assert replace(parsed, timestamp=expected.timestamp) == expected
+
+    text_time, text_memory = _measure(responses, _text)
+    bytes_time, bytes_memory = _measure(responses, api._deserialize)  # noqa: SLF001
+    size = sum(len(body) for _name, _model, body in responses) / 1024
+
+    print(f"{len(responses)} responses, {size:.0f} KiB, {ITERATIONS} iterations")
+    print(f"text:   {text_time:8,.0f} µs per corpus, peak {text_memory:6,.0f} KiB")
+    print(f"bytes:  {bytes_time:8,.0f} µs per corpus, peak {bytes_memory:6,.0f} KiB")
+    print(f"speedup: {text_time / bytes_time:7.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -15,6 +15,8 @@ import aiomqtt
 import pytest
 from aiohttp import ClientSession
 from aioresponses import aioresponses
+from paho.mqtt.packettypes import PacketTypes
+from paho.mqtt.reasoncodes import ReasonCode
 
 from myskoda.anonymize import ACCESS_TOKEN
 from myskoda.auth.authorization import Authorization
@@ -86,14 +88,25 @@ class FakeMqttClientWrapper(AbstractAsyncContextManager):
     Pass `enter_exceptions` (a list of exceptions or None entries) to script failures from
     `__aenter__`. Each call pops the next entry: a non-None exception is raised, None means
     "enter normally". Useful for simulating reconnect-loop behavior in MySkodaMqttClient.
+
+    Every SUBSCRIBE is recorded in `subscriptions`, every UNSUBSCRIBE in `unsubscriptions`.
+    With `reject_wildcards` the fake answers topic filters containing a wildcard with
+    "Wildcard Subscriptions not supported". Set `session_present` to pretend the broker resumed
+    a previous session.
     """
 
     def __init__(
         self,
         messages: list[aiomqtt.Message],
         enter_exceptions: list[BaseException | None] | None = None,
+        reject_wildcards: bool = False,
     ) -> None:
         self._aiter = SimpleAsyncIterator(messages)
+        self.subscriptions: list[list[tuple[str, int]]] = []
+        self.unsubscriptions: list[list[str]] = []
+        self.reject_wildcards = reject_wildcards
+        self.session_present = False
+        self.session_expiry: int | None = None
         self.connect_properties_fcm_token: str | None = None
         self._enter_exceptions: list[BaseException | None] = list(enter_exceptions or [])
         self.set_connect_properties_calls: list[str] = []
@@ -120,14 +133,27 @@ class FakeMqttClientWrapper(AbstractAsyncContextManager):
     def messages(self) -> AsyncIterator:
         return self._aiter
 
-    async def subscribe(self, topic: str) -> None:
-        print(f"Fake subscribed to topic {topic}")
+    async def subscribe(self, topic: list[tuple[str, int]]) -> list[ReasonCode]:
+        print(f"Fake subscribed to topics {topic}")
+        self.subscriptions.append(topic)
+        return [
+            ReasonCode(
+                PacketTypes.SUBACK,
+                identifier=0xA2 if self.reject_wildcards and "#" in name else 0,
+            )
+            for name, _qos in topic
+        ]
+
+    async def unsubscribe(self, topic: list[str]) -> None:
+        print(f"Fake unsubscribed from topics {topic}")
+        self.unsubscriptions.append(topic)
 
     def update_username_password(self, username: str, password: str) -> None:
         print(f"Fake updated username/password as {username}/{password}")
 
-    def set_connect_properties(self, fcm_token: str) -> None:
+    def set_connect_properties(self, fcm_token: str, session_expiry: int | None = None) -> None:
         self.connect_properties_fcm_token = fcm_token
+        self.session_expiry = session_expiry
         self.set_connect_properties_calls.append(fcm_token)
 
 
@@ -1,14 +1,25 @@
 """Unit tests for myskoda.auth."""
 
+import asyncio
+from datetime import UTC, datetime, timedelta
 from json import dumps
 from pathlib import Path
+from unittest.mock import patch
 
 import aiohttp
+import jwt
 import pytest
 from aioresponses import aioresponses
 
 from myskoda.anonymize import USER_ID
-from myskoda.const import BASE_URL_IDENT, BASE_URL_SKODA, CLIENT_ID
+from myskoda.auth.authorization import IDKSession
+from myskoda.const import (
+    BASE_URL_IDENT,
+    BASE_URL_SKODA,
+    CLIENT_ID,
+    TOKEN_REFRESH_JITTER_IN_SECONDS,
+    TOKEN_REFRESH_LEAD_IN_SECONDS,
+)
 from myskoda.myskoda import MySkodaAuthorization
 
 FIXTURES_DIR = Path(__file__).parent.joinpath("fixtures")
@@ -96,3 +107,97 @@ async def test_get_tokens(responses: aioresponses) -> None:
     assert auth.idk_session.access_token == access_token
     assert auth.idk_session.refresh_token == refresh_token
     assert auth.idk_session.id_token == id_token
+
+
+def _token(expires_in: timedelta) -> str:
+    exp = datetime.now(UTC) + expires_in
+    return jwt.encode({"exp": int(exp.timestamp())}, "secret", algorithm="HS256")
+
+
+def _refresh_response(expires_in: timedelta) -> str:
+    return dumps(
+        {
+            "accessToken": _token(expires_in),
+            "refreshToken": _token(timedelta(days=30)),
+            "idToken": _token(expires_in),
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_refresh_locks_are_per_instance() -> None:
+    async with aiohttp.ClientSession() as session:
+        first = MySkodaAuthorization(session)
+        second = MySkodaAuthorization(session)
+        second.idk_session = IDKSession(
+            access_token=_token(timedelta(hours=1)),
+            refresh_token=_token(timedelta(days=30)),
+            id_token=_token(timedelta(hours=1)),
+        )
+
+        async with first._refresh_lock:  # noqa: SLF001
+            # A refresh of another account must not wait for this one.
+            await asyncio.wait_for(second.refresh_token(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_is_scheduled_ahead_of_expiry_with_jitter() -> None:
+    async with aiohttp.ClientSession() as session:
+        auth = MySkodaAuthorization(session)
+        auth.idk_session = IDKSession(
+            access_token=_token(timedelta(hours=1)),
+            refresh_token=_token(timedelta(days=30)),
+            id_token=_token(timedelta(hours=1)),
+        )
+
+        delays = {auth._seconds_until_background_refresh() for _ in range(20)}  # noqa: SLF001
+
+        latest = 3600 - TOKEN_REFRESH_LEAD_IN_SECONDS
+        earliest = latest - TOKEN_REFRESH_JITTER_IN_SECONDS
+        assert all(earliest - 5 <= delay <= latest for delay in delays)
+        assert len(delays) > 1
+
+
+@pytest.mark.asyncio
+async def test_background_refresher_renews_tokens(responses: aioresponses) -> None:
+    responses.post(
+        url=f"{BASE_URL_SKODA}/api/v1/authentication/refresh-token?tokenType=CONNECT",
+        body=_refresh_response(timedelta(hours=1)),
+    )
+    async with aiohttp.ClientSession() as session:
+        auth = MySkodaAuthorization(session)
+        old_token = _token(timedelta(minutes=20))
+        auth.idk_session = IDKSession(
+            access_token=old_token,
+            refresh_token=_token(timedelta(days=30)),
+            id_token=old_token,
+        )
+        auth._seconds_until_background_refresh = lambda: 0  # noqa: SLF001
+
+        auth.start_token_refresher()
+        await asyncio.sleep(0.05)
+        await auth.stop_token_refresher()
+
+        # The token was still valid, yet it was renewed without anyone asking for it.
+        assert auth.idk_session.access_token != old_token
+        assert await auth.get_access_token() == auth.idk_session.access_token
+
+
+@pytest.mark.asyncio
+async def test_token_expiry_is_decoded_once_per_token() -> None:
+    async with aiohttp.ClientSession() as session:
+        auth = MySkodaAuthorization(session)
+        auth.idk_session = IDKSession(
+            access_token=_token(timedelta(hours=1)),
+            refresh_token=_token(timedelta(days=30)),
+            id_token=_token(timedelta(hours=1)),
+        )
+
+        with patch("myskoda.auth.authorization.jwt.decode", wraps=jwt.decode) as decode:
+            for _ in range(10):
+                assert not auth.is_token_expired()
+            assert decode.call_count == 1
+
+            auth.idk_session.access_token = _token(timedelta(minutes=5))
+            assert auth.is_token_expired()
+            assert decode.call_count == 2  # noqa: PLR2004
@@ -0,0 +1,168 @@
+"""Unit tests for myskoda.caching."""
+
+import asyncio
+
+import pytest
+
+from myskoda.caching import (
+    CachedResponse,
+    CachePolicy,
+    ResponseCache,
+    SingleFlight,
+    cache_max_age,
+    current_max_age,
+)
+
+
+@pytest.mark.asyncio
+async def test_single_flight_survives_cancelled_caller() -> None:
+    """Cancelling one caller does not cancel the shared call for the others."""
+    single_flight: SingleFlight[str] = SingleFlight()
+    release = asyncio.Event()
+
+    async def call() -> str:
+        await release.wait()
+        return "result"
+
+    first = asyncio.create_task(single_flight.run("key", call))
+    second = asyncio.create_task(single_flight.run("key", call))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == "result"
+    assert first.cancelled()
+    assert single_flight.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_propagates_errors_and_forgets_key() -> None:
+    """A failed call is raised to every caller and the next call starts afresh."""
+    single_flight: SingleFlight[str] = SingleFlight()
+
+    async def fail() -> str:
+        await asyncio.sleep(0)
+        raise RuntimeError
+
+    results = await asyncio.gather(
+        single_flight.run("key", fail), single_flight.run("key", fail), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert single_flight.in_flight == 0
+    assert single_flight.stats.misses == 1
+    assert single_flight.stats.hits == 1
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _body(cached: CachedResponse | None) -> bytes | None:
+    return cached.body if cached is not None else None
+
+
+POLICIES = [
+    CachePolicy("info", "/v2/garage/vehicles/{vin}", ttl=3600, volatile=False),
+    CachePolicy("charging", "/v1/charging/{vin}", ttl=30),
+    CachePolicy("positions", "/v1/maps/positions", ttl=30),
+]
+
+
+def test_response_cache_expires_entries_per_endpoint() -> None:
+    clock = FakeClock()
+    cache = ResponseCache(POLICIES, clock=clock)
+    cache.put("/v2/garage/vehicles/VIN1?connectivityGenerations=MOD1", b"info")
+    cache.put("/v1/charging/VIN1", b"charging")
+    cache.put("/v1/charging/VIN1/profiles", b"profiles")  # no policy, not cached
+
+    clock.now = 60
+    assert _body(cache.get("/v2/garage/vehicles/VIN1?connectivityGenerations=MOD1")) == b"info"
+    assert cache.get("/v1/charging/VIN1") is None
+    assert cache.get("/v1/charging/VIN1/profiles") is None
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 2  # noqa: PLR2004
+
+
+def test_response_cache_respects_max_age() -> None:
+    clock = FakeClock()
+    cache = ResponseCache(POLICIES, clock=clock)
+    cache.put("/v2/garage/vehicles/VIN1", b"info")
+    clock.now = 60
+
+    assert _body(cache.get("/v2/garage/vehicles/VIN1", max_age=120)) == b"info"
+    assert cache.get("/v2/garage/vehicles/VIN1", max_age=10) is None
+    with cache_max_age(0):
+        assert current_max_age() == 0
+    assert current_max_age() is None
+
+
+def test_response_cache_max_age_zero_bypasses_the_cache() -> None:
+    # The clock doesn't move between storing and reading the entry.
+    cache = ResponseCache(POLICIES, clock=FakeClock())
+    cache.put("/v1/charging/VIN1", b"charging")
+
+    assert cache.get("/v1/charging/VIN1", max_age=0) is None
+    assert _body(cache.get("/v1/charging/VIN1")) == b"charging"
+
+
+def test_response_cache_evicts_least_recently_used() -> None:
+    cache = ResponseCache(POLICIES, max_entries=2, clock=FakeClock())
+    cache.put("/v1/charging/VIN1", b"1")
+    cache.put("/v1/charging/VIN2", b"2")
+    cache.get("/v1/charging/VIN1")
+    cache.put("/v1/charging/VIN3", b"3")
+
+    assert len(cache) == 2  # noqa: PLR2004
+    assert cache.get("/v1/charging/VIN2") is None
+    assert _body(cache.get("/v1/charging/VIN1")) == b"1"
+    assert cache.stats.evictions == 1
+
+
+def test_response_cache_ignores_params_which_do_not_select_the_response() -> None:
+    policy = CachePolicy("timers", "/v1/timers/{vin}", ttl=30, ignored_params=frozenset({"now"}))
+    cache = ResponseCache([policy], clock=FakeClock())
+    cache.put("/v1/timers/VIN1?now=2025-01-01T10%3A00%3A00.000001", b"timers")
+
+    assert _body(cache.get("/v1/timers/VIN1?now=2025-01-01T10%3A00%3A05.123456")) == b"timers"
+    assert policy.key("/v1/timers/VIN1?now=1&kind=a") == "/v1/timers/VIN1?kind=a"
+    assert len(cache) == 1
+
+
+def test_response_cache_invalidation() -> None:
+    cache = ResponseCache(POLICIES, clock=FakeClock())
+    cache.put("/v2/garage/vehicles/VIN1", b"info")
+    cache.put("/v1/charging/VIN1", b"charging")
+    cache.put("/v1/maps/positions?vin=VIN1", b"positions")
+    cache.put("/v1/charging/VIN2", b"other")
+
+    # Only volatile entries of the vehicle are dropped by default.
+    assert cache.invalidate("VIN1") == 2  # noqa: PLR2004
+    assert _body(cache.get("/v2/garage/vehicles/VIN1")) == b"info"
+    assert _body(cache.get("/v1/charging/VIN2")) == b"other"
+
+    assert cache.invalidate("VIN1", names=["info"]) == 1
+    assert cache.invalidate_url("/v1/charging/VIN2/set-charge-limit") == 1
+    assert len(cache) == 0
+
+
+def test_response_cache_skips_responses_invalidated_in_flight() -> None:
+    cache = ResponseCache(POLICIES, clock=FakeClock())
+    charging = cache.generation("/v1/charging/VIN1")
+    info = cache.generation("/v2/garage/vehicles/VIN1")
+    other = cache.generation("/v1/charging/VIN2")
+
+    cache.invalidate("VIN1")
+    cache.put("/v1/charging/VIN1", b"charging", generation=charging)
+    cache.put("/v1/charging/VIN2", b"other", generation=other)
+    assert cache.get("/v1/charging/VIN1") is None
+    assert _body(cache.get("/v1/charging/VIN2")) == b"other"
+
+    # A write invalidates the vehicle even when nothing of it is cached yet.
+    cache.invalidate_url("/v1/charging/VIN1/set-charge-limit")
+    cache.put("/v2/garage/vehicles/VIN1", b"info", generation=info)
+    assert cache.get("/v2/garage/vehicles/VIN1") is None
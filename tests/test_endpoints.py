@@ -0,0 +1,48 @@
+"""Unit tests for myskoda.endpoints."""
+
+import re
+
+from myskoda.caching import DEFAULT_CACHE_POLICIES
+from myskoda.endpoints import (
+    CAPABILITY_ENDPOINTS,
+    DEPARTURE_INFO,
+    DRIVING_RANGE,
+    ENDPOINTS,
+    INFO,
+    POSITIONS,
+    STATUS,
+    TRIP_STATISTICS,
+)
+from myskoda.models.fixtures import Endpoint
+from myskoda.models.info import CapabilityId
+
+
+def test_url_fills_path_and_query() -> None:
+    assert INFO.url(vin="VIN").startswith(
+        "/v2/garage/vehicles/VIN?connectivityGenerations=MOD1&connectivityGenerations=MOD2"
+    )
+    assert POSITIONS.url(vin="VIN") == "/v1/maps/positions?vin=VIN"
+    assert TRIP_STATISTICS.url({"offset": 2}, vin="VIN") == (
+        "/v1/trip-statistics/VIN?offsetType=week&offset=2&timezone=Europe%2FBerlin"
+    )
+    assert re.fullmatch(
+        r"/v1/vehicle-automatization/VIN/departure/timers\?deviceDateTime=\S+%3A\d\d",
+        DEPARTURE_INFO.url(vin="VIN"),
+    )
+
+
+def test_every_fixture_endpoint_is_registered() -> None:
+    for endpoint in Endpoint:
+        if endpoint != Endpoint.ALL:
+            assert ENDPOINTS[endpoint].name == endpoint
+
+
+def test_capabilities_and_cache_policies_come_from_the_registry() -> None:
+    assert CAPABILITY_ENDPOINTS[CapabilityId.STATE] == (STATUS, DRIVING_RANGE)
+    for endpoints in CAPABILITY_ENDPOINTS.values():
+        assert all(endpoint.attribute for endpoint in endpoints)
+
+    policies = {policy.name: policy for policy in DEFAULT_CACHE_POLICIES}
+    assert policies["info"].path == "/v2/garage/vehicles/{vin}"
+    assert policies["positions"].path == "/v1/maps/positions"
+    assert "trip_statistics" not in policies
@@ -0,0 +1,98 @@
+"""Unit tests for myskoda.event_queue."""
+
+import asyncio
+
+import pytest
+
+from myskoda.event_queue import EventQueue, OverflowPolicy
+from myskoda.models.event import BaseEvent, EventType
+from myskoda.mqtt import MySkodaMqttClient
+
+
+def _event(vin: str, trace_id: str, event_type: EventType = EventType.SERVICE_EVENT) -> BaseEvent:
+    return BaseEvent(vin=vin, event_type=event_type, version=1, trace_id=trace_id)
+
+
+class BlockedConsumer:
+    """Records events once released, until it has the expected number of them."""
+
+    def __init__(self, expected: int) -> None:
+        self.expected = expected
+        self.released = asyncio.Event()
+        self.started = asyncio.Event()
+        self.done = asyncio.Event()
+        self.events: list[str] = []
+
+    async def __call__(self, event: BaseEvent) -> None:
+        self.started.set()
+        await self.released.wait()
+        self.events.append(event.trace_id)
+        if len(self.events) == self.expected:
+            self.done.set()
+
+    async def release(self) -> None:
+        self.released.set()
+        async with asyncio.timeout(1):
+            await self.done.wait()
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_keeps_the_newest_events() -> None:
+    consumer = BlockedConsumer(expected=3)
+    queue = EventQueue(consumer, maxsize=2, overflow=OverflowPolicy.DROP_OLDEST)
+
+    await queue.put(_event("VIN", "first"))
+    await consumer.started.wait()
+    for trace_id in ("second", "third", "fourth"):
+        await queue.put(_event("VIN", trace_id))
+    assert queue.stats.depth == queue.maxsize
+
+    await consumer.release()
+    await queue.stop()
+
+    assert consumer.events == ["first", "third", "fourth"]
+    assert queue.stats.dropped == 1
+    assert queue.stats.max_lag > 0
+
+
+@pytest.mark.asyncio
+async def test_coalesce_replaces_queued_event_of_same_vehicle_and_type() -> None:
+    consumer = BlockedConsumer(expected=3)
+    queue = EventQueue(consumer, maxsize=2, overflow=OverflowPolicy.COALESCE)
+
+    await queue.put(_event("VIN", "first"))
+    await consumer.started.wait()
+    await queue.put(_event("VIN1", "second"))
+    await queue.put(_event("VIN2", "third"))
+    await queue.put(_event("VIN1", "fourth"))
+    # Nothing to coalesce with, so the oldest event is dropped.
+    await queue.put(_event("VIN3", "fifth"))
+
+    await consumer.release()
+    await queue.stop()
+
+    assert consumer.events == ["first", "third", "fifth"]
+    assert queue.stats.coalesced == 1
+    assert queue.stats.dropped == 1
+
+
+@pytest.mark.asyncio
+async def test_block_waits_for_room(myskoda_mqtt_client: MySkodaMqttClient) -> None:
+    consumer = BlockedConsumer(expected=3)
+    queue = EventQueue(consumer, maxsize=1, workers=1)
+    myskoda_mqtt_client.subscribe(queue)
+
+    await myskoda_mqtt_client._emit(_event("VIN", "first"))  # noqa: SLF001
+    await consumer.started.wait()
+    await myskoda_mqtt_client._emit(_event("VIN", "second"))  # noqa: SLF001
+    blocked = asyncio.create_task(myskoda_mqtt_client._emit(_event("VIN", "third")))  # noqa: SLF001
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    await consumer.release()
+    assert blocked.done()
+    await myskoda_mqtt_client.disconnect()
+
+    assert consumer.events == ["first", "second", "third"]
+    assert queue.stats.dropped == 0
+    assert queue.stats.max_depth == 1
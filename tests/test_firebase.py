@@ -2,12 +2,15 @@
 
 import gzip
 import json
+import time
+from pathlib import Path
 from unittest.mock import AsyncMock
 
 import pytest
 from aiohttp import ClientSession
 from aioresponses import aioresponses
 from firebase_messaging.const import AUTH_VERSION, FCM_INSTALLATION, GCM_REGISTER_URL
+from yarl import URL
 
 from myskoda.const import (
     FIREBASE_ANDROID_CERT,
@@ -23,7 +26,13 @@ from myskoda.const import (
     MYSKODA_APP_VERSION,
     MYSKODA_APP_VERSION_CODE,
 )
-from myskoda.firebase import FirebaseClient
+from myskoda.firebase import (
+    FcmCredentials,
+    FileFcmCredentialStore,
+    FirebaseClient,
+    MemoryFcmCredentialStore,
+)
+from myskoda.myskoda import MySkoda
 
 
 @pytest.mark.asyncio
@@ -121,3 +130,107 @@ async def test_register_android_fcm_token_retries_registration_error(
 
     assert token == "android-fcm-token"  # noqa: S105
     sleep.assert_awaited_once_with(1)
+
+
+def _credentials(registered_at: float, installation_expires_at: float) -> FcmCredentials:
+    return FcmCredentials(
+        android_id="android-id",
+        security_token="security-token",  # noqa: S106
+        fid="fid",
+        installation_token="fis-auth-token",  # noqa: S106
+        installation_expires_at=installation_expires_at,
+        fcm_token="stored-fcm-token",  # noqa: S106
+        registered_at=registered_at,
+    )
+
+
+@pytest.mark.asyncio
+async def test_register_reuses_checkin_and_installation(
+    monkeypatch: pytest.MonkeyPatch, responses: aioresponses
+) -> None:
+    check_in = AsyncMock()
+    monkeypatch.setattr(FirebaseClient, "_get_gcm_credentials", check_in)
+    responses.post(GCM_REGISTER_URL, body="token=android-fcm-token")
+    previous = _credentials(time.time() - 90 * 24 * 3600, time.time() + 24 * 3600)
+
+    async with ClientSession() as session:
+        credentials = await FirebaseClient(session).register(previous)
+
+    check_in.assert_not_awaited()
+    # Only the FCM registration was requested, not a new installation.
+    assert list(responses.requests) == [("POST", URL(GCM_REGISTER_URL))]
+    assert credentials.fcm_token == "android-fcm-token"  # noqa: S105
+    assert credentials.fid == "fid"
+    assert not credentials.is_expired()
+
+
+@pytest.mark.asyncio
+async def test_register_renews_expired_installation(
+    monkeypatch: pytest.MonkeyPatch, responses: aioresponses
+) -> None:
+    monkeypatch.setattr(FirebaseClient, "_generate_fid", staticmethod(lambda: "new-fid"))
+    responses.post(
+        f"{FCM_INSTALLATION}projects/{FIREBASE_PROJECT_ID}/installations",
+        payload={"fid": "new-fid", "authToken": {"token": "new-auth", "expiresIn": "604800s"}},
+    )
+    responses.post(GCM_REGISTER_URL, body="token=android-fcm-token")
+    previous = _credentials(time.time() - 90 * 24 * 3600, time.time() - 1)
+
+    async with ClientSession() as session:
+        credentials = await FirebaseClient(session).register(previous)
+
+    assert credentials.fid == "new-fid"
+    assert credentials.installation_token == "new-auth"  # noqa: S105
+    assert not credentials.is_installation_expired()
+
+
+@pytest.mark.asyncio
+async def test_file_credential_store_round_trip(tmp_path: Path) -> None:
+    credentials = _credentials(time.time(), time.time() + 24 * 3600)
+    await FileFcmCredentialStore(tmp_path / "fcm.json").save("user@example.com", credentials)
+
+    store = FileFcmCredentialStore(tmp_path / "fcm.json")
+    assert await store.load("user@example.com") == credentials
+    await store.clear("user@example.com")
+    assert await store.load("user@example.com") is None
+
+
+@pytest.mark.asyncio
+async def test_myskoda_reuses_stored_fcm_registration() -> None:
+    store = MemoryFcmCredentialStore()
+    await store.save("default", _credentials(time.time(), time.time() + 24 * 3600))
+
+    async with ClientSession() as session:
+        myskoda = MySkoda(session, mqtt_enabled=False, fcm_credential_store=store)
+        myskoda.firebase.register = AsyncMock()
+        myskoda.rest_api.register_fcm_token = AsyncMock()
+
+        token = await myskoda._get_fcm_token()  # noqa: SLF001
+
+    assert token == "stored-fcm-token"  # noqa: S105
+    myskoda.firebase.register.assert_not_awaited()
+    myskoda.rest_api.register_fcm_token.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_myskoda_renews_expired_and_rejected_fcm_registration() -> None:
+    store = MemoryFcmCredentialStore()
+    expired = _credentials(time.time() - 90 * 24 * 3600, time.time() + 24 * 3600)
+    await store.save("default", expired)
+    renewed = _credentials(time.time(), time.time() + 24 * 3600)
+    renewed.fcm_token = "renewed-fcm-token"  # noqa: S105
+
+    async with ClientSession() as session:
+        myskoda = MySkoda(session, mqtt_enabled=False, fcm_credential_store=store)
+        myskoda.firebase.register = AsyncMock(return_value=renewed)
+        myskoda.rest_api.register_fcm_token = AsyncMock()
+
+        assert await myskoda._get_fcm_token() == "renewed-fcm-token"  # noqa: SLF001
+        # An expired registration is renewed reusing the previous check-in.
+        myskoda.firebase.register.assert_awaited_once_with(expired)
+        myskoda.rest_api.register_fcm_token.assert_awaited_once_with(fcm_token=renewed.fcm_token)
+        assert await store.load("default") == renewed
+
+        # A token rejected by the broker is registered from scratch.
+        await myskoda._get_fcm_token(force_refresh=True)  # noqa: SLF001
+        myskoda.firebase.register.assert_awaited_with(None)
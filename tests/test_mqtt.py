@@ -2,9 +2,10 @@
 
 import asyncio
 import json
+from collections.abc import AsyncIterator, Callable, Coroutine
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import Self
+from typing import Any, Self
 from unittest.mock import ANY, AsyncMock, patch
 
 import aiomqtt
@@ -46,7 +47,12 @@ from myskoda.models.event import (
     VehicleEventWarningBatterylevel,
 )
 from myskoda.models.vehicle_ignition_status import IgnitionStatus
-from myskoda.mqtt import MySkodaMqttClient, _is_auth_failure
+from myskoda.mqtt import (
+    MySkodaMqttClient,
+    SubscriptionMode,
+    _is_auth_failure,
+    vehicle_topics,
+)
 from myskoda.myskoda import MySkoda
 
 from .conftest import FakeMqttClientWrapper
@@ -115,6 +121,206 @@ async def test_connect_timeout_raises_and_cancels_listener(fake_authorization: o
     assert client._listener_task is None  # noqa: SLF001
 
 
+@pytest.mark.asyncio
+async def test_subscriptions_are_batched(
+    myskoda_mqtt_client: MySkodaMqttClient, fake_mqtt_client_wrapper: FakeMqttClientWrapper
+) -> None:
+    vins = [f"TMOCKAA0AA0000{index:02}" for index in range(20)]
+    await myskoda_mqtt_client.connect(user_id="1234", vehicle_vins=vins)
+
+    subscribed = [name for packet in fake_mqtt_client_wrapper.subscriptions for name, _ in packet]
+    assert subscribed == [topic for vin in vins for topic in vehicle_topics("1234", vin)]
+    assert all(len(packet) <= 100 for packet in fake_mqtt_client_wrapper.subscriptions)  # noqa: PLR2004
+    stats = myskoda_mqtt_client.subscription_stats
+    assert stats.mode == SubscriptionMode.EXPLICIT
+    assert stats.topics == len(subscribed)
+    assert stats.packets == len(fake_mqtt_client_wrapper.subscriptions) < len(vins)
+    assert stats.failed == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("reject_wildcards", [False, True])
+async def test_wildcard_subscriptions_fall_back_to_explicit_topics(
+    fake_authorization: object, reject_wildcards: bool
+) -> None:
+    wrapper = FakeMqttClientWrapper(messages=[], reject_wildcards=reject_wildcards)
+    client = MySkodaMqttClient(
+        authorization=fake_authorization,  # type: ignore[arg-type]
+        refresh_fcm_token=AsyncMock(return_value="test-fcm-token"),
+        mqtt_client=wrapper,
+        subscription_mode=SubscriptionMode.WILDCARD,
+    )
+    await client.connect(user_id="1234", vehicle_vins=["VIN1", "VIN2"])
+    await client.disconnect()
+
+    assert wrapper.subscriptions[0] == [("1234/VIN1/#", 0), ("1234/VIN2/#", 0)]
+    stats = client.subscription_stats
+    if reject_wildcards:
+        assert len(wrapper.subscriptions) == 2  # noqa: PLR2004
+        assert [name for name, _ in wrapper.subscriptions[1]] == [
+            *vehicle_topics("1234", "VIN1"),
+            *vehicle_topics("1234", "VIN2"),
+        ]
+        assert stats.fallbacks == 1
+        # Later reconnects don't try the wildcard again.
+        assert client.subscription_mode == SubscriptionMode.EXPLICIT
+    else:
+        assert len(wrapper.subscriptions) == 1
+        assert stats.mode == SubscriptionMode.WILDCARD
+        assert stats.fallbacks == 0
+
+
+@pytest.mark.asyncio
+async def test_add_and_remove_vehicle_on_live_connection(
+    connected_mqtt_client: MySkodaMqttClient, fake_mqtt_client_wrapper: FakeMqttClientWrapper
+) -> None:
+    packets = len(fake_mqtt_client_wrapper.subscriptions)
+
+    await connected_mqtt_client.add_vehicle("TMOCKAA0AA000001")
+    await connected_mqtt_client.add_vehicle("TMOCKAA0AA000001")
+
+    assert connected_mqtt_client.vehicle_vins == ["TMOCKAA0AA000000", "TMOCKAA0AA000001"]
+    new_packets = fake_mqtt_client_wrapper.subscriptions[packets:]
+    assert [name for packet in new_packets for name, _ in packet] == vehicle_topics(
+        "1234", "TMOCKAA0AA000001"
+    )
+
+    await connected_mqtt_client.remove_vehicle("TMOCKAA0AA000000")
+
+    assert connected_mqtt_client.vehicle_vins == ["TMOCKAA0AA000001"]
+    assert fake_mqtt_client_wrapper.unsubscriptions == [vehicle_topics("1234", "TMOCKAA0AA000000")]
+
+
+@pytest.mark.asyncio
+async def test_added_vehicle_is_subscribed_after_reconnect(fake_authorization: object) -> None:
+    connection_lost = asyncio.Event()
+    resubscribed = asyncio.Event()
+
+    class DroppedMessages:
+        def __aiter__(self) -> Self:
+            return self
+
+        async def __anext__(self) -> aiomqtt.Message:
+            await connection_lost.wait()
+            msg = "connection lost"
+            raise aiomqtt.MqttError(msg)
+
+    class DroppingWrapper(FakeMqttClientWrapper):
+        connections = 0
+
+        async def __aenter__(self) -> Self:
+            self.connections += 1
+            return await super().__aenter__()
+
+        @property
+        def messages(self) -> AsyncIterator:
+            if self.connections == 1:
+                return DroppedMessages()
+            resubscribed.set()
+            return super().messages
+
+    wrapper = DroppingWrapper(messages=[])
+    client = MySkodaMqttClient(
+        authorization=fake_authorization,  # type: ignore[arg-type]
+        refresh_fcm_token=AsyncMock(return_value="test-fcm-token"),
+        mqtt_client=wrapper,
+    )
+    with patch("myskoda.mqtt.MQTT_RECONNECT_DELAY", 0):
+        client._reconnect_delay = 0  # noqa: SLF001
+        await client.connect(user_id="1234", vehicle_vins=["VIN1"], connect_timeout=2)
+        await client.add_vehicle("VIN2")
+        packets = len(wrapper.subscriptions)
+
+        connection_lost.set()
+        async with asyncio.timeout(2):
+            await resubscribed.wait()
+    await client.disconnect()
+
+    topics = [name for packet in wrapper.subscriptions[packets:] for name, _ in packet]
+    assert topics == [*vehicle_topics("1234", "VIN1"), *vehicle_topics("1234", "VIN2")]
+
+
+@pytest.mark.asyncio
+async def test_resumed_session_is_not_resubscribed(fake_authorization: object) -> None:
+    connection_lost = asyncio.Event()
+    recovered = asyncio.Event()
+    queued = aiomqtt.Message(
+        topic="1234/VIN1/service-event/vehicle-status/lights",
+        payload=json2mqtt(
+            {
+                "version": 1,
+                "traceId": "7a59299d06535a6756d10e96e0c75ed3",
+                "timestamp": (datetime.now(UTC) - timedelta(minutes=1)).isoformat(),
+                "producer": "SKODA_MHUB",
+                "name": "change-lights",
+                "data": {"userId": "1234", "vin": "VIN1"},
+            }
+        ),
+        qos=1,
+        retain=False,
+        mid=1,
+        properties=None,
+    )
+
+    class DroppedMessages:
+        def __aiter__(self) -> Self:
+            return self
+
+        async def __anext__(self) -> aiomqtt.Message:
+            await connection_lost.wait()
+            msg = "connection lost"
+            raise aiomqtt.MqttError(msg)
+
+    class ResumingWrapper(FakeMqttClientWrapper):
+        connections = 0
+
+        async def __aenter__(self) -> Self:
+            self.connections += 1
+            self.session_present = self.connections > 1
+            return await super().__aenter__()
+
+        @property
+        def messages(self) -> AsyncIterator:
+            if self.connections == 1:
+                return DroppedMessages()
+            return super().messages
+
+    session_expiry = 3600
+    wrapper = ResumingWrapper(messages=[queued])
+    client = MySkodaMqttClient(
+        authorization=fake_authorization,  # type: ignore[arg-type]
+        refresh_fcm_token=AsyncMock(return_value="test-fcm-token"),
+        mqtt_client=wrapper,
+        session_expiry=session_expiry,
+    )
+
+    async def on_event(_event: BaseEvent) -> None:
+        recovered.set()
+
+    client.subscribe(on_event)
+    with patch("myskoda.mqtt.MQTT_RECONNECT_DELAY", 0):
+        client._reconnect_delay = 0  # noqa: SLF001
+        await client.connect(user_id="1234", vehicle_vins=["VIN1", "VIN2"], connect_timeout=2)
+        packets = len(wrapper.subscriptions)
+        # Changed while disconnected, so the resumed session must be updated.
+        client.vehicle_vins.remove("VIN2")
+        client.vehicle_vins.append("VIN3")
+
+        connection_lost.set()
+        async with asyncio.timeout(2):
+            await recovered.wait()
+    await client.disconnect()
+
+    assert wrapper.session_expiry == session_expiry
+    assert {qos for packet in wrapper.subscriptions for _, qos in packet} == {1}
+    topics = [name for packet in wrapper.subscriptions[packets:] for name, _ in packet]
+    assert topics == vehicle_topics("1234", "VIN3")
+    assert wrapper.unsubscriptions == [vehicle_topics("1234", "VIN2")]
+    assert client.session_stats.started == 1
+    assert client.session_stats.resumed == 1
+    assert client.session_stats.recovered == 1
+
+
 @pytest.mark.asyncio
 async def test_auth_failure_triggers_fcm_refresh(fake_authorization: object) -> None:
     """An MQTT auth failure must call refresh_fcm_token and use the new token next attempt."""
@@ -842,3 +1048,41 @@ def test_process_charging_event_update_driving_range_respects_timestamp(
     MySkoda._process_charging_event_update_driving_range(driving_range, event)  # noqa: SLF001
 
     assert driving_range.primary_engine_range.current_soc_in_percent == expected_soc
+
+
+@pytest.mark.asyncio
+async def test_subscribe_routes_events_by_vin_and_type(
+    myskoda_mqtt_client: MySkodaMqttClient,
+) -> None:
+    def _event(vin: str, event_type: EventType) -> BaseEvent:
+        return BaseEvent(vin=vin, event_type=event_type, version=1, trace_id="trace")
+
+    received: dict[str, list[tuple[str, EventType]]] = {"all": [], "vin": [], "service": []}
+
+    def recorder(name: str) -> Callable[[BaseEvent], Coroutine[Any, Any, None]]:
+        async def record(event: BaseEvent) -> None:
+            received[name].append((event.vin, event.event_type))
+
+        return record
+
+    myskoda_mqtt_client.subscribe(recorder("all"))
+    unsubscribe = myskoda_mqtt_client.subscribe(recorder("vin"), vins=["VIN1"])
+    myskoda_mqtt_client.subscribe(
+        recorder("service"), vins=["VIN1", "VIN2"], event_types=[EventType.SERVICE_EVENT]
+    )
+
+    await myskoda_mqtt_client._emit(_event("VIN1", EventType.SERVICE_EVENT))  # noqa: SLF001
+    await myskoda_mqtt_client._emit(_event("VIN2", EventType.VEHICLE_EVENT))  # noqa: SLF001
+    unsubscribe()
+    await myskoda_mqtt_client._emit(_event("VIN1", EventType.VEHICLE_EVENT))  # noqa: SLF001
+    await asyncio.sleep(0)
+
+    assert received == {
+        "all": [
+            ("VIN1", EventType.SERVICE_EVENT),
+            ("VIN2", EventType.VEHICLE_EVENT),
+            ("VIN1", EventType.VEHICLE_EVENT),
+        ],
+        "vin": [("VIN1", EventType.SERVICE_EVENT)],
+        "service": [("VIN1", EventType.SERVICE_EVENT)],
+    }
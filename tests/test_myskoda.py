@@ -1,12 +1,32 @@
 """Unit tests for myskoda.py."""
 
-from unittest.mock import AsyncMock
+import asyncio
+from contextlib import aclosing
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from aiohttp import ClientSession
 
+from myskoda.endpoints import CHARGING, STATUS, EndpointSpec
+from myskoda.models.charging import Charging
+from myskoda.models.event import (
+    ServiceEvent,
+    ServiceEventChangeAccess,
+    ServiceEventChangeLights,
+    ServiceEventChangeOdometer,
+    ServiceEventChangeSoc,
+    ServiceEventChangeSocData,
+    ServiceEventData,
+    ServiceEventName,
+)
+from myskoda.models.event.service import ServiceEventChargingStatusChanged
+from myskoda.models.info import CapabilityId
 from myskoda.mqtt import MySkodaMqttClient
 from myskoda.myskoda import MySkoda
+from myskoda.vehicle import Vehicle, VehicleSection
 from tests.conftest import FakeMqttClientWrapper
 
 
@@ -97,3 +117,518 @@ async def test_myskoda_enable_mqtt_uses_existing_mqtt_client(
         assert myskoda_mqtt_client.user_id == "user-id"
         assert myskoda_mqtt_client.vehicle_vins == ["vin"]
         assert fake_mqtt_client_wrapper.connect_properties_fcm_token == "test-fcm-token"  # noqa: S105
+
+
+@pytest.mark.asyncio
+async def test_connect_loads_vehicles_while_connecting_mqtt() -> None:
+    async with ClientSession() as session:
+        myskoda = MySkoda(session, mqtt_enabled=True)
+        myskoda.authorization.authorize = AsyncMock()
+        myskoda.get_user = AsyncMock(return_value=SimpleNamespace(id="user-id"))
+        myskoda.list_vehicle_vins = AsyncMock(return_value=["vin-1", "vin-2"])
+        myskoda._get_fcm_token = AsyncMock(return_value="fcm-token")  # noqa: SLF001
+        myskoda.get_info = AsyncMock(return_value=_fake_info())
+        myskoda.get_maintenance = AsyncMock()
+        myskoda._request_capability_data = AsyncMock()  # noqa: SLF001
+        vehicles_loaded = asyncio.Event()
+
+        async def connect_mqtt(vins: list[str]) -> None:
+            assert vins == ["vin-1", "vin-2"]
+            # Only completes if the vehicles are loaded concurrently.
+            await vehicles_loaded.wait()
+
+        async def load_vehicles(vins: list[str], start: float) -> None:
+            await original_load_vehicles(vins, start)
+            vehicles_loaded.set()
+
+        original_load_vehicles = myskoda._load_startup_vehicles  # noqa: SLF001
+        myskoda._connect_mqtt = connect_mqtt  # noqa: SLF001
+        myskoda._load_startup_vehicles = load_vehicles  # noqa: SLF001
+
+        async with asyncio.timeout(1):
+            await myskoda.connect("user@example.com", "password", load_vehicles=True)
+
+        report = myskoda.startup_report
+        assert report is not None
+        assert report.fleet is not None
+        assert set(report.fleet.vehicles) == {"vin-1", "vin-2"}
+        assert set(report.phases) == {"authorize", "user", "garage", "fcm", "vehicles"}
+        assert report.time_to_first_state is not None
+        assert report.time_to_first_state <= report.total
+        # The garage and user are fetched once and shared between MQTT and vehicle loading.
+        myskoda.list_vehicle_vins.assert_awaited_once()
+        myskoda.get_user.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_connect_waits_for_cancelled_steps() -> None:
+    """When connecting MQTT fails, loading the vehicles is cancelled before connect raises."""
+    async with ClientSession() as session:
+        myskoda = MySkoda(session, mqtt_enabled=True)
+        myskoda.authorization.authorize = AsyncMock()
+        myskoda.get_user = AsyncMock(return_value=SimpleNamespace(id="user-id"))
+        myskoda.list_vehicle_vins = AsyncMock(return_value=["vin-1"])
+        myskoda._get_fcm_token = AsyncMock(return_value="fcm-token")  # noqa: SLF001
+        loading = asyncio.Event()
+        cancelled = False
+
+        async def connect_mqtt(_vins: list[str]) -> None:
+            await loading.wait()
+            raise ConnectionError
+
+        async def load_vehicles(_vins: list[str], _start: float) -> None:
+            nonlocal cancelled
+            loading.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        with (
+            patch.object(myskoda, "_connect_mqtt", connect_mqtt),
+            patch.object(myskoda, "_load_startup_vehicles", load_vehicles),
+            pytest.raises(ConnectionError),
+        ):
+            await myskoda.connect("user@example.com", "password", load_vehicles=True)
+
+        assert cancelled
+
+
+@pytest.mark.asyncio
+async def test_connect_waits_for_cancelled_mqtt_preparation() -> None:
+    """When fetching the user fails, fetching the FCM token is cancelled before connect raises."""
+    async with ClientSession() as session:
+        myskoda = MySkoda(session, mqtt_enabled=True)
+        myskoda.authorization.authorize = AsyncMock()
+        myskoda.list_vehicle_vins = AsyncMock(return_value=["vin-1"])
+        fetching_token = asyncio.Event()
+        cancelled = False
+
+        async def get_user() -> None:
+            await fetching_token.wait()
+            raise ConnectionError
+
+        async def get_fcm_token() -> str:
+            nonlocal cancelled
+            fetching_token.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            return "fcm-token"
+
+        with (
+            patch.object(myskoda, "get_user", get_user),
+            patch.object(myskoda, "_get_fcm_token", get_fcm_token),
+            pytest.raises(ConnectionError),
+        ):
+            await myskoda.connect("user@example.com", "password", load_vehicles=True)
+
+        assert cancelled
+
+
+@pytest.mark.asyncio
+async def test_connect_loads_vehicles_without_mqtt() -> None:
+    async with ClientSession() as session:
+        myskoda = MySkoda(session, mqtt_enabled=False)
+        myskoda.authorization.authorize = AsyncMock()
+        myskoda.list_vehicle_vins = AsyncMock(return_value=["vin-1"])
+        myskoda.get_info = AsyncMock(return_value=_fake_info())
+        myskoda.get_maintenance = AsyncMock()
+        myskoda._request_capability_data = AsyncMock()  # noqa: SLF001
+
+        await myskoda.connect("user@example.com", "password", load_vehicles=True)
+
+        report = myskoda.startup_report
+        assert report is not None
+        assert set(report.phases) == {"authorize", "garage", "vehicles"}
+        assert report.fleet is not None
+        assert report.fleet.complete
+
+
+@pytest.mark.asyncio
+async def test_sync_garage_updates_live_subscriptions(
+    myskoda_mqtt_client: MySkodaMqttClient,
+) -> None:
+    async with ClientSession() as session:
+        myskoda = MySkoda(session, mqtt_enabled=False)
+        myskoda.mqtt = myskoda_mqtt_client
+        await myskoda_mqtt_client.connect(user_id="user-id", vehicle_vins=["vin-1", "vin-2"])
+        myskoda._vehicles["vin-1"] = Vehicle(info=_fake_info(), maintenance=None)  # noqa: SLF001  # pyright: ignore[reportArgumentType]
+        myskoda.list_vehicle_vins = AsyncMock(return_value=["vin-2", "vin-3"])
+        myskoda_mqtt_client.add_vehicle = AsyncMock(wraps=myskoda_mqtt_client.add_vehicle)
+        myskoda_mqtt_client.remove_vehicle = AsyncMock(wraps=myskoda_mqtt_client.remove_vehicle)
+
+        added, removed = await myskoda.sync_garage()
+
+        assert (added, removed) == (["vin-3"], ["vin-1"])
+        myskoda_mqtt_client.add_vehicle.assert_awaited_once_with("vin-3")
+        myskoda_mqtt_client.remove_vehicle.assert_awaited_once_with("vin-1")
+        assert myskoda_mqtt_client.vehicle_vins == ["vin-2", "vin-3"]
+        assert "vin-1" not in myskoda._vehicles  # noqa: SLF001
+        assert await myskoda.sync_garage() == ([], [])
+
+
+@pytest.mark.asyncio
+async def test_garage_sync_reports_changes_periodically() -> None:
+    async with ClientSession() as session:
+        myskoda = MySkoda(session, mqtt_enabled=False)
+        changed = asyncio.Event()
+        myskoda.sync_garage = AsyncMock(side_effect=[([], []), (["vin-1"], [])])
+
+        async def on_change(added: list[str], removed: list[str]) -> None:
+            assert (added, removed) == (["vin-1"], [])
+            changed.set()
+
+        myskoda.start_garage_sync(interval=0, on_change=on_change)
+        async with asyncio.timeout(1):
+            await changed.wait()
+        await myskoda.disconnect()
+
+        assert myskoda._garage_sync_task is None  # noqa: SLF001
+
+
+def _fake_info() -> object:
+    return type("Info", (), {"is_capability_available": lambda _self, _capa: True})()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("limit", "expected_peak"), [(1, 1), (2, 2), (10, 6)])
+async def test_get_partial_vehicle_limits_concurrent_capability_requests(
+    limit: int, expected_peak: int
+) -> None:
+    async with ClientSession() as session:
+        myskoda = MySkoda(session, mqtt_enabled=False, max_concurrent_requests_per_vehicle=limit)
+        myskoda.get_info = AsyncMock(return_value=_fake_info())
+        myskoda.get_maintenance = AsyncMock()
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_fetch(endpoint: EndpointSpec, **_kwargs: str) -> SimpleNamespace:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return SimpleNamespace(result=endpoint.name)
+
+        myskoda.rest_api.fetch = AsyncMock(side_effect=fake_fetch)
+
+        capabilities = [
+            CapabilityId.AIR_CONDITIONING,
+            CapabilityId.CHARGING,
+            CapabilityId.PARKING_POSITION,
+            CapabilityId.VEHICLE_HEALTH_INSPECTION,
+            # Requests status and driving range, each counting against the limit.
+            CapabilityId.STATE,
+        ]
+        await myskoda.get_partial_vehicle("vin", capabilities)
+
+        assert peak == expected_peak
+        assert set(myskoda.load_timings("vin")) == {"info", "maintenance", *capabilities}
+
+
+@pytest.mark.asyncio
+async def test_get_partial_vehicle_isolates_failing_capability() -> None:
+    async with ClientSession() as session:
+        myskoda = MySkoda(session, mqtt_enabled=False)
+        myskoda.get_info = AsyncMock(return_value=_fake_info())
+        myskoda.get_maintenance = AsyncMock()
+
+        async def fake_fetch(endpoint: EndpointSpec, **_kwargs: str) -> SimpleNamespace:
+            if endpoint is CHARGING:
+                msg = "boom"
+                raise RuntimeError(msg)
+            return SimpleNamespace(result="air-conditioning")
+
+        myskoda.rest_api.fetch = AsyncMock(side_effect=fake_fetch)
+
+        vehicle = await myskoda.get_partial_vehicle(
+            "vin", [CapabilityId.CHARGING, CapabilityId.AIR_CONDITIONING]
+        )
+
+        assert vehicle.charging is None
+        assert vehicle.air_conditioning == "air-conditioning"
+
+
+@pytest.mark.asyncio
+async def test_failing_request_cancels_the_other_requests_of_its_capability() -> None:
+    async with ClientSession() as session:
+        myskoda = MySkoda(session, mqtt_enabled=False)
+        myskoda.get_info = AsyncMock(return_value=_fake_info())
+        myskoda.get_maintenance = AsyncMock()
+        cancelled = asyncio.Event()
+
+        async def fake_fetch(endpoint: EndpointSpec, **_kwargs: str) -> SimpleNamespace:
+            if endpoint is STATUS:
+                await asyncio.sleep(0)
+                msg = "boom"
+                raise RuntimeError(msg)
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return SimpleNamespace(result=endpoint.name)
+
+        myskoda.rest_api.fetch = AsyncMock(side_effect=fake_fetch)
+
+        vehicle = await myskoda.get_partial_vehicle("vin", [CapabilityId.STATE])
+
+        assert cancelled.is_set()
+        assert vehicle.status is None
+        assert vehicle.driving_range is None
+
+
+def test_myskoda_rejects_invalid_concurrency() -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        MySkoda(None, max_concurrent_requests_per_vehicle=0)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_get_vehicles_reports_partial_failures() -> None:
+    async with ClientSession() as session:
+        myskoda = MySkoda(session, mqtt_enabled=False)
+
+        async def fake_get_info(vin: str) -> object:
+            if vin == "broken":
+                msg = "garage unavailable"
+                raise RuntimeError(msg)
+            return _fake_info()
+
+        myskoda.get_maintenance = AsyncMock()
+        myskoda._request_capability_data = AsyncMock()  # noqa: SLF001
+
+        with patch.object(myskoda, "get_info", side_effect=fake_get_info):
+            report = await myskoda.get_vehicles(["vin-1", "broken", "vin-2", "vin-1"])
+
+        assert sorted(r.vin for r in report.results) == ["broken", "vin-1", "vin-2"]
+        assert set(report.vehicles) == {"vin-1", "vin-2"}
+        assert list(report.failures) == ["broken"]
+        assert report.complete is False
+        assert myskoda.vehicle("vin-1") is report.vehicles["vin-1"]
+
+
+@pytest.mark.asyncio
+async def test_iter_vehicles_shares_global_request_budget() -> None:
+    async with ClientSession() as session:
+        myskoda = MySkoda(session, mqtt_enabled=False)
+        myskoda.get_info = AsyncMock(return_value=_fake_info())
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_request(_vin: str) -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        myskoda._request_capability_data = AsyncMock()  # noqa: SLF001
+
+        vins = [f"vin-{i}" for i in range(6)]
+        with patch.object(myskoda, "get_maintenance", side_effect=fake_request):
+            completed = [
+                result.vin
+                async for result in myskoda.iter_vehicles(vins, max_concurrent_requests=3)
+            ]
+
+        assert sorted(completed) == vins
+        assert peak == 3  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_iter_vehicles_cancels_pending_loads_when_closed() -> None:
+    async with ClientSession() as session:
+        myskoda = MySkoda(session, mqtt_enabled=False)
+        myskoda.get_info = AsyncMock(return_value=_fake_info())
+        myskoda._request_capability_data = AsyncMock()  # noqa: SLF001
+        cancelled = asyncio.Event()
+
+        async def fake_get_maintenance(vin: str) -> None:
+            if vin == "slow":
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+
+        with patch.object(myskoda, "get_maintenance", side_effect=fake_get_maintenance):
+            async with aclosing(myskoda.iter_vehicles(["fast", "slow"])) as results:
+                async for result in results:
+                    assert result.vin == "fast"
+                    break
+
+        assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_iter_vehicles_refresh_notifies_callbacks() -> None:
+    async with ClientSession() as session:
+        myskoda = MySkoda(session, mqtt_enabled=False)
+        myskoda.get_info = AsyncMock(return_value=_fake_info())
+        myskoda.get_maintenance = AsyncMock()
+        myskoda._request_capability_data = AsyncMock()  # noqa: SLF001
+        callback = AsyncMock()
+        myskoda.subscribe_updates("vin", callback)
+
+        results = [result async for result in myskoda.iter_vehicles(["vin"], refresh=True)]
+        await asyncio.sleep(0)
+
+        assert results[0].success
+        callback.assert_awaited_once_with("vin")
+
+
+def _charging(age: timedelta, captured: str) -> Charging:
+    raw = (Path(__file__).parent / "fixtures" / "superb" / "charging-iV.json").read_text()
+    charging = Charging.from_json(raw)
+    charging.timestamp = datetime.now(UTC) - age
+    charging.car_captured_timestamp = datetime.fromisoformat(captured)
+    return charging
+
+
+def _vehicle_with_charging(myskoda: MySkoda, charging: Charging | None) -> Vehicle:
+    vehicle = Vehicle.__new__(Vehicle)
+    vehicle.info = SimpleNamespace(vin="vin")  # pyright: ignore[reportAttributeAccessIssue]
+    vehicle.charging = charging
+    myskoda._vehicles["vin"] = vehicle  # noqa: SLF001
+    return vehicle
+
+
+@pytest.mark.asyncio
+async def test_read_section_returns_fresh_data_without_fetching() -> None:
+    async with ClientSession() as session:
+        myskoda = MySkoda(session, mqtt_enabled=False)
+        current = _charging(timedelta(seconds=10), "2025-01-01T00:00:00+00:00")
+        _vehicle_with_charging(myskoda, current)
+        myskoda.get_charging = AsyncMock()
+
+        read = await myskoda.read_section("vin", VehicleSection.CHARGING, timedelta(minutes=1))
+
+        assert read.value is current
+        assert read.age is not None
+        assert read.age < timedelta(minutes=1)
+        assert not read.revalidating
+        myskoda.get_charging.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_read_section_revalidates_stale_data_in_background() -> None:
+    async with ClientSession() as session:
+        myskoda = MySkoda(session, mqtt_enabled=False)
+        stale = _charging(timedelta(minutes=5), "2025-01-01T00:00:00+00:00")
+        fresh = _charging(timedelta(0), "2025-01-01T00:05:00+00:00")
+        vehicle = _vehicle_with_charging(myskoda, stale)
+        myskoda.get_charging = AsyncMock(return_value=fresh)
+        callback = AsyncMock()
+        myskoda.subscribe_updates("vin", callback)
+
+        read = await myskoda.read_section("vin", VehicleSection.CHARGING, timedelta(minutes=1))
+        again = await myskoda.read_section("vin", VehicleSection.CHARGING, timedelta(minutes=1))
+
+        assert read.value is stale
+        assert read.revalidating
+        assert again.revalidating
+        await asyncio.sleep(0.01)
+        myskoda.get_charging.assert_awaited_once_with("vin")
+        assert vehicle.charging is fresh
+        callback.assert_awaited_once_with("vin")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("missing", [True, False])
+async def test_read_section_blocks_on_missing_or_expired_data(missing: bool) -> None:
+    async with ClientSession() as session:
+        myskoda = MySkoda(session, mqtt_enabled=False)
+        expired = _charging(timedelta(hours=2), "2025-01-01T00:00:00+00:00")
+        fresh = _charging(timedelta(0), "2025-01-01T02:00:00+00:00")
+        _vehicle_with_charging(myskoda, None if missing else expired)
+        myskoda.get_charging = AsyncMock(return_value=fresh)
+
+        read = await myskoda.read_section(
+            "vin", VehicleSection.CHARGING, timedelta(minutes=1), hard_ttl=timedelta(hours=1)
+        )
+
+        assert read.value is fresh
+        assert not read.revalidating
+        assert read.age is not None
+        assert read.age < timedelta(minutes=1)
+
+
+@pytest.mark.asyncio
+async def test_mqtt_events_are_dispatched_by_event_class() -> None:
+    def _service_event(event_class: type[ServiceEvent], name: ServiceEventName) -> ServiceEvent:
+        return event_class(
+            vin="vin",
+            version=1,
+            trace_id="trace",
+            producer="SKODA_MHUB",
+            name=name,
+            data=ServiceEventData(user_id="user", vin="vin"),
+        )
+
+    async with ClientSession() as session:
+        myskoda = MySkoda(session, mqtt_enabled=False)
+        _vehicle_with_charging(myskoda, None).driving_range = None
+        myskoda.schedule_refresh = AsyncMock()
+
+        on_event = myskoda._on_mqtt_event  # noqa: SLF001
+        await on_event(
+            _service_event(
+                ServiceEventChargingStatusChanged, ServiceEventName.CHARGING_STATUS_CHANGED
+            )
+        )
+        await on_event(_service_event(ServiceEventChangeAccess, ServiceEventName.CHANGE_ACCESS))
+        await on_event(_service_event(ServiceEventChangeOdometer, ServiceEventName.CHANGE_ODOMETER))
+        # No refresh for lights.
+        await on_event(_service_event(ServiceEventChangeLights, ServiceEventName.CHANGE_LIGHTS))
+        await on_event(_service_event(ServiceEventChangeSoc, ServiceEventName.CHANGE_SOC))
+
+    assert [call.args for call in myskoda.schedule_refresh.await_args_list] == [
+        ("vin", VehicleSection.CHARGING),
+        ("vin",),
+        ("vin", VehicleSection.MAINTENANCE),
+        # Charging events refresh both sections in one plan before applying the event.
+        ("vin", VehicleSection.CHARGING, VehicleSection.DRIVING_RANGE),
+    ]
+    # Charging events are not coalesced unless asked for.
+    assert myskoda.event_coalescer_stats is None
+
+
+@pytest.mark.asyncio
+async def test_charging_event_bursts_are_coalesced() -> None:
+    def _soc_event(soc: int) -> ServiceEventChangeSoc:
+        return ServiceEventChangeSoc(
+            vin="vin",
+            version=1,
+            trace_id="trace",
+            producer="SKODA_MHUB",
+            name=ServiceEventName.CHANGE_SOC,
+            data=ServiceEventChangeSocData(user_id="user", vin="vin", soc=soc),
+        )
+
+    async with ClientSession() as session:
+        myskoda = MySkoda(session, mqtt_enabled=False, service_event_window=0.01)
+        _vehicle_with_charging(myskoda, None)
+        applied = asyncio.Event()
+        socs: list[int | None] = []
+
+        async def process(event: ServiceEventChangeSoc) -> None:
+            socs.append(event.data.soc)
+            applied.set()
+
+        myskoda._event_handlers[ServiceEventChangeSoc] = process  # noqa: SLF001
+
+        for soc in (50, 51, 52):
+            await myskoda._on_mqtt_event(_soc_event(soc))  # noqa: SLF001
+        async with asyncio.timeout(1):
+            await applied.wait()
+        await myskoda.disconnect()
+
+    assert socs == [52]
+    assert myskoda.event_coalescer_stats is not None
+    assert myskoda.event_coalescer_stats.folded == 2  # noqa: PLR2004
@@ -0,0 +1,90 @@
+"""Unit tests for myskoda.operation_tracker."""
+
+import asyncio
+
+import pytest
+
+from myskoda.models.event import OperationEvent, OperationName, OperationStatus
+from myskoda.operation_tracker import OperationFailedError, OperationTracker
+
+
+def _event(
+    vin: str,
+    trace_id: str,
+    status: OperationStatus = OperationStatus.COMPLETED_SUCCESS,
+    operation: OperationName = OperationName.START_CHARGING,
+) -> OperationEvent:
+    return OperationEvent(
+        vin=vin,
+        version=1,
+        trace_id=trace_id,
+        request_id="72f24950-b3db-4b7e-948f-7032f533773a",
+        operation=operation,
+        status=status,
+    )
+
+
+@pytest.mark.asyncio
+async def test_operations_on_different_vehicles_are_kept_apart() -> None:
+    tracker = OperationTracker()
+    first = tracker.wait(OperationName.START_CHARGING, "VIN1")
+    second = tracker.wait(OperationName.START_CHARGING, "VIN2")
+
+    tracker.handle(_event("VIN2", "trace2"))
+
+    assert not first.done()
+    assert (await second).vin == "VIN2"
+    assert [pending.vin for pending in tracker.pending()] == ["VIN1"]
+
+
+@pytest.mark.asyncio
+async def test_operations_are_matched_by_trace_id() -> None:
+    tracker = OperationTracker()
+    first = tracker.wait(OperationName.START_CHARGING, "VIN")
+    second = tracker.wait(OperationName.START_CHARGING, "VIN")
+    tracker.handle(_event("VIN", "trace1", OperationStatus.IN_PROGRESS))
+    tracker.handle(_event("VIN", "trace2", OperationStatus.IN_PROGRESS))
+    assert [pending.trace_id for pending in tracker.pending("VIN")] == ["trace1", "trace2"]
+
+    tracker.handle(_event("VIN", "trace2", OperationStatus.ERROR))
+
+    assert not first.done()
+    with pytest.raises(OperationFailedError):
+        await second
+    tracker.handle(_event("VIN", "trace1"))
+    assert (await first).trace_id == "trace1"
+    assert tracker.pending() == []
+    assert tracker.stats.resolved == 1
+    assert tracker.stats.failed == 1
+
+
+@pytest.mark.asyncio
+async def test_waiting_for_any_vehicle_matches_last() -> None:
+    tracker = OperationTracker()
+    any_vehicle = tracker.wait(OperationName.LOCK)
+    vehicle = tracker.wait(OperationName.LOCK, "VIN")
+
+    tracker.handle(_event("VIN", "trace1", operation=OperationName.LOCK))
+    tracker.handle(_event("OTHER", "trace2", operation=OperationName.LOCK))
+    tracker.handle(_event("OTHER", "trace3", operation=OperationName.LOCK))
+
+    assert (await vehicle).vin == "VIN"
+    assert (await any_vehicle).vin == "OTHER"
+    assert tracker.stats.unmatched == 1
+
+
+@pytest.mark.asyncio
+async def test_timed_out_and_cancelled_operations_are_forgotten() -> None:
+    tracker = OperationTracker()
+    expiring = tracker.wait(OperationName.START_CHARGING, "VIN", timeout=0.01)
+    cancelled = tracker.wait(OperationName.STOP_CHARGING, "VIN")
+    cancelled.cancel()
+
+    with pytest.raises(TimeoutError):
+        await expiring
+    await asyncio.sleep(0)
+
+    assert tracker.pending() == []
+    assert tracker.stats.expired == 1
+    tracker.handle(_event("VIN", "trace"))
+    assert tracker.stats.unmatched == 1
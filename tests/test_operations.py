@@ -1,8 +1,10 @@
 """Basic unit tests for operations."""
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from aiohttp import ClientResponseError
 from aioresponses import aioresponses
 
 from myskoda.anonymize import ACCESS_TOKEN, LOCATION, USER_ID, VIN
@@ -317,6 +319,21 @@ async def test_start_charging(
     )
 
 
+@pytest.mark.asyncio
+async def test_failed_request_stops_waiting_for_the_operation(
+    responses: aioresponses, myskoda: MySkoda
+) -> None:
+    responses.post(url=f"{BASE_URL_SKODA}/api/v1/charging/{VIN}/start", status=500)
+
+    with pytest.raises(ClientResponseError):
+        await myskoda.start_charging(VIN)
+    # Let the cancelled wait run its done callbacks.
+    await asyncio.sleep(0)
+
+    assert myskoda.mqtt is not None
+    assert myskoda.mqtt.operations.pending() == []
+
+
 @pytest.mark.asyncio
 async def test_stop_charging(
     responses: aioresponses, myskoda: MySkoda, fake_mqtt_client_wrapper: FakeMqttClientWrapper
@@ -0,0 +1,145 @@
+"""Unit tests for myskoda.planner."""
+
+import asyncio
+
+import pytest
+
+from myskoda.models.event import BaseEvent
+from myskoda.planner import EventCoalescer, RefreshPlanner
+from myskoda.vehicle import VehicleSection
+
+
+class RecordingExecutor:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, frozenset[VehicleSection] | None]] = []
+
+    async def __call__(self, vin: str, sections: frozenset[VehicleSection] | None) -> None:
+        self.calls.append((vin, sections))
+
+
+@pytest.mark.asyncio
+async def test_first_request_runs_immediately_and_later_ones_are_merged() -> None:
+    executor = RecordingExecutor()
+    planner = RefreshPlanner(executor, wait=0.05)
+
+    await planner.request("vin", VehicleSection.CHARGING)
+    assert executor.calls == [("vin", frozenset({VehicleSection.CHARGING}))]
+
+    await planner.request("vin", VehicleSection.CHARGING)
+    await planner.request("vin", VehicleSection.STATUS)
+    assert planner.pending("vin") == {VehicleSection.CHARGING, VehicleSection.STATUS}
+    await asyncio.sleep(0.1)
+
+    assert executor.calls[1] == ("vin", frozenset({VehicleSection.CHARGING, VehicleSection.STATUS}))
+    assert planner.stats.executions == 2  # noqa: PLR2004
+    assert planner.stats.merged == 1
+
+
+@pytest.mark.asyncio
+async def test_full_refresh_absorbs_section_refreshes() -> None:
+    executor = RecordingExecutor()
+    planner = RefreshPlanner(executor, wait=0.05)
+
+    await planner.request("vin")
+    await planner.request("vin", VehicleSection.CHARGING)
+    await planner.request("vin")
+    await planner.request("vin", VehicleSection.STATUS)
+    await asyncio.sleep(0.1)
+
+    assert executor.calls == [("vin", None), ("vin", None)]
+    assert planner.stats.absorbed == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_vehicles_are_planned_independently() -> None:
+    executor = RecordingExecutor()
+    planner = RefreshPlanner(executor, wait=0.05)
+
+    await planner.request("vin_a", VehicleSection.CHARGING)
+    await planner.request("vin_b", VehicleSection.CHARGING)
+
+    assert [vin for vin, _ in executor.calls] == ["vin_a", "vin_b"]
+
+
+@pytest.mark.asyncio
+async def test_steady_requests_do_not_postpone_beyond_max_wait() -> None:
+    executor = RecordingExecutor()
+    planner = RefreshPlanner(executor, wait=0.05, max_wait=0.12)
+
+    await planner.request("vin", VehicleSection.CHARGING)
+    for _ in range(8):
+        await asyncio.sleep(0.03)
+        await planner.request("vin", VehicleSection.CHARGING)
+
+    # Without max_wait the planned refresh would have been postponed by every request.
+    assert len(executor.calls) >= 2  # noqa: PLR2004
+    planner.cancel()
+
+
+@pytest.mark.asyncio
+async def test_sections_requested_together_are_refreshed_together() -> None:
+    executor = RecordingExecutor()
+    planner = RefreshPlanner(executor, wait=0.05)
+
+    await planner.request("vin", VehicleSection.CHARGING, VehicleSection.DRIVING_RANGE)
+
+    assert executor.calls == [
+        ("vin", frozenset({VehicleSection.CHARGING, VehicleSection.DRIVING_RANGE}))
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cancel_stops_running_refreshes_and_forgets_vehicles() -> None:
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def execute(_vin: str, sections: frozenset[VehicleSection] | None) -> None:
+        if sections is None:
+            return
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    planner = RefreshPlanner(execute, wait=0.01)
+    await planner.request("vin")
+    await planner.request("vin", VehicleSection.CHARGING)
+    async with asyncio.timeout(1):
+        await started.wait()
+
+    planner.cancel()
+
+    async with asyncio.timeout(1):
+        await cancelled.wait()
+    assert planner._plans == {}  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_idle_vehicles_are_forgotten() -> None:
+    executor = RecordingExecutor()
+    planner = RefreshPlanner(executor, wait=0.01)
+
+    await planner.request("vin_a")
+    await asyncio.sleep(0.02)
+    await planner.request("vin_b")
+
+    assert set(planner._plans) == {"vin_b"}  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_coalescer_keeps_latest_event_per_vehicle_and_class() -> None:
+    applied: list[tuple[str, str]] = []
+
+    async def apply(event: BaseEvent) -> None:
+        applied.append((event.vin, event.trace_id))
+
+    coalescer = EventCoalescer(apply, window=0.01)
+    for vin, trace_id in (("VIN1", "a"), ("VIN2", "b"), ("VIN1", "c"), ("VIN1", "d")):
+        coalescer.submit(BaseEvent(vin=vin, version=1, trace_id=trace_id))
+    await asyncio.sleep(0.05)
+
+    assert sorted(applied) == [("VIN1", "d"), ("VIN2", "b")]
+    assert coalescer.stats.folded == 2  # noqa: PLR2004
+    assert coalescer.stats.applied == 2  # noqa: PLR2004
@@ -0,0 +1,115 @@
+"""Unit tests for myskoda.rate_limit."""
+
+from datetime import UTC, datetime
+
+import pytest
+from aiohttp import ClientResponseError
+from aioresponses import aioresponses
+
+from myskoda.const import BASE_URL_CHARGING, BASE_URL_SKODA
+from myskoda.rate_limit import (
+    EndpointClass,
+    RateLimit,
+    RateLimiter,
+    parse_retry_after,
+    vin_from_url,
+)
+from myskoda.rest_api import RestApi
+
+VIN = "TMBJM0CKV1N12345"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_requests_queue_on_the_vin_bucket() -> None:
+    limiter = RateLimiter(global_limit=None, account_limit=None, vin_limit=RateLimit(50, 1))
+
+    for _ in range(3):
+        await limiter.acquire("account", VIN)
+    await limiter.acquire("account", "TMBJM0CKV1N54321")
+
+    assert limiter.stats.requests == 4  # noqa: PLR2004
+    assert limiter.stats.throttled == 2  # noqa: PLR2004
+    assert limiter.stats.wait_time >= limiter.stats.max_wait > 0
+
+
+@pytest.mark.asyncio
+async def test_write_requests_take_tokens_of_their_class() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(
+        global_limit=None,
+        vin_limit=None,
+        account_limit=RateLimit(1, 5),
+        class_limits={EndpointClass.WRITE: RateLimit(1, 1)},
+        clock=clock,
+    )
+
+    await limiter.acquire("account", endpoint_class=EndpointClass.WRITE)
+    await limiter.acquire("account", cost=2)
+
+    buckets = limiter._buckets  # noqa: SLF001
+    assert buckets["class", "account", EndpointClass.WRITE].delay() == 1
+    assert buckets["account", "account"].delay(3) == 1
+    assert limiter.stats.throttled == 0
+
+
+@pytest.mark.asyncio
+async def test_retry_after_pauses_the_account(responses: aioresponses, api: RestApi) -> None:
+    clock = FakeClock()
+    api.rate_limiter = RateLimiter(clock=clock)
+    responses.get(
+        url=f"{BASE_URL_SKODA}/api/v2/vehicle-status/{VIN}",
+        status=429,
+        headers={"Retry-After": "30"},
+    )
+
+    with pytest.raises(ClientResponseError):
+        await api.get_status(VIN)
+
+    assert api.rate_limiter_stats is not None
+    assert api.rate_limiter_stats.requests == 1
+    assert api.rate_limiter_stats.retry_after == 1
+    bucket = api.rate_limiter._buckets["account", api.authorization]  # noqa: SLF001
+    assert bucket.delay() == 30  # noqa: PLR2004
+    clock.now = 30
+    assert bucket.delay() == 0
+
+
+@pytest.mark.asyncio
+async def test_charging_statistics_are_throttled_as_reads(
+    responses: aioresponses, api: RestApi
+) -> None:
+    api.rate_limiter = RateLimiter(
+        global_limit=None,
+        account_limit=None,
+        vin_limit=None,
+        class_limits={
+            EndpointClass.READ: RateLimit(1, 1),
+            EndpointClass.WRITE: RateLimit(1, 1),
+        },
+        clock=FakeClock(),
+    )
+    responses.post(url=f"{BASE_URL_CHARGING}/charging_statistics", body="{}")
+
+    # The statistics are queried with a POST, which doesn't change anything.
+    await api.get_charging_statistics(VIN, datetime.now(UTC), datetime.now(UTC))
+
+    buckets = api.rate_limiter._buckets  # noqa: SLF001
+    assert set(buckets) == {("class", api.authorization, EndpointClass.READ)}
+
+
+def test_parse_retry_after_and_vin_from_url() -> None:
+    now = datetime(2025, 1, 1, tzinfo=UTC)
+    assert parse_retry_after("120") == 120  # noqa: PLR2004
+    assert parse_retry_after("Wed, 01 Jan 2025 00:01:00 GMT", now) == 60  # noqa: PLR2004
+    assert parse_retry_after("soon") is None
+    assert vin_from_url(f"/v2/vehicle-status/{VIN}/driving-range") == VIN
+    assert vin_from_url(f"/v1/maps/positions?vin={VIN}") == VIN
+    assert vin_from_url("/v1/users") is None
@@ -1,16 +1,20 @@
 """Unit tests for myskoda.rest_api."""
 
+import asyncio
 import json
 import re
 from datetime import UTC, date, datetime
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
+import orjson
 import pytest
-from aiohttp import ClientResponseError
+from aiohttp import ClientResponseError, ClientSession
 from aioresponses import aioresponses
+from yarl import URL
 
-from myskoda.anonymize import FORMATTED_ADDRESS, LICENSE_PLATE, LOCATION, VEHICLE_NAME
+from myskoda.anonymize import FORMATTED_ADDRESS, LICENSE_PLATE, LOCATION, VEHICLE_NAME, VIN
+from myskoda.caching import ResponseCache, cache_max_age
 from myskoda.models.common import OpenState
 from myskoda.models.departure import DepartureInfo
 from myskoda.models.driving_score import DrivingScoreResult
@@ -21,8 +25,8 @@ from myskoda.models.widget import (
     ParkingPositionParked,
     ParkingPositionState,
 )
-from myskoda.myskoda import MySkoda
-from myskoda.rest_api import OffsetType, RestApi
+from myskoda.myskoda import MySkoda, MySkodaAuthorization
+from myskoda.rest_api import GetEndpointResult, OffsetType, RestApi
 from myskoda.utils import to_iso8601
 
 FIXTURES_DIR = Path(__file__).parent.joinpath("fixtures")
@@ -970,3 +974,195 @@ async def test_register_fcm_token_sends_expected_request(
         "appVersion": "8.12.0",
         "language": "en",
     }
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_gets_share_one_request(
+    api: RestApi, responses: aioresponses
+) -> None:
+    """Concurrent identical GETs are answered by a single upstream request."""
+    responses.get(url=f"{BASE_URL}/v1/some/path", body='{"a": 1}')
+
+    results = await asyncio.gather(
+        api.raw_request(url="/v1/some/path", method="GET"),
+        api.raw_request(url="/v1/some/path", method="GET"),
+    )
+
+    assert results == ['{"a": 1}', '{"a": 1}']
+    [calls] = responses.requests.values()
+    assert len(calls) == 1
+    assert api.single_flight_stats.misses == 1
+    assert api.single_flight_stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_gets_sent_before_an_invalidation_are_not_shared(api: RestApi) -> None:
+    """A request made after the vehicle changed doesn't join one sent before the change."""
+    url = f"/v1/charging/{VIN}"
+    release_old = asyncio.Event()
+    bodies = iter([b"old", b"new"])
+
+    async def send(*_args: object) -> bytes:
+        body = next(bodies)
+        if body == b"old":
+            await release_old.wait()
+        return body
+
+    with patch.object(api, "_send_idempotent", AsyncMock(side_effect=send)) as upstream:
+        before = asyncio.create_task(api._get(url))  # noqa: SLF001
+        await asyncio.sleep(0)
+        api.invalidate_cache(VIN)
+        async with asyncio.timeout(1):
+            after = await api._get(url)  # noqa: SLF001
+        release_old.set()
+
+        assert after == (b"new", None)
+        assert await before == (b"old", None)
+        assert upstream.await_count == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_response_cache_skips_responses_invalidated_in_flight(api: RestApi) -> None:
+    """A response sent before the vehicle changed is not cached after the change."""
+    api.cache = ResponseCache()
+    url = f"/v1/charging/{VIN}"
+    release = asyncio.Event()
+
+    async def send(*_args: object) -> bytes:
+        await release.wait()
+        return b"old"
+
+    with patch.object(api, "_send_idempotent", AsyncMock(side_effect=send)):
+        in_flight = asyncio.create_task(api._get(url))  # noqa: SLF001
+        await asyncio.sleep(0)
+        api.invalidate_cache(VIN)
+        release.set()
+        assert await in_flight == (b"old", None)
+
+    assert api.cache.get(url) is None
+
+
+@pytest.mark.asyncio
+async def test_sequential_gets_and_posts_are_not_shared(
+    api: RestApi, responses: aioresponses
+) -> None:
+    """Only GETs which overlap in time are shared, writes are always sent."""
+    responses.get(url=f"{BASE_URL}/v1/some/path", body="1")
+    responses.get(url=f"{BASE_URL}/v1/some/path", body="2")
+    responses.post(url=f"{BASE_URL}/v1/some/path", repeat=True)
+
+    assert await api.raw_request(url="/v1/some/path", method="GET") == "1"
+    assert await api.raw_request(url="/v1/some/path", method="GET") == "2"
+    await asyncio.gather(
+        api.raw_request(url="/v1/some/path", method="POST"),
+        api.raw_request(url="/v1/some/path", method="POST"),
+    )
+
+    assert sum(len(calls) for calls in responses.requests.values()) == 4  # noqa: PLR2004
+    assert api.single_flight_stats.hits == 0
+
+
+@pytest.mark.asyncio
+async def test_response_cache_serves_repeated_gets(responses: aioresponses) -> None:
+    """Cached GETs are not sent again until a write to the vehicle invalidates them."""
+    async with ClientSession() as session:
+        api = RestApi(session, MySkodaAuthorization(session), ResponseCache())
+        api.authorization.get_access_token = AsyncMock()
+        charging = (FIXTURES_DIR / "superb" / "charging-iV.json").read_text()
+        responses.get(url=f"{BASE_URL}/v1/charging/{VIN}", body=charging, repeat=True)
+        responses.post(url=f"{BASE_URL}/v1/charging/{VIN}/start")
+
+        await api.get_charging(VIN)
+        await api.get_charging(VIN)
+        with cache_max_age(0):
+            await api.get_charging(VIN)
+        await api.start_charging(VIN)
+        await api.get_charging(VIN)
+
+        gets = responses.requests[("GET", URL(f"{BASE_URL}/v1/charging/{VIN}"))]
+        assert len(gets) == 3  # noqa: PLR2004
+        assert api.cache_stats is not None
+        assert api.cache_stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_response_keeps_the_time_it_was_fetched(responses: aioresponses) -> None:
+    """A model built from a cached response has the timestamp of the original request."""
+    async with ClientSession() as session:
+        api = RestApi(session, MySkodaAuthorization(session), ResponseCache())
+        api.authorization.get_access_token = AsyncMock()
+        charging = (FIXTURES_DIR / "superb" / "charging-iV.json").read_text()
+        responses.get(url=f"{BASE_URL}/v1/charging/{VIN}", body=charging)
+
+        fetched = await api.get_charging(VIN)
+        await asyncio.sleep(0.01)
+        requested_again = datetime.now(UTC)
+        cached = await api.get_charging(VIN)
+
+        assert api.cache_stats is not None
+        assert api.cache_stats.hits == 1
+        assert fetched.result.timestamp < requested_again
+        assert cached.result.timestamp < requested_again
+
+
+@pytest.mark.asyncio
+async def test_response_cache_ignores_the_device_time(responses: aioresponses) -> None:
+    """Departure timers are cached although every request carries the current time."""
+    async with ClientSession() as session:
+        api = RestApi(session, MySkodaAuthorization(session), ResponseCache())
+        api.authorization.get_access_token = AsyncMock()
+        timers = (FIXTURES_DIR / "other" / "departure-timers.json").read_text()
+        url = f"{BASE_URL}/v1/vehicle-automatization/{VIN}/departure/timers"
+        responses.get(url=re.compile(rf"{url}\?deviceDateTime=.*"), body=timers, repeat=True)
+
+        await api.get_departure_timers(VIN)
+        await api.get_departure_timers(VIN)
+
+        assert sum(len(calls) for calls in responses.requests.values()) == 1
+        assert api.cache_stats is not None
+        assert api.cache_stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_endpoint_result_keeps_the_response_bytes(
+    api: RestApi, responses: aioresponses
+) -> None:
+    """The model is built from the response bytes, which are only decoded when raw is read."""
+    charging = (FIXTURES_DIR / "superb" / "charging-iV.json").read_bytes()
+    responses.get(url=f"{BASE_URL}/v1/charging/{VIN}", body=charging)
+
+    result = await api.get_charging(VIN)
+
+    assert result.payload == charging
+    assert "raw" not in vars(result)
+    assert json.loads(result.raw) == json.loads(charging)
+    assert result.result.status is not None
+
+
+@pytest.mark.asyncio
+async def test_anonymized_result_is_built_from_the_anonymized_data(
+    api: RestApi, responses: aioresponses
+) -> None:
+    """Anonymized data is passed on as parsed and only serialized again when raw is read."""
+    info = (FIXTURES_DIR / "superb" / "garage_vehicles_LK_liftback.json").read_text()
+    responses.get(url=re.compile(rf"{BASE_URL}/v2/garage/vehicles/{VIN}\?.*"), body=info)
+
+    with patch("myskoda.rest_api.orjson.loads", wraps=orjson.loads) as loads:
+        result = await api.get_info(VIN, anonymize=True)
+    assert loads.call_count == 1
+
+    assert isinstance(result.payload, dict)
+    assert "raw" not in vars(result)
+    assert result.result.name == VEHICLE_NAME
+    assert json.loads(result.raw) == result.payload
+    assert json.loads(result.raw)["name"] == VEHICLE_NAME
+
+
+def test_endpoint_result_accepts_the_response_text() -> None:
+    """Results can still be built from the response text, as before the payload was kept."""
+    url = f"{BASE_URL}/v1/charging/{VIN}"
+
+    result = GetEndpointResult(url=url, raw='{"a": 1}', result=None)
+
+    assert result.raw == '{"a": 1}'
+    assert result == GetEndpointResult(url, '{"a": 1}', None)
@@ -0,0 +1,137 @@
+"""Unit tests for myskoda.retry."""
+
+import logging
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+from aiohttp import ClientResponseError
+from aioresponses import aioresponses
+from yarl import URL
+
+from myskoda.const import BASE_URL_SKODA
+from myskoda.rest_api import RestApi
+from myskoda.retry import CircuitOpenError, CircuitState, RetryHandler, RetryPolicy
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+VIN = "TMBJM0CKV1N12345"
+STATUS_URL = f"{BASE_URL_SKODA}/api/v2/vehicle-status/{VIN}"
+FAST = RetryPolicy(base_delay=0.001, max_delay=0.001)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _timeout() -> None:
+    raise TimeoutError
+
+
+async def _value(value: str) -> str:
+    return value
+
+
+@pytest.mark.asyncio
+async def test_transient_failures_are_retried(responses: aioresponses, api: RestApi) -> None:
+    api.retry_handler = RetryHandler(FAST)
+    status = (FIXTURES_DIR / "superb" / "vehicle-status-doors-closed.json").read_text()
+    responses.get(url=STATUS_URL, status=503)
+    responses.get(url=STATUS_URL, status=502)
+    responses.get(url=STATUS_URL, body=status)
+
+    result = await api.get_status(VIN)
+
+    assert result.result.overall is not None
+    assert api.retry_stats is not None
+    assert api.retry_stats.retries == 2  # noqa: PLR2004
+    assert api.retry_stats.recovered == 1
+    assert api.retry_handler.open_circuits == []
+
+
+@pytest.mark.asyncio
+async def test_retries_use_a_refreshed_token(
+    responses: aioresponses, api: RestApi, caplog: pytest.LogCaptureFixture
+) -> None:
+    api.retry_handler = RetryHandler(FAST)
+    status = (FIXTURES_DIR / "superb" / "vehicle-status-doors-closed.json").read_text()
+    tokens = ["expired"]
+    api.authorization.get_access_token = AsyncMock(side_effect=lambda: tokens[-1])
+
+    def refresh_token(*_args: object, **_kwargs: object) -> None:
+        tokens.append("refreshed")
+
+    responses.get(url=STATUS_URL, status=503, callback=refresh_token)
+    responses.get(url=STATUS_URL, body=status)
+
+    with caplog.at_level(logging.DEBUG):
+        await api.get_status(VIN)
+
+    sent = [call.kwargs["headers"] for call in responses.requests[("GET", URL(STATUS_URL))]]
+    assert sent == [{"authorization": "Bearer expired"}, {"authorization": "Bearer refreshed"}]
+    # The failed attempt is only logged by the retry handler, at debug level.
+    assert [r.levelno for r in caplog.records if r.name.startswith("myskoda")] == [logging.DEBUG]
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried(responses: aioresponses, api: RestApi) -> None:
+    api.retry_handler = RetryHandler(FAST, failure_threshold=1)
+    responses.get(url=STATUS_URL, status=404, repeat=True)
+
+    for _ in range(2):
+        with pytest.raises(ClientResponseError):
+            await api.get_status(VIN)
+
+    assert api.retry_handler.stats.retries == 0
+    assert api.retry_handler.open_circuits == []
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_and_is_probed_half_open() -> None:
+    clock = FakeClock()
+    handler = RetryHandler(
+        RetryPolicy(attempts=1), failure_threshold=2, reset_timeout=60, clock=clock
+    )
+    key = ("status", VIN)
+
+    for _ in range(2):
+        with pytest.raises(TimeoutError):
+            await handler.run(key, _timeout)
+    with pytest.raises(CircuitOpenError):
+        await handler.run(key, _timeout)
+    assert handler.open_circuits == [key]
+    assert handler.stats.short_circuited == 1
+
+    # The failed probe opens the circuit again at once.
+    clock.now = 60
+    with pytest.raises(TimeoutError):
+        await handler.run(key, _timeout)
+    assert handler.breaker(key).state == CircuitState.OPEN
+    assert handler.stats.opened == 2  # noqa: PLR2004
+
+    clock.now = 120
+    assert await handler.run(key, lambda: _value("ok")) == "ok"
+    assert handler.open_circuits == []
+
+
+@pytest.mark.asyncio
+async def test_no_retry_after_the_deadline() -> None:
+    clock = FakeClock()
+    handler = RetryHandler(RetryPolicy(base_delay=1, max_delay=1, deadline=0.5), clock=clock)
+
+    with pytest.raises(TimeoutError):
+        await handler.run("key", _timeout)
+
+    assert handler.stats.retries == 0
+    assert handler.stats.exhausted == 1
+
+
+def test_next_delay_is_jittered_within_bounds() -> None:
+    policy = RetryPolicy(base_delay=1, max_delay=5)
+    delay = 0.0
+    for _ in range(20):
+        previous, delay = delay, policy.next_delay(delay)
+        assert 1 <= delay <= min(5, 3 * max(previous, 1))
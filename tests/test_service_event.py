@@ -4,6 +4,7 @@ This module partially repeats test_mqtt.py tests but is more isolated:
 here we have unit tests for service_event module only.
 """
 
+import json
 from pathlib import Path
 
 import pytest
@@ -11,7 +12,10 @@ import pytest
 from myskoda.models.charging import ChargeMode, ChargingState
 from myskoda.models.event import (
     BaseEvent,
+    OperationEvent,
     ServiceEvent,
+    ServiceEventChangeLights,
+    ServiceEventChangeOdometer,
     ServiceEventChangeSoc,
     ServiceEventChangeSocData,
     ServiceEventChargingError,
@@ -19,6 +23,8 @@ from myskoda.models.event import (
     ServiceEventDepartureErrorPlug,
     ServiceEventError,
     ServiceEventErrorData,
+    VehicleEventIgnitionStatusChanged,
+    event_from_mqtt_message,
 )
 
 FIXTURES_DIR = Path(__file__).parent.joinpath("fixtures")
@@ -92,3 +98,51 @@ def test_parse_service_events(service_events: list[str]) -> None:
                 user_id=f"ad0d7945-4814-43d0-801f-{event.name.value}",
                 vin="TMBAXXXXXXXXXXXXX",
             )
+
+
+def test_dispatch_matches_generic_path(service_events: list[tuple[str, str]]) -> None:
+    for topic, payload in service_events:
+        event = event_from_mqtt_message(topic, payload.encode())
+
+        assert event == BaseEvent.from_mqtt_message(topic=topic, payload=payload)
+        assert type(event) is not ServiceEvent
+
+
+@pytest.mark.parametrize(
+    ("event_topic", "payload", "expected"),
+    [
+        (
+            "operation-request/charging/start-stop-charging",
+            {"operation": "start-charging", "status": "IN_PROGRESS", "requestId": "1"},
+            OperationEvent,
+        ),
+        (
+            "vehicle-event/vehicle-ignition-status",
+            {"name": "vehicle-ignition-status-changed", "data": {"ignitionStatus": "ON"}},
+            VehicleEventIgnitionStatusChanged,
+        ),
+        (
+            "service-event/vehicle-status/lights",
+            {"name": "change-lights", "data": {}},
+            ServiceEventChangeLights,
+        ),
+        # Not in the topic table, parsed by the generic path.
+        (
+            "service-event/vehicle-status/unknown",
+            {"name": "change-odometer", "data": {}},
+            ServiceEventChangeOdometer,
+        ),
+    ],
+)
+def test_dispatch_by_topic(event_topic: str, payload: dict, expected: type[BaseEvent]) -> None:
+    vin = "TMOCKAA0AA000000"
+    user_id = "b8bc126c-ee36-402b-8723-2c1c3dff8dec"
+    payload = {"version": 1, "traceId": "trace", "timestamp": "2025-05-11T07:35:18Z", **payload}
+    if "data" in payload:
+        payload = {**payload, "producer": "SKODA_MHUB"}
+        payload["data"] = {"userId": user_id, "vin": vin, **payload["data"]}
+
+    event = event_from_mqtt_message(f"{user_id}/{vin}/{event_topic}", json.dumps(payload).encode())
+
+    assert type(event) is expected
+    assert event.vin == vin
@@ -0,0 +1,219 @@
+"""Unit tests for myskoda.auth.token_store."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from json import dumps
+from pathlib import Path
+
+import aiohttp
+import jwt
+import pytest
+from aioresponses import aioresponses
+from yarl import URL
+
+from myskoda.auth.authorization import IDKSession
+from myskoda.auth.token_store import FileTokenStore, MemoryTokenStore
+from myskoda.const import BASE_URL_SKODA
+from myskoda.myskoda import MySkoda
+
+REFRESH_URL = f"{BASE_URL_SKODA}/api/v1/authentication/refresh-token?tokenType=CONNECT"
+
+
+def _token(expires_in: timedelta, subject: str | None = None) -> str:
+    exp = datetime.now(UTC) + expires_in
+    claims: dict[str, object] = {"exp": int(exp.timestamp())}
+    if subject is not None:
+        claims["sub"] = subject
+    return jwt.encode(claims, "secret", algorithm="HS256")
+
+
+def _session(access_expires_in: timedelta, refresh_expires_in: timedelta) -> IDKSession:
+    return IDKSession(
+        access_token=_token(access_expires_in),
+        refresh_token=_token(refresh_expires_in),
+        id_token=_token(access_expires_in),
+    )
+
+
+def _refresh_response(session: IDKSession) -> str:
+    return dumps(
+        {
+            "accessToken": session.access_token,
+            "refreshToken": session.refresh_token,
+            "idToken": session.id_token,
+        }
+    )
+
+
+class CountingTokenStore(MemoryTokenStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self.saves = 0
+
+    async def save(self, key: str, session: IDKSession) -> None:
+        self.saves += 1
+        await super().save(key, session)
+
+
+def _file_names(directory: Path) -> list[str]:
+    return sorted(path.name for path in directory.iterdir())
+
+
+@pytest.mark.asyncio
+async def test_file_store_round_trip(tmp_path: Path) -> None:
+    store = FileTokenStore(tmp_path / "tokens.json")
+    first = _session(timedelta(hours=1), timedelta(days=30))
+    second = _session(timedelta(hours=2), timedelta(days=30))
+
+    assert await store.load("first@example.com") is None
+    await store.save("first@example.com", first)
+    await store.save("second@example.com", second)
+
+    reopened = FileTokenStore(tmp_path / "tokens.json")
+    assert await reopened.load("first@example.com") == first
+    assert await reopened.load("second@example.com") == second
+
+    await reopened.clear("first@example.com")
+    assert await store.load("first@example.com") is None
+    assert await store.load("second@example.com") == second
+    # Only the store and its lock file remain, no temporary files.
+    assert _file_names(tmp_path) == ["tokens.json", "tokens.json.lock"]
+
+
+@pytest.mark.asyncio
+async def test_file_store_ignores_unreadable_file(tmp_path: Path) -> None:
+    path = tmp_path / "tokens.json"
+    path.write_text("{not json")
+    store = FileTokenStore(path)
+
+    assert await store.load("default") is None
+    session = _session(timedelta(hours=1), timedelta(days=30))
+    await store.save("default", session)
+    assert await store.load("default") == session
+
+
+@pytest.mark.asyncio
+async def test_connect_restores_stored_session(responses: aioresponses) -> None:
+    store = MemoryTokenStore()
+    stored = _session(timedelta(hours=1), timedelta(days=30))
+    await store.save("user@example.com", stored)
+
+    async with aiohttp.ClientSession() as session:
+        myskoda = MySkoda(session, mqtt_enabled=False, token_store=store)
+        await myskoda.connect("user@example.com", "password")
+        await myskoda.disconnect()
+
+    assert myskoda.authorization.idk_session == stored
+    # Neither the login nor the refresh endpoint was called.
+    assert responses.requests == {}
+
+
+@pytest.mark.asyncio
+async def test_connect_refreshes_expired_stored_session(responses: aioresponses) -> None:
+    store = MemoryTokenStore()
+    await store.save("default", _session(timedelta(minutes=-5), timedelta(days=30)))
+    renewed = _session(timedelta(hours=1), timedelta(days=30))
+    responses.post(url=REFRESH_URL, body=_refresh_response(renewed))
+
+    async with aiohttp.ClientSession() as session:
+        myskoda = MySkoda(session, mqtt_enabled=False, token_store=store)
+        await myskoda.connect()
+        await myskoda.disconnect()
+
+    assert myskoda.authorization.idk_session == renewed
+    assert await store.load("default") == renewed
+
+
+@pytest.mark.asyncio
+async def test_connect_without_usable_stored_session_requires_credentials() -> None:
+    store = MemoryTokenStore()
+    await store.save("default", _session(timedelta(minutes=-5), timedelta(minutes=-1)))
+
+    async with aiohttp.ClientSession() as session:
+        myskoda = MySkoda(session, mqtt_enabled=False, token_store=store)
+        with pytest.raises(TypeError):
+            await myskoda.connect()
+
+    assert await store.load("default") is None
+
+
+@pytest.mark.asyncio
+async def test_authorizing_saves_session(responses: aioresponses) -> None:
+    store = MemoryTokenStore()
+    issued = _session(timedelta(hours=1), timedelta(days=30))
+    responses.post(url=REFRESH_URL, body=_refresh_response(issued))
+
+    async with aiohttp.ClientSession() as session:
+        myskoda = MySkoda(session, mqtt_enabled=False, token_store=store)
+        await myskoda.connect(refresh_token=_token(timedelta(days=30)))
+        await myskoda.disconnect()
+
+    assert await store.load("default") == issued
+
+
+@pytest.mark.asyncio
+async def test_processes_sharing_a_file_store_refresh_once(
+    tmp_path: Path, responses: aioresponses
+) -> None:
+    path = tmp_path / "tokens.json"
+    await FileTokenStore(path).save("default", _session(timedelta(minutes=-5), timedelta(days=30)))
+    renewed = _session(timedelta(hours=1), timedelta(days=30))
+    responses.post(url=REFRESH_URL, body=_refresh_response(renewed))
+
+    async with aiohttp.ClientSession() as session:
+        # Separate store instances lock each other out like separate processes do.
+        clients = [
+            MySkoda(session, mqtt_enabled=False, token_store=FileTokenStore(path)) for _ in range(2)
+        ]
+        await asyncio.gather(*(client.connect() for client in clients))
+        for client in clients:
+            await client.disconnect()
+
+    assert [client.authorization.idk_session for client in clients] == [renewed, renewed]
+    assert len(responses.requests[("POST", URL(REFRESH_URL))]) == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_uses_session_refreshed_elsewhere(responses: aioresponses) -> None:
+    store = CountingTokenStore()
+    await store.save("default", _session(timedelta(hours=1), timedelta(days=30)))
+
+    async with aiohttp.ClientSession() as session:
+        myskoda = MySkoda(session, mqtt_enabled=False, token_store=store)
+        await myskoda.connect()
+        # The token is still valid, so waiting for the lock neither refreshes nor saves it.
+        await myskoda.authorization.refresh_token()
+        newer = _session(timedelta(hours=2), timedelta(days=30))
+        await store.save("default", newer)
+        await myskoda.authorization.refresh_token(force=True)
+        await myskoda.disconnect()
+
+    assert myskoda.authorization.idk_session == newer
+    assert store.saves == 2  # noqa: PLR2004
+    assert responses.requests == {}
+
+
+@pytest.mark.asyncio
+async def test_accounts_sharing_a_file_store_keep_their_own_sessions(
+    tmp_path: Path, responses: aioresponses
+) -> None:
+    store = FileTokenStore(tmp_path / "tokens.json")
+    other = _session(timedelta(hours=1), timedelta(days=30))
+    await store.save("default", other)
+    await store.save("other@example.com", other)
+    refresh_token = _token(timedelta(days=30), subject="account-id")
+    issued = _session(timedelta(hours=1), timedelta(days=30))
+    responses.post(url=REFRESH_URL, body=_refresh_response(issued))
+
+    async with aiohttp.ClientSession() as session:
+        for _ in range(2):
+            myskoda = MySkoda(session, mqtt_enabled=False, token_store=store)
+            await myskoda.connect(refresh_token=refresh_token)
+            await myskoda.disconnect()
+            # Logged in with the given token first, restored from the store the second time.
+            assert myskoda.authorization.idk_session == issued
+
+    assert len(responses.requests[("POST", URL(REFRESH_URL))]) == 1
+    assert await store.load("account-id") == issued
+    assert await store.load("default") == other
+    assert await store.load("other@example.com") == other
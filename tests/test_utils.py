@@ -1,11 +1,13 @@
 """Unit tests for utilities."""
 
 import asyncio
+import gc
+import weakref
 from datetime import UTC, datetime, timedelta, timezone
 
 import pytest
 
-from myskoda.utils import async_debounce, to_iso8601
+from myskoda.utils import async_debounce, debounce_stats, to_iso8601
 
 
 @pytest.mark.asyncio
@@ -83,6 +85,141 @@ async def test_async_debounce_immediate_noqueue() -> None:
     assert test_val == 1
 
 
+@pytest.mark.asyncio
+async def test_async_debounce_is_keyed_by_arguments() -> None:
+    """Calls with different arguments are debounced independently of each other."""
+    calls: list[str] = []
+
+    @async_debounce(wait=0.2, immediate=True)
+    async def refresh(vin: str, notify: bool = True) -> None:  # noqa: ARG001
+        calls.append(vin)
+
+    await refresh("vin_a")
+    await refresh("vin_b")
+    assert calls == ["vin_a", "vin_b"]
+
+    # notify does not take part in the key, so this is debounced with the first call.
+    await refresh("vin_a", notify=False)
+    await refresh("vin_b")
+    assert debounce_stats(refresh).pending == 2  # noqa: PLR2004
+    await asyncio.sleep(0.3)
+    assert sorted(calls) == ["vin_a", "vin_a", "vin_b", "vin_b"]
+
+
+@pytest.mark.asyncio
+async def test_async_debounce_is_keyed_by_instance() -> None:
+    """Methods are debounced per instance."""
+
+    class Refresher:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        @async_debounce(wait=0.2, immediate=True)
+        async def refresh(self) -> None:
+            self.calls += 1
+
+    first, second = Refresher(), Refresher()
+    await first.refresh()
+    await second.refresh()
+    assert (first.calls, second.calls) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_async_debounce_stats_and_eviction() -> None:
+    """Coalesced calls are counted and idle keys are evicted once max_keys is reached."""
+
+    @async_debounce(wait=0.1, max_keys=2)
+    async def refresh(vin: str) -> None:
+        pass
+
+    await refresh("vin_a")
+    await refresh("vin_a")
+    await refresh("vin_b")
+    # Executed, idle, but not yet forgotten.
+    await asyncio.sleep(0.15)
+    stats = debounce_stats(refresh)
+    assert (stats.calls, stats.executions, stats.coalesced) == (3, 2, 1)
+    assert stats.keys == 2  # noqa: PLR2004
+
+    await refresh("vin_c")
+    assert stats.evicted_keys == 2  # noqa: PLR2004
+    assert stats.keys == 1
+
+
+@pytest.mark.asyncio
+async def test_async_debounce_evicts_busy_keys_at_max_keys() -> None:
+    """The oldest key is evicted when all keys are busy, its pending call still runs."""
+    calls: list[str] = []
+
+    @async_debounce(wait=0.05, max_keys=2)
+    async def refresh(vin: str) -> None:
+        calls.append(vin)
+
+    for vin in ("vin_a", "vin_b", "vin_c"):
+        await refresh(vin)
+    stats = debounce_stats(refresh)
+    assert stats.keys == 2  # noqa: PLR2004
+    assert stats.evicted_keys == 1
+
+    await asyncio.sleep(0.1)
+    assert sorted(calls) == ["vin_a", "vin_b", "vin_c"]
+
+
+@pytest.mark.asyncio
+async def test_async_debounce_keys_unhashable_values_by_identity() -> None:
+    """Tuples containing unhashable values are keyed by identity instead of failing."""
+    calls: list[tuple[list[str], ...]] = []
+
+    @async_debounce(wait=0.05, immediate=True)
+    async def refresh(vins: tuple[list[str], ...]) -> None:
+        calls.append(vins)
+
+    vins = (["vin_a"],)
+    await refresh(vins)
+    await refresh((["vin_a"],))
+
+    assert calls == [vins, vins]
+
+
+@pytest.mark.asyncio
+async def test_async_debounce_forgets_idle_keys() -> None:
+    """Once its wait time has passed, a key no longer keeps its instance alive."""
+
+    class Refresher:
+        @async_debounce(wait=0.05, immediate=True)
+        async def refresh(self) -> None:
+            pass
+
+    refresher = Refresher()
+    await refresher.refresh()
+    await refresher.refresh()
+    instance = weakref.ref(refresher)
+    del refresher
+    await asyncio.sleep(0.2)
+    gc.collect()
+
+    assert instance() is None
+    assert debounce_stats(Refresher.refresh).keys == 0
+
+
+@pytest.mark.asyncio
+async def test_async_debounce_max_wait() -> None:
+    """A steady stream of calls can't postpone the delayed execution beyond max_wait."""
+    test_val = 0
+
+    @async_debounce(wait=0.05, max_wait=0.12)
+    async def increment() -> None:
+        nonlocal test_val
+        test_val += 1
+
+    for _ in range(8):
+        await increment()
+        await asyncio.sleep(0.03)
+
+    assert test_val >= 1
+    await asyncio.sleep(0.1)
+
+
 def test_to_is8601_utc_datetime() -> None:
     """Test the to_iso8601 function with UTC datetime input.
 